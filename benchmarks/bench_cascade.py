@@ -0,0 +1,54 @@
+# benchmarks/bench_cascade.py
+"""
+얼굴 검출 1장당 지연 시간 벤치마크
+- before: 호출마다 cv2.CascadeClassifier 생성 (XML 파싱 포함)
+- after : CascadeRegistry 에서 스레드별로 재사용
+
+실행 예:
+    python -m benchmarks.bench_cascade --image tests/images/image.png --repeat 50
+"""
+import argparse
+import time
+
+import cv2
+
+from src.features.modules.cascade_registry import FRONTAL_FACE, get_cascade, resolve_cascade_path
+
+
+def detect_before(gray):
+    detector = cv2.CascadeClassifier(resolve_cascade_path(FRONTAL_FACE))
+    return detector.detectMultiScale(gray, 1.1, 4)
+
+
+def detect_after(gray):
+    return get_cascade().detectMultiScale(gray, 1.1, 4)
+
+
+def measure(func, gray, repeat):
+    func(gray)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(gray)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='cascade registry micro-benchmark')
+    parser.add_argument('--image', default='tests/images/image.png')
+    parser.add_argument('--repeat', type=int, default=30)
+    args = parser.parse_args()
+
+    gray = cv2.imread(args.image, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        raise FileNotFoundError(f'이미지 없음: {args.image}')
+
+    before = measure(detect_before, gray, args.repeat)
+    after = measure(detect_after, gray, args.repeat)
+    print(f'image        : {args.image} {gray.shape[1]}x{gray.shape[0]}')
+    print(f'before (ms)  : {before * 1000:8.2f}')
+    print(f'after  (ms)  : {after * 1000:8.2f}')
+    print(f'speed-up     : {before / after:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
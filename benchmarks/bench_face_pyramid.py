@@ -0,0 +1,94 @@
+# benchmarks/bench_face_pyramid.py
+"""
+작업 해상도 상한(max_side)별 얼굴 검출 속도 / 재현율 벤치마크
+- 기준: 원본 해상도 검출 결과
+- 재현율: 기준 얼굴 중 IoU >= 0.5 인 검출이 있는 비율
+- --upscale 로 샘플 이미지를 키워 고해상도(예: 24MP) 카메라 사진을 흉내낼 수 있음
+
+실행 예:
+    python -m benchmarks.bench_face_pyramid --folder tests/images --upscale 4
+"""
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+from src.features.modules.face_detector import detect_face_positions
+from src.files.folder_index import FILE_EXT
+
+CAPS = [None, 1600, 1024, 800, 640, 480, 320]
+
+
+def iou_matrix(a, b):
+    """(N, 4), (M, 4) x, y, w, h 배열의 IoU 행렬 (N, M)"""
+    a = np.asarray(a, np.float64).reshape(-1, 1, 4)
+    b = np.asarray(b, np.float64).reshape(1, -1, 4)
+    x0 = np.maximum(a[..., 0], b[..., 0])
+    y0 = np.maximum(a[..., 1], b[..., 1])
+    x1 = np.minimum(a[..., 0] + a[..., 2], b[..., 0] + b[..., 2])
+    y1 = np.minimum(a[..., 1] + a[..., 3], b[..., 1] + b[..., 3])
+    inter = np.clip(x1 - x0, 0, None) * np.clip(y1 - y0, 0, None)
+    union = a[..., 2] * a[..., 3] + b[..., 2] * b[..., 3] - inter
+    return inter / np.maximum(union, 1)
+
+
+def count_matched(truth, found, threshold=0.5):
+    if len(truth) == 0 or len(found) == 0:
+        return 0
+    return int((iou_matrix(truth, found).max(axis=1) >= threshold).sum())
+
+
+def load_grays(folder, upscale):
+    grays = []
+    for name in sorted(os.listdir(folder)):
+        if not name.lower().endswith(FILE_EXT):
+            continue
+        path = os.path.join(folder, name)
+        gray = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            continue
+        if upscale > 1:
+            gray = cv2.resize(gray, None, fx=upscale, fy=upscale, interpolation=cv2.INTER_CUBIC)
+        grays.append((name, gray))
+    return grays
+
+
+def main():
+    parser = argparse.ArgumentParser(description='face detection pyramid cap benchmark')
+    parser.add_argument('--folder', default='tests/images')
+    parser.add_argument('--upscale', type=float, default=1.0)
+    parser.add_argument('--min-neighbors', type=int, default=4)
+    args = parser.parse_args()
+
+    grays = load_grays(args.folder, args.upscale)
+    if not grays:
+        raise FileNotFoundError(f'이미지 없음: {args.folder}')
+    for name, gray in grays:
+        print(f'image: {name} {gray.shape[1]}x{gray.shape[0]}')
+
+    truth = {}
+    print(f'{"max_side":>9} {"ms/image":>10} {"speed-up":>9} {"faces":>6} {"recall":>7}')
+    base_ms = None
+    for cap in CAPS:
+        elapsed = 0.0
+        matched = total = found_count = 0
+        for name, gray in grays:
+            start = time.perf_counter()
+            found = detect_face_positions(gray, 1.1, args.min_neighbors, max_side=cap)
+            elapsed += time.perf_counter() - start
+            if cap is None:
+                truth[name] = found
+            matched += count_matched(truth[name], found)
+            total += len(truth[name])
+            found_count += len(found)
+        ms = elapsed / len(grays) * 1000
+        base_ms = base_ms or ms
+        recall = matched / total if total else 1.0
+        label = 'full' if cap is None else str(cap)
+        print(f'{label:>9} {ms:10.2f} {base_ms / ms:8.2f}x {found_count:6d} {recall:7.2%}')
+
+
+if __name__ == '__main__':
+    main()
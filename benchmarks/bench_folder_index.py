@@ -0,0 +1,61 @@
+# benchmarks/bench_folder_index.py
+"""
+폴더 열기 벤치마크
+- 기존 방식(확장자별 glob) / FolderIndex cold(매니페스트 없음) / warm(매니페스트 있음) 시간 비교
+
+실행 예:
+    python -m benchmarks.bench_folder_index --files 50000
+"""
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+from src.files.folder_index import FolderIndex
+
+PNG_HEADER = b'\x89PNG\r\n\x1a\n' + b'\x00' * 56
+
+
+def make_folder(root, count):
+    """count 개의 가짜 이미지 파일로 폴더를 채움 (확장자 대소문자 섞음)"""
+    exts = ['png', 'jpg', 'gif', 'PNG', 'JPG']
+    for i in range(count):
+        with open(os.path.join(root, f'scan_{i:07d}.{exts[i % len(exts)]}'), 'wb') as f:
+            f.write(PNG_HEADER)
+
+
+def glob_scan(folder):
+    files = []
+    for ext in ['png', 'jpg', 'gif']:
+        files.extend(glob.glob(os.path.join(folder, f'*.{ext}')))
+    return files
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='FolderIndex cold/warm open benchmark')
+    parser.add_argument('--files', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        make_folder(folder, args.files)
+
+        glob_time, glob_files = timed(lambda: glob_scan(folder))
+        cold_time, entries = timed(lambda: FolderIndex(folder).scan())
+        warm_times = [timed(lambda: FolderIndex(folder).scan())[0] for _ in range(args.repeat)]
+
+        print(f'files           : {args.files}')
+        print(f'glob (old)      : {glob_time * 1000:9.1f} ms  ({len(glob_files)} files, case-sensitive)')
+        print(f'index cold      : {cold_time * 1000:9.1f} ms  ({len(entries)} files)')
+        print(f'index warm (min): {min(warm_times) * 1000:9.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
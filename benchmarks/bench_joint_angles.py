@@ -0,0 +1,84 @@
+# benchmarks/bench_joint_angles.py
+"""
+관절 각도 계산 벤치마크 (긴 동영상 분량의 랜드마크)
+- before: 프레임마다 calculate_angle 을 각도 8개에 한 번씩 호출 + angle_alert (기존 render_angles 방식)
+- after : compute_angles / compute_alerts 로 전체 (프레임, 33, 2) 배열을 한 번에 계산
+- per-frame: compute_angles 를 프레임마다 호출 (render_angles 가 쓰는 방식)
+- 각도 최대 오차와 경고 마스크가 같은지도 확인
+
+실행 예:
+    python -m benchmarks.bench_joint_angles --minutes 10
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks import synthetic
+from src.video.angles import POSE_ANGLE_SPECS, POSE_ANGLES, angle_alert, calculate_angle, compute_alerts, compute_angles
+from src.video.pose import LANDMARK
+
+
+def angles_before(points):
+    """기존 render_angles 처럼 각도 하나씩 계산 (발목은 20px 아래 가짜 발끝)"""
+    angles = np.empty((len(points), len(POSE_ANGLE_SPECS)))
+    alerts = np.empty(angles.shape, bool)
+    for f, frame_points in enumerate(points):
+        for k, (_, a, b, c, joint, offset) in enumerate(POSE_ANGLE_SPECS):
+            pb = tuple(frame_points[LANDMARK[b]])
+            pc = (pb[0] + offset[0], pb[1] + offset[1]) if c is None else tuple(frame_points[LANDMARK[c]])
+            angle = calculate_angle(tuple(frame_points[LANDMARK[a]]), pb, pc)
+            angles[f, k] = angle
+            alerts[f, k] = angle_alert(angle, joint)
+    return angles, alerts
+
+
+def angles_per_frame(points):
+    angles = np.empty((len(points), len(POSE_ANGLES.names)))
+    for f, frame_points in enumerate(points):
+        angles[f] = compute_angles(frame_points)
+    return angles, compute_alerts(angles)
+
+
+def angles_after(points):
+    angles = compute_angles(points)
+    return angles, compute_alerts(angles)
+
+
+def measure(func, points):
+    start = time.perf_counter()
+    result = func(points)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='joint angle benchmark')
+    parser.add_argument('--minutes', type=float, default=5.0, help='30fps 동영상 길이 (분)')
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    args = parser.parse_args()
+
+    frames = int(args.minutes * 60 * 30)
+    # render_angles 처럼 정수 픽셀 좌표
+    stream = synthetic.make_landmark_stream(frames)[:, :, :2]
+    points = (stream * np.array([args.width, args.height], np.float32)).astype(np.int64)
+
+    (before, before_alerts), before_s = measure(angles_before, points)
+    (per_frame, per_frame_alerts), per_frame_s = measure(angles_per_frame, points)
+    (after, after_alerts), after_s = measure(angles_after, points)
+
+    count = before.size
+    print(f'frames        : {frames} ({args.minutes:g} min @ 30fps), {count} angles')
+    print(f'max diff      : {np.nanmax(np.abs(before - after)):.3g} deg (per-frame '
+          f'{np.nanmax(np.abs(before - per_frame)):.3g})')
+    print(f'alerts equal  : {np.array_equal(before_alerts, after_alerts)}'
+          f' (per-frame {np.array_equal(before_alerts, per_frame_alerts)})')
+    print(f'before        : {before_s * 1000:9.1f} ms  {count / before_s:12.0f} angles/s')
+    print(f'per-frame     : {per_frame_s * 1000:9.1f} ms  {count / per_frame_s:12.0f} angles/s'
+          f'  ({before_s / per_frame_s:.1f}x)')
+    print(f'after         : {after_s * 1000:9.1f} ms  {count / after_s:12.0f} angles/s'
+          f'  ({before_s / after_s:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
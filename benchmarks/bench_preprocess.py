@@ -0,0 +1,90 @@
+# benchmarks/bench_preprocess.py
+"""
+알파 제거 + 이진화 전처리 메모리 / 지연 시간 벤치마크
+- before: 기존 PrepareImage.remove_alpha + binarize_image (float64 임시 배열, 단계별 새 배열)
+- after : PreprocessEngine.binarize (LUT 합성 + strip 처리 + 버퍼 재사용)
+- 메모리: tracemalloc 으로 잰 numpy / cv2 출력 배열의 최대 할당량
+- 두 결과가 비트 단위로 같은지도 확인
+
+실행 예:
+    python -m benchmarks.bench_preprocess --megapixels 40 --repeat 3
+"""
+import argparse
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from src.features.modules.preprocess_engine import PreprocessEngine
+
+
+def remove_alpha_before(img):
+    if img.shape[2] == 4:
+        alpha = img[:, :, 3] / 255.0
+        rgb = img[:, :, :3].astype(float)
+        white_bg = np.ones_like(rgb) * 255
+        return (rgb * alpha[:, :, None] + white_bg * (1 - alpha[:, :, None])).astype(np.uint8)
+    return img
+
+
+def binarize_before(img_rgb):
+    gray = cv2.cvtColor(img_rgb, cv2.COLOR_BGR2GRAY)
+    blur = cv2.GaussianBlur(gray, (5, 5), 0)
+    _, binary = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
+def make_rgba(megapixels, seed=0):
+    """문서 스캔처럼 부드러운 밝기 변화 + 글자 모양 잡음 + 가장자리 투명 영역"""
+    side = int((megapixels * 1e6) ** 0.5)
+    rng = np.random.default_rng(seed)
+    img = np.empty((side, side, 4), np.uint8)
+    ramp = np.linspace(160, 240, side, dtype=np.float32)
+    img[:, :, :3] = ramp[None, :, None].astype(np.uint8)
+    for _ in range(200):
+        x, y = rng.integers(0, side - 200, 2)
+        cv2.putText(img, 'open-cv-flow', (int(x), int(y) + 100), cv2.FONT_HERSHEY_SIMPLEX, 2, (20, 20, 20, 255), 3)
+    img[:, :, 3] = 255
+    img[: side // 10, :, 3] = np.linspace(0, 255, side, dtype=np.float32).astype(np.uint8)
+    return img
+
+
+def measure(func, repeat):
+    func()  # warm-up (엔진 버퍼 할당 포함)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='preprocess engine benchmark')
+    parser.add_argument('--megapixels', type=float, default=8.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--strip-rows', type=int, default=256)
+    args = parser.parse_args()
+
+    img = make_rgba(args.megapixels)
+    engine = PreprocessEngine(args.strip_rows)
+    out = np.empty(img.shape[:2], np.uint8)
+
+    before, before_s, before_peak = measure(lambda: binarize_before(remove_alpha_before(img)), args.repeat)
+    after, after_s, after_peak = measure(lambda: engine.binarize(img, out=out), args.repeat)
+
+    mb = 1024 * 1024
+    print(f'image         : {img.shape[1]}x{img.shape[0]} RGBA ({img.nbytes / mb:.1f} MB)')
+    print(f'identical     : {np.array_equal(before, after)}')
+    print(f'before        : {before_s * 1000:9.1f} ms  peak {before_peak / mb:9.1f} MB')
+    print(f'after         : {after_s * 1000:9.1f} ms  peak {after_peak / mb:9.1f} MB'
+          f'  (engine buffers {engine.get_buffer_bytes() / mb:.1f} MB)')
+    print(f'speed-up      : {before_s / after_s:9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_startup.py
+"""
+시작 시간 벤치마크
+- 새 파이썬 프로세스에서 모듈 import / DataManager.init() 까지 걸리는 시간 측정
+- 비교용으로 easyocr import 와 Reader 생성 시간도 측정 (easyocr 가 설치된 경우)
+
+실행 예:
+    python -m benchmarks.bench_startup --repeat 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPETS = {
+    'python (baseline)': 'pass',
+    'import DataManager': 'from sample.data_manager import DataManager',
+    'DataManager.init()': (
+        'import os; os.chdir({folder!r})\n'
+        'from sample.data_manager import DataManager\n'
+        'DataManager.init()'
+    ),
+    'import easyocr': 'import easyocr',
+    "easyocr.Reader(['ch_sim','en'])": "import easyocr; easyocr.Reader(['ch_sim', 'en'])",
+}
+
+TIMER = (
+    'import time, sys\n'
+    'start = time.perf_counter()\n'
+    '{code}\n'
+    'sys.stdout.write("\\n%.6f" % (time.perf_counter() - start))\n'
+)
+
+
+def run_snippet(code):
+    """새 프로세스에서 code 실행 시간(초) 반환, 실패하면 None"""
+    proc = subprocess.run(
+        [sys.executable, '-c', TIMER.format(code=code)],
+        cwd=ROOT, capture_output=True, text=True,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+    )
+    if proc.returncode != 0:
+        return None
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='cold start benchmark')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-reader', action='store_true', help='easyocr.Reader 생성 측정 생략')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        os.makedirs(os.path.join(folder, 'image'))
+        for name, code in SNIPPETS.items():
+            if args.skip_reader and 'Reader' in name:
+                continue
+            times = [run_snippet(code.format(folder=folder)) for _ in range(args.repeat)]
+            if None in times:
+                print(f'{name:34s}: failed (dependency missing?)')
+                continue
+            print(f'{name:34s}: {min(times) * 1000:9.1f} ms (min of {args.repeat})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,464 @@
+# benchmarks/suite.py
+"""
+핫패스 벤치마크 모음
+- 합성 데이터(benchmarks/synthetic.py)로 폴더 스캔, 전처리, 얼굴 검출, 동영상, 관절 각도,
+  랜드마크 재생 분석, 색 분할 마스크, OCR(가짜 reader) 경로의 시간을 측정
+- 결과는 JSON 으로 저장해 실행 간 비교 (--compare 로 이전 결과 대비 느려진 항목 검출)
+
+실행 예:
+    python -m benchmarks.suite --quick --out bench_output.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.15
+    python -m benchmarks.suite --filter detect_faces
+"""
+import argparse
+import ast
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, NamedTuple
+
+import cv2
+import numpy as np
+
+from benchmarks import synthetic
+
+ROOT = synthetic.ROOT
+SCRIPTS = os.path.join(ROOT, 'src', 'test')
+
+
+class Bench(NamedTuple):
+    run: Callable                   # 측정할 함수
+    before: Callable = None         # 매 반복 직전에 실행 (측정 제외) - 캐시 비우기 등
+    items: int = 1                  # 한 번 실행에 처리하는 항목 수 (이미지, 프레임 등)
+
+
+class Env:
+    def __init__(self, workdir: str, quick: bool):
+        self.workdir = workdir
+        self.quick = quick
+        self.__memo = {}
+
+    def memo(self, key, create):
+        """여러 case 가 같은 합성 데이터를 쓰도록 한 번만 생성"""
+        if key not in self.__memo:
+            self.__memo[key] = create()
+        return self.__memo[key]
+
+    def path(self, *names):
+        return os.path.join(self.workdir, *names)
+
+    def image_file(self, width, height, channels=3, ext='png'):
+        def create():
+            path = self.path(f'image_{width}x{height}_{channels}.{ext}')
+            cv2.imwrite(path, synthetic.make_image(width, height, channels))
+            return path
+        return self.memo(('image_file', width, height, channels, ext), create)
+
+    def folder(self, count):
+        def create():
+            folder = self.path(f'folder_{count}')
+            synthetic.make_folder(folder, count)
+            return folder
+        return self.memo(('folder', count), create)
+
+
+CASES = []
+
+
+def case(name, quick=True, **params):
+    """
+    벤치마크 등록
+    param quick: False 면 --quick 실행에서 제외
+    param params: case 함수에 넘길 인자 (결과 JSON 에도 기록)
+    """
+    def register(func):
+        CASES.append((name, func, params, quick))
+        return func
+    return register
+
+
+def load_script_function(path, name, namespace=None):
+    """
+    스크립트 파일에서 함수 정의만 꺼내 반환
+    src/test 의 스크립트는 import 하면 카메라/동영상 처리를 바로 시작하므로 함수 정의만 실행한다.
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == name:
+            ns = dict(namespace or {})
+            exec(compile(ast.Module([node], []), path, 'exec'), ns)
+            return ns[name]
+    raise LookupError(f'{name} 함수 없음: {path}')
+
+
+class StubReader:
+    """easyocr.Reader 대신 쓰는 가짜 reader - 모델 없이 OCR 주변 경로(디코딩/캐시/저장)만 측정"""
+    RESULT = [([[0, 0], [120, 0], [120, 24], [0, 24]], 'open-cv-flow', 0.99)]
+
+    def readtext(self, image, **kwargs):
+        return list(self.RESULT)
+
+    def readtext_batched(self, images, **kwargs):
+        return [list(self.RESULT) for _ in images]
+
+
+def clear_image_cache():
+    from src.cache.image_cache import get_image_cache
+    get_image_cache().invalidate()
+
+
+# ------------------------------
+# 폴더 스캔
+# ------------------------------
+@case('folder_scan_cold', quick=False, count=2000)
+@case('folder_scan_cold', count=200)
+def bench_folder_scan_cold(env, count):
+    from sample.data_manager.folder_data import FolderData
+    from src.files.folder_index import MANIFEST_NAME
+    folder = env.folder(count)
+
+    def remove_manifest():
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(folder, MANIFEST_NAME))
+    return Bench(lambda: FolderData(folder), remove_manifest, count)
+
+
+@case('folder_scan_warm', quick=False, count=2000)
+@case('folder_scan_warm', count=200)
+def bench_folder_scan_warm(env, count):
+    from sample.data_manager.folder_data import FolderData
+    folder = env.folder(count)
+    FolderData(folder)  # 매니페스트 생성
+    return Bench(lambda: FolderData(folder), items=count)
+
+
+# ------------------------------
+# 전처리
+# ------------------------------
+@case('remove_alpha', quick=False, width=4000, height=3000)
+@case('remove_alpha', width=1280, height=960)
+def bench_remove_alpha(env, width, height):
+    from src.features.modules.prepare_image import PrepareImage
+    img = env.memo(('rgba', width, height), lambda: synthetic.make_image(width, height, 4))
+    prepare = PrepareImage(None)
+    return Bench(lambda: prepare.remove_alpha(img))
+
+
+@case('binarize_image', quick=False, width=4000, height=3000)
+@case('binarize_image', width=1280, height=960)
+def bench_binarize_image(env, width, height):
+    from src.features.modules.prepare_image import PrepareImage
+    img = env.memo(('bgr', width, height), lambda: synthetic.make_image(width, height, 3))
+    prepare = PrepareImage(None)
+    return Bench(lambda: prepare.binarize_image(img))
+
+
+# ------------------------------
+# 얼굴 검출 (매 반복마다 이미지 캐시를 비워 디코딩 포함 측정)
+# ------------------------------
+def _detect_faces_variants():
+    from src.features.batch_face_detection import detect_file
+    from src.features.face_detection import FaceDetection
+    from src.features.modules.face_detection import FaceDetection as ModuleFaceDetection
+    from src.features.modules.prepare_image import PrepareImage
+    from src.ocr.image_data import ImageData
+    return {
+        'features.FaceDetection.detect_faces_cv2': lambda p: FaceDetection(p).detect_faces_cv2(),
+        'modules.FaceDetection.detect_faces': lambda p: ModuleFaceDetection(p).detect_faces(),
+        'PrepareImage.detect_faces': lambda p: PrepareImage(p).detect_faces(),
+        'PrepareImage.detect_faces(with_image=False)': lambda p: PrepareImage(p).detect_faces(with_image=False),
+        'PrepareImage.detect_faces(max_side=640)': lambda p: PrepareImage(p).detect_faces(640, with_image=False),
+        'ImageData.detect_faces': lambda p: ImageData(p).detect_faces(),
+        'batch_face_detection.detect_file': detect_file,
+    }
+
+
+for _variant in ('features.FaceDetection.detect_faces_cv2', 'modules.FaceDetection.detect_faces',
+                 'PrepareImage.detect_faces', 'PrepareImage.detect_faces(with_image=False)',
+                 'PrepareImage.detect_faces(max_side=640)', 'ImageData.detect_faces',
+                 'batch_face_detection.detect_file'):
+    @case('detect_faces', quick=False, variant=_variant, width=4000, height=3000, ext='jpg')
+    @case('detect_faces', variant=_variant, width=1280, height=960)
+    def bench_detect_faces(env, variant, width, height, ext='png'):
+        path = env.image_file(width, height, ext=ext)
+        detect = _detect_faces_variants()[variant]
+        return Bench(lambda: detect(path), clear_image_cache)
+
+
+# ------------------------------
+# 동영상
+# ------------------------------
+@case('video_face_detection', quick=False, frames=300, detect_every=1)
+@case('video_face_detection', frames=60, detect_every=10)
+def bench_video_face_detection(env, frames, detect_every):
+    from src.features.video_face_detection import VideoFaceDetection
+    path = env.memo(('video', frames), lambda: synthetic.make_video(env.path(f'video_{frames}.mp4'), frames))
+    detector = VideoFaceDetection(detect_every=detect_every)
+
+    def run():
+        for _ in detector.iter_video(path):
+            pass
+    return Bench(run, items=frames)
+
+
+@case('video_pipeline', quick=False, frames=300, threaded=False)
+@case('video_pipeline', quick=False, frames=300, threaded=True)
+@case('video_pipeline', frames=60, threaded=False)
+@case('video_pipeline', frames=60, threaded=True)
+def bench_video_pipeline(env, frames, threaded):
+    """decode -> 얼굴 검출 -> 상자 그리기 -> mp4 저장 (threaded=False 는 기존 스크립트 같은 직렬 루프)"""
+    from src.features.modules.face_detector import detect_face_positions
+    from src.video.pipeline import VideoPipeline, VideoSink
+    path = env.memo(('video', frames), lambda: synthetic.make_video(env.path(f'video_{frames}.mp4'), frames))
+    out_path = env.path(f'video_pipeline_{frames}.mp4')
+
+    def infer(frame):
+        return detect_face_positions(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), max_side=240)
+
+    def render(frame, positions):
+        for x, y, w, h in positions:
+            cv2.rectangle(frame, (int(x), int(y)), (int(x + w), int(y + h)), (0, 255, 0), 2)
+
+    def run_serial():
+        cap = cv2.VideoCapture(path)
+        sink = VideoSink(out_path, cap.get(cv2.CAP_PROP_FPS))
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            render(frame, infer(frame))
+            sink.write(frame)
+        cap.release()
+        sink.release()
+
+    def run_threaded():
+        with contextlib.redirect_stdout(io.StringIO()):
+            VideoPipeline(path, infer, render, writer=out_path).run()
+    return Bench(run_threaded if threaded else run_serial, items=frames)
+
+
+# ------------------------------
+# 관절 각도 / 색 분할 (src/test/clra_root.py 의 함수)
+# ------------------------------
+# (관절 a, 꼭짓점 b, 관절 c) - mediapipe pose 번호 (무릎, 엉덩이, 발목, 어깨 좌우)
+ANGLE_TRIPLES = ((23, 25, 27), (24, 26, 28), (11, 23, 25), (12, 24, 26),
+                 (25, 27, 31), (26, 28, 32), (13, 11, 23), (14, 12, 24))
+
+
+@case('calculate_angle', quick=False, frames=3000)
+@case('calculate_angle', frames=300)
+def bench_calculate_angle(env, frames):
+    from src.video.angles import calculate_angle
+    stream = synthetic.make_landmark_stream(frames)[:, :, :2]
+
+    def run():
+        for landmarks in stream:
+            for a, b, c in ANGLE_TRIPLES:
+                calculate_angle(landmarks[a], landmarks[b], landmarks[c])
+    return Bench(run, items=frames * len(ANGLE_TRIPLES))
+
+
+@case('joint_angles', quick=False, frames=3000)
+@case('joint_angles', frames=300)
+def bench_joint_angles(env, frames):
+    from src.video.angles import compute_alerts, compute_angles, make_angle_table
+    # calculate_angle case 와 같은 각도를 (프레임, 33, 2) 배열 전체에 대해 한 번에 계산
+    table = make_angle_table([(str(k), a, b, c, None, None) for k, (a, b, c) in enumerate(ANGLE_TRIPLES)])
+    stream = synthetic.make_landmark_stream(frames)[:, :, :2]
+
+    def run():
+        compute_alerts(compute_angles(stream, table), table)
+    return Bench(run, items=frames * len(ANGLE_TRIPLES))
+
+
+@case('landmark_replay', quick=False, frames=108000)
+@case('landmark_replay', frames=9000)
+def bench_landmark_replay(env, frames):
+    from src.video.angles import compute_alerts, compute_angles
+    from src.video.landmarks import LandmarkSeries
+    # 기록한 랜드마크 파일을 불러와 전체 관절 각도 / 경고를 다시 계산 (추론 없는 분석 재실행)
+    path = env.path(f'landmarks_{frames}.npz')
+    landmarks = np.empty((frames, 33, 4), np.float32)
+    landmarks[..., :3] = synthetic.make_landmark_stream(frames)
+    landmarks[..., 3] = 1.0
+    LandmarkSeries(landmarks, np.arange(frames) / 30.0, 30.0, (1280, 720)).save(path)
+
+    def run():
+        series = LandmarkSeries.load(path)
+        compute_alerts(compute_angles(series.get_pixel_points()))
+    return Bench(run, items=frames)
+
+
+@case('maha_mask', quick=False, frames=30, width=1280, height=720)
+@case('maha_mask', frames=10, width=640, height=360)
+def bench_maha_mask(env, frames, width, height):
+    frame = synthetic.make_image(width, height, faces=True)
+    lab = cv2.cvtColor(frame, cv2.COLOR_BGR2LAB)
+    samples = lab[height // 4:height // 2, width // 4:width // 2].reshape(-1, 3)[::97].astype(np.float32)
+    mu = samples.mean(axis=0)
+    inv_cov = np.linalg.inv(np.cov(samples.T) + np.eye(3))
+    maha_mask = load_script_function(
+        os.path.join(SCRIPTS, 'clra_root.py'), 'maha_mask', {'cv': cv2, 'np': np, 'mu': mu, 'inv_cov': inv_cov}
+    )
+
+    def run():
+        for _ in range(frames):
+            maha_mask(frame, thresh=6.0)
+    return Bench(run, items=frames)
+
+
+# ------------------------------
+# OCR (가짜 reader)
+# ------------------------------
+@case('ocr_batch_stub', quick=False, count=500)
+@case('ocr_batch_stub', count=50)
+def bench_ocr_batch_stub(env, count):
+    from sample.data_manager.file_data import FileData
+    from src.ocr.batch_ocr import BatchOcr
+    folder = env.folder(count)
+    files = [FileData(os.path.join(folder, n)) for n in sorted(os.listdir(folder)) if n.endswith('.png')]
+    batch = BatchOcr(StubReader(), workers=2, batch_size=8)
+
+    def before():
+        for f in files:
+            f.clear_results()
+    return Bench(lambda: batch.run(files), before, count)
+
+
+@case('ocr_get_texts_from_image_stub')
+def bench_ocr_get_texts_from_image_stub(env):
+    from sample.data_manager import DataManager
+    from src.ocr.reader_pool import ReaderPool
+    folder = env.folder(200)
+    with contextlib.redirect_stdout(io.StringIO()):
+        DataManager.reader_pool = ReaderPool(lambda langs: StubReader())
+        DataManager.reset_work_folder(folder)
+
+    def before():
+        DataManager.get_work_file().clear_results()
+        DataManager.work_context = None
+        clear_image_cache()
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            DataManager.get_texts_from_image()
+    return Bench(run, before)
+
+
+# ------------------------------
+# 실행 / 결과 저장 / 비교
+# ------------------------------
+def measure(bench: Bench, repeat: int):
+    if bench.before is not None:
+        bench.before()
+    bench.run()  # warm-up
+    times = []
+    for _ in range(repeat):
+        if bench.before is not None:
+            bench.before()
+        start = time.perf_counter()
+        bench.run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def case_id(name, params):
+    if not params:
+        return name
+    return name + '[' + ','.join(f'{k}={v}' for k, v in params.items()) + ']'
+
+
+def get_meta():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'numpy': np.__version__,
+        'opencv': cv2.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def run_cases(quick: bool, repeat: int, name_filter: str = None):
+    results = []
+    with tempfile.TemporaryDirectory(prefix='open-cv-flow-bench-') as workdir:
+        env = Env(workdir, quick)
+        for name, func, params, in_quick in CASES:
+            cid = case_id(name, params)
+            if quick and not in_quick or name_filter and name_filter not in cid:
+                continue
+            try:
+                bench = func(env, **params)
+                times = measure(bench, repeat)
+            except Exception as e:  # 한 case 가 실패해도 나머지는 계속 측정
+                print(f'{cid:70s} FAILED {type(e).__name__}: {e}')
+                results.append({'id': cid, 'name': name, 'params': params, 'error': f'{type(e).__name__}: {e}'})
+                continue
+            median = statistics.median(times)
+            results.append({
+                'id': cid, 'name': name, 'params': params, 'repeat': repeat, 'items': bench.items,
+                'min': min(times), 'median': median, 'mean': statistics.fmean(times),
+                'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+                'items_per_sec': bench.items / median if median > 0 else None,
+            })
+            print(f'{cid:70s} {median * 1000:10.2f} ms  ({bench.items / median:10.1f} items/s)')
+    return results
+
+
+def compare(results, baseline_path, threshold):
+    """baseline 대비 median 이 threshold 비율 이상 느려진 항목 리스트"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {r['id']: r for r in json.load(f)['results'] if 'median' in r}
+    regressions = []
+    print(f'\n{"case":70s} {"before":>10s} {"after":>10s} {"ratio":>7s}')
+    for r in results:
+        old = baseline.get(r['id'])
+        if old is None or 'median' not in r:
+            continue
+        ratio = r['median'] / old['median'] if old['median'] > 0 else float('inf')
+        mark = ' <-- regression' if ratio > 1 + threshold else ''
+        print(f'{r["id"]:70s} {old["median"] * 1000:8.2f}ms {r["median"] * 1000:8.2f}ms {ratio:6.2f}x{mark}')
+        if mark:
+            regressions.append(r['id'])
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='open-cv-flow benchmark suite')
+    parser.add_argument('--quick', action='store_true', help='작은 입력만 측정')
+    parser.add_argument('--repeat', type=int, default=None, help='반복 횟수 (기본값 quick 3 / 전체 7)')
+    parser.add_argument('--filter', default=None, help='case id 에 이 문자열이 포함된 것만 실행')
+    parser.add_argument('--out', default=os.path.join(ROOT, 'bench_output.json'))
+    parser.add_argument('--compare', default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.15, help='회귀로 볼 median 증가 비율')
+    args = parser.parse_args()
+
+    repeat = args.repeat or (3 if args.quick else 7)
+    results = run_cases(args.quick, repeat, args.filter)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump({'meta': get_meta(), 'quick': args.quick, 'results': results}, f, indent=2, ensure_ascii=False)
+    print(f'\n결과 저장: {args.out}')
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f'\n느려진 항목 {len(regressions)}개 (threshold {args.threshold:.0%})')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/synthetic.py
+"""
+벤치마크용 합성 데이터 생성기
+- 같은 seed 면 항상 같은 데이터를 만들어 실행 간 비교가 가능하도록 함
+- 이미지: 크기 / 채널(알파 포함 여부) / 얼굴 사진 포함 여부 지정
+- 폴더: N 개의 이미지 파일
+- 랜드마크: mediapipe pose 형식 (프레임, 33, 3) 좌표 스트림
+- 동영상: 얼굴 사진이 천천히 움직이는 mp4
+"""
+import os
+
+import cv2
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 저장소에 포함된 얼굴 사진 (없으면 도형만 그린 이미지 사용)
+FACE_IMAGE = os.path.join(ROOT, 'tests', 'images', 'image.png')
+POSE_LANDMARKS = 33
+
+
+def make_image(width: int, height: int, channels: int = 3, faces: bool = True, seed: int = 0) -> np.ndarray:
+    """
+    문서 스캔 + 얼굴 사진이 섞인 uint8 이미지
+    param channels: 1, 3 또는 4 (4 면 가장자리가 반투명한 알파 채널 포함)
+    param faces: True 면 저장소의 얼굴 사진을 크기에 맞춰 붙여 넣음
+    """
+    rng = np.random.default_rng(seed)
+    img = np.empty((height, width, 3), np.uint8)
+    img[:] = np.linspace(170, 240, width, dtype=np.float32).astype(np.uint8)[None, :, None]
+    for _ in range(max(1, width * height // 40000)):
+        x, y = int(rng.integers(0, max(1, width - 100))), int(rng.integers(20, max(21, height)))
+        cv2.putText(img, 'open-cv-flow', (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (30, 30, 30), 2)
+
+    face = cv2.imread(FACE_IMAGE) if faces else None
+    if face is not None:
+        scale = min(width / 2 / face.shape[1], height / 2 / face.shape[0])
+        face = cv2.resize(face, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        fh, fw = face.shape[:2]
+        img[height // 4:height // 4 + fh, width // 4:width // 4 + fw] = face
+
+    if channels == 1:
+        return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    if channels == 4:
+        alpha = np.full((height, width), 255, np.uint8)
+        edge = max(1, height // 10)
+        alpha[:edge] = np.linspace(0, 255, width, dtype=np.float32).astype(np.uint8)
+        return np.dstack([img, alpha])
+    return img
+
+
+def make_folder(folder: str, count: int, width: int = 320, height: int = 240, ext: str = 'png') -> list:
+    """folder 에 count 개의 이미지를 만들고 경로 리스트 반환 (내용은 파일마다 조금씩 다름)"""
+    os.makedirs(folder, exist_ok=True)
+    base = make_image(width, height, faces=True)
+    paths = []
+    for i in range(count):
+        img = base.copy()
+        cv2.putText(img, f'{i:06d}', (5, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 1)
+        path = os.path.join(folder, f'image_{i:06d}.{ext}')
+        cv2.imwrite(path, img)
+        paths.append(path)
+    return paths
+
+
+def make_landmark_stream(frames: int, joints: int = POSE_LANDMARKS, seed: int = 0) -> np.ndarray:
+    """
+    (frames, joints, 3) float32 정규화 좌표 (x, y, z) - 관절이 부드럽게 흔들리는 움직임
+    """
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(0.2, 0.8, (joints, 3)).astype(np.float32)
+    phase = rng.uniform(0, 2 * np.pi, (joints, 3)).astype(np.float32)
+    t = np.arange(frames, dtype=np.float32)[:, None, None] / 30.0
+    return base + 0.05 * np.sin(2 * np.pi * 0.5 * t + phase)
+
+
+def make_video(path: str, frames: int, width: int = 640, height: int = 360, fps: float = 30.0) -> str:
+    """얼굴 사진이 포함된 장면을 좌우로 천천히 이동시키는 mp4 생성"""
+    scene = make_image(width + frames, height, faces=True)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), fps, (width, height))
+    try:
+        for i in range(frames):
+            writer.write(np.ascontiguousarray(scene[:, i:i + width]))
+    finally:
+        writer.release()
+    return path
@@ -1,6 +1,24 @@
-def main():
-    print("Hello from open-cv-flow!")
+import argparse
+import sys
+
+from src.video.cli import add_pose_arguments, run_pose
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='open-cv-flow')
+    commands = parser.add_subparsers(dest='command')
+
+    # 포즈 동영상 일괄 처리 (GUI 없이) - src/video/cli.py 참고
+    pose = commands.add_parser('pose', help='동영상에 포즈 오버레이를 그려 mp4로 저장')
+    add_pose_arguments(pose)
+    pose.set_defaults(func=run_pose)
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 0
+    return args.func(args)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,198 +1,77 @@
-import glob
 import os
-import shutil
-import easyocr
-import numpy
-
-from tkinter import messagebox as mb
+import time
+
+from src.files.folder_watcher import FolderWatcher
+from src.files.image_prefetcher import ImagePrefetcher
+from src.files.output_files import (
+    OUTPUT_MODE_LAZY, get_output_path, materialize_outputs, replace_output_file, resolve_output_file,
+)
+from src.cache.image_cache import get_image_cache
+from src.cache.result_cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_BYTES, ResultCache
+from src.features.batch_face_detection import BatchFaceDetection
+from src.features.face_cache import FaceCache
+from src.features.modules.image_context import ImageContext
+from src.metrics import metrics
+from src.metrics.log import get_logger
+from src.ocr.batch_ocr import BatchOcr
+from src.ocr.ocr_cache import OcrCache
+from src.ocr.reader_pool import ReaderPool
 
 # FolderData > FileData > TextData
-class FolderData:
-    
-    def __init__(self, path):
-        self.__folder = path
-        self.__files = []   # FileData 객체를 의미
-        self.__work_file = None
-        self.__init_work_folder()
-
-    def __init_work_folder(self):
-        FILE_EXT = ['png', 'jpg', 'gif']
-        target_files = []
-        [target_files.extend(glob.glob(self.__folder + '/' + '*.' + e)) for e in FILE_EXT]
-
-        for tf in target_files:
-            self.__files.append(FileData(tf))
-
-        if len(self.__files) == 0:
-            return
-
-        self.__work_file = self.__files[0]
-
-    def get_work_file(self):
-        return self.__work_file
-    
-    def set_work_file(self, target_file):
-        self.__work_file = target_file
-        
-    def get_files(self):
-        return self.__files     # FileData 반환
-    
-    def get_file_by_index(self, index):
-        return self.__files[index]      # FileData 반환
-    
-    def get_files_as_string(self):
-        file_strings = []
-        for f in self.__files:
-            file_strings.append(f.get_file_name())
-        return file_strings     # FileData의 name 반환
-    
-    def get_folder_path(self):
-        return self.__folder
+from .folder_data import FolderData
+from .file_data import FileData
 
-class FileData:
-    def __init__(self, file):
-        self.__name = file
-        self.__texts = []   # TextData 객체를 의미
-        self.__is_ocr_executed = False
-        self.__faces = None
 
-    def get_file_name(self):
-        return self.__name
+OCR_LANGS = ['ch_sim', 'en']
 
-    def clear_faces(self):
-        self.__faces = None
+log = get_logger('DataManager')
 
-    def get_faces(self):
-        return self.__faces
 
-    def get_faces_as_string(self):
-        faces = []
-        if self.__faces == None or len(self.__faces) == 0:
-            return None
-        for f in self.__faces:
-            faces.append(f.get_name())
-        return faces
-
-    def set_faces(self, positions):
-        """
-        positions:
-            얼굴이 detect 된 영역에 대한 좌표값을 list 가 입력된다.
-            예를 들어 얼굴이 2개 검출 된 경우 아래와 같은 좌표값이 입력된다.
-            [[216 116 195 195],[101 188 197 197]]
-        """
-        if positions is not None and type(positions) is numpy.ndarray and len(positions) > 0:
-            self.__faces = []
-            for index, p in enumerate(positions):
-                self.__faces.append(FaceData('얼굴-'+"{:04d}".format(index+1), p))
-        
-    def is_ocr_executed(self):
-        return self.__is_ocr_executed        
-        
-    def set_texts(self, ocr_texts):
-        """
-        param ocr_texts: 
-            ocr_texts 은 아래와 같은 형태의 data 구조로 들어온다.
-            [
-                ([[24, 48], [345, 48], [345, 109], [24, 109]], '下载手机天猫APP', 0.8471784057548907), 
-                ([[24, 130], [368, 130], [368, 204], [24, 204]], '享388元礼包', 0.9837027854197318), 
-                ([[190, 306], [290, 306], [290, 336], [190, 336]], '立即扫码', 0.9933473467826843), 
-                ([[160, 348], [334, 348], [334, 372], [160, 372]], '下载手机天猫APP领福利', 0.858102917437849)
-            ]
-        """
-        self.__texts = []
-        for t in ocr_texts:
-            self.__texts.append(TextData(t[1], t[0]))
-        self.__is_ocr_executed = True
-
-    def get_texts(self):
-        return self.__texts     # TextData 객체 반환
-    
-    def get_text_by_index(self, index):
-        return self.__texts[index]      # TextData 객체 반환
-    
-    def get_texts_as_string(self):
-        return [t.get_text() for t in self.__texts]     # TextData의 text 반환
-    
-    def get_positions_as_string(self):
-        return [t.get_position_info() for t in self.__texts]     # TextData의 position_info 반환
-    
-    def get_text_as_string_by_index(self, index):
-        ocr_text_list = [t.get_text() for t in self.__texts]
-        return ocr_text_list[index]     # # TextData의 text 반환
-    
-    def get_rectangle_position_by_texts_index(self, index):
+class DataManager:
+    folder_data = None
+    # no need to reset, reload - 언어 조합별 easyocr reader 는 처음 OCR 할 때 로드
+    reader_pool = ReaderPool()
+    ocr_langs = OCR_LANGS
+    ocr_cache = None
+    face_cache = None
+    # OCR / 얼굴 검출 캐시가 함께 쓰는 SQLite 결과 캐시 (용량 한도와 통계 공유)
+    result_cache = None
+    folder_watcher = None
+    image_prefetcher = None
+    batch_ocr = None
+    batch_face_detection = None
+    # 작업 이미지의 중간 결과(BGR/흑백/이진화)를 OCR / 얼굴 검출 / 이진화가 공유
+    work_context = None
+    # 'lazy' | 'link' | 'copy' - src/files/output_files.py 참고
+    output_mode = OUTPUT_MODE_LAZY
+
+    def init(warm_up=False):
         """
-        __texts[index]의 position 좌표값을 가져오는 함수입니다.
-
-        param index (int): 
-            __texts[index]를 통해 TextData 반환할 때 사용.
-
-        returns:
-            start_pos, end_pos:
-            사각형 그리기에 필요한 왼쪽 상단 좌표(start_pos)와 오른쪽 하단 좌표(end_pos).
+        warm_up: True면 OCR 모델을 백그라운드 스레드에서 미리 로드합니다.
+                 False면 첫 OCR 요청 시 로드합니다.
         """
-        print ('[DataManager] get_rectangle_position_by_texts_index() called...')
-        rectangle_position = self.get_text_by_index(index).get_position_info()
-        start_pos, end_pos = rectangle_position[0], rectangle_position[2]
-        return start_pos, end_pos
-
-class FaceData:
-    def __init__(self, name, position):
-        self.__name = name
-        self.__position = position
+        curr_path = os.getcwd()
+        default_image_path = curr_path + os.sep + "image"
+        DataManager.reset_work_folder(target_folder=default_image_path)
 
-    def get_name(self):
-        return self.__name
+        if warm_up:
+            DataManager.reader_pool.warm_up(DataManager.ocr_langs)
 
-    def get_position_info(self):
-        return self.__position
-    
-    def __str__(self):
-        return self.__name
+    @classmethod
+    def get_easyocr_reader(cls):
+        """현재 언어(ocr_langs)의 easyocr reader 반환, 처음이면 이 시점에 로드"""
+        return cls.reader_pool.get(cls.ocr_langs)
 
-class TextData:
-    def __init__(self, text, position):
-        self.__text = text
-        self.__tr_text = None
+    @classmethod
+    def set_ocr_langs(cls, langs):
         """
-        OCR return example: 
-            [
-                ([[24, 48], [345, 48], [345, 109], [24, 109]], '下载手机天猫APP', 0.8471784057548907), 
-                ([[24, 130], [368, 130], [368, 204], [24, 204]], '享388元礼包', 0.9837027854197318), 
-                ([[190, 306], [290, 306], [290, 336], [190, 336]], '立即扫码', 0.9933473467826843), 
-                ([[160, 348], [334, 348], [334, 372], [160, 372]], '下载手机天猫APP领福利', 0.858102917437849)
-            ]
-        position example: [[24, 48], [345, 48], [345, 109], [24, 109]]
+        OCR 언어 변경 (예: ['ch_sim','en'] -> ['ko','en'])
+        이전 언어의 reader는 풀에 남아 있어 되돌아갈 때 다시 로드하지 않습니다.
         """
-        self.__position_info = position  # Example: [[24, 48], [345, 48], [345, 109], [24, 109]]
-        
-    def set_tr_text_with_position(self, tr_text, position):
-        self.__tr_text = tr_text
-        self.__position_info = position
-    
-    def get_text(self):
-        return self.__text
-
-    def get_position_info(self):
-        return self.__position_info
-
-    def get_tr_text(self):
-        return self.__tr_text
-        
-    
-class DataManager:
-    folder_data = None
-    # no need to reset, reload
-    easyocr_reader = None
+        cls.ocr_langs = list(langs)
+        if cls.ocr_cache is not None:
+            cls.ocr_cache = OcrCache(cls.ocr_cache.get_result_cache(), cls.ocr_langs)
 
-    def init():
-        curr_path = os.getcwd()
-        default_image_path = curr_path + os.sep + "image"
-        DataManager.reset_work_folder(target_folder=default_image_path)
-
-        # this needs to run only once to load the model into memory
-        DataManager.easyocr_reader = easyocr.Reader(['ch_sim','en'])
-        
     @classmethod
     def get_work_file(cls):
         return DataManager.folder_data.get_work_file() 
@@ -200,114 +79,167 @@ class DataManager:
     @classmethod
     def set_work_file(cls, target_file):
         DataManager.folder_data.set_work_file(target_file)
+        cls.__prefetch_around(target_file)
         
     @classmethod
     def reset_work_folder(cls, target_folder='./image'):
-        print ('[DataManager.reset] reset, target=', target_folder)
+        log.info('reset_work_folder() : target=%s', target_folder)
+        cls.stop_watch()
         target_path = os.path.abspath(target_folder)
         cls.folder_data = FolderData(target_path)
+        cls.work_context = None
         cls.__init_output_folder(target_path)
+        cls.__prefetch_around(cls.get_work_file())
 
     @classmethod
-    def __init_output_folder(cls,target_folder):
-        print ('[DataManager] initOutputFiles() called...')
-        print ('[DataManager] initOutputFiles() : target_folder = ', target_folder)
+    def refresh_work_folder(cls):
+        """
+        작업 폴더를 다시 스캔해서 추가/삭제/수정된 파일만 반영합니다.
+        reset_work_folder와 달리 변경 없는 파일의 OCR/얼굴 결과는 유지됩니다.
 
-        output_folder = os.path.join(target_folder + os.sep + '__OUTPUT_FILES__')
-        print ('[DataManager] initOutputFiles() : output_folder = ', output_folder)
+        return:
+            FolderChanges: added, removed, modified 파일 경로 리스트
+        """
+        changes = cls.folder_data.refresh()
+        if not changes.is_empty():
+            log.info('refresh_work_folder() : added=%d, removed=%d, modified=%d',
+                     len(changes.added), len(changes.removed), len(changes.modified))
+        if changes.added:
+            cls.__init_output_folder(cls.folder_data.get_folder_path(), changes.added)
+        if cls.work_context is not None and cls.work_context.file_path in changes.modified:
+            cls.work_context = None
+        if cls.image_prefetcher is not None and not changes.is_empty():
+            # 수정된 파일의 이전 디코딩 결과를 버리고 다시 예약
+            cls.image_prefetcher.clear()
+            cls.__prefetch_around(cls.get_work_file())
+        return changes
+
+    @classmethod
+    def start_watch(cls, interval=2.0, on_change=None):
+        """
+        interval(초)마다 refresh_work_folder()를 호출하는 폴링 감시 시작
+        on_change: 변경분(FolderChanges)이 있을 때 감시 스레드에서 호출되는 콜백
+        """
+        cls.stop_watch()
+        cls.folder_watcher = FolderWatcher(cls.refresh_work_folder, on_change, interval)
+        cls.folder_watcher.start()
+
+    @classmethod
+    def stop_watch(cls):
+        if cls.folder_watcher is not None:
+            cls.folder_watcher.stop()
+            cls.folder_watcher = None
+
+    @classmethod
+    def __init_output_folder(cls, target_folder, src_files=None):
+        """
+        __OUTPUT_FILES__ 폴더를 준비합니다.
+        output_mode가 'lazy'(기본값)면 폴더만 만들고, 출력 파일은 처음 저장할 때 생성됩니다.
+        'link'면 reflink/hardlink, 'copy'면 기존처럼 원본을 복사해 둡니다.
+        """
+        log.debug('initOutputFiles() : target_folder=%s, mode=%s', target_folder, cls.output_mode)
 
-        # create output folder if not exist
-        if os.path.isdir(output_folder) == False:
-            os.makedirs(output_folder)
-            print ('[DataManager] initOutputFiles() : output_folder newly created!')
-        
         if target_folder == None or len(target_folder) == 0:
-            print ('[DataManager] initOutputFiles() : no source files!')
+            log.warning('initOutputFiles() : no source files!')
             return
-        
-        # copy files to output folder if source image file doesn't exist in output folder
-        target_images = [file_data.get_file_name() for file_data in cls.folder_data.get_files()]
-        for src_file in target_images:
-            src_file_name = os.path.basename(src_file)
-            out_file = os.path.join(target_folder, '__OUTPUT_FILES__', src_file_name)
-            if not os.path.isfile(out_file):
-                shutil.copy(src_file, out_file)
-                
-    
+
+        if src_files is not None:
+            target_images = src_files
+        else:
+            target_images = [file_data.get_file_name() for file_data in cls.folder_data.get_files()]
+        materialize_outputs(target_folder, target_images, cls.output_mode)
+
     @classmethod
     def get_output_file(cls):
-        print ('[DataManager] get_output_file() called...')
+        """
+        현재 작업 파일의 출력 파일 경로를 반환합니다.
+        아직 저장된 출력 파일이 없으면 원본 파일 경로를 반환합니다.
+        """
+        return resolve_output_file(cls.folder_data.get_work_file().get_file_name())
 
-        out_file_dir = cls.folder_data.get_folder_path()
-        out_file_name = os.path.basename(cls.folder_data.get_work_file().get_file_name())
-        out_file = os.path.join(out_file_dir, '__OUTPUT_FILES__', out_file_name)
-        
-        return out_file
-    
     @classmethod
     def save_output_file(cls, out_image):
-        print ('[DataManager] save_output_file() called...')
         src_file = cls.get_work_file().get_file_name()
-        
+
         # out_image는 PIL의 Image 객체
         if out_image is None:
-            print ('[DataManager] save_output_file() : image is None, it can not be saved!')
+            log.warning('save_output_file() : image is None, it can not be saved!')
+            return False
 
-        # out_file은 path
-        out_file = cls.get_output_file()
-        print ('[DataManager] save_output_file() : src_file=', src_file)
-        print ('[DataManager] save_output_file() : out_file=', out_file)
+        # out_file은 path - 출력 파일이 아직 없어도 __OUTPUT_FILES__ 안의 경로
+        out_file = get_output_path(src_file)
+        log.debug('save_output_file() : src_file=%s, out_file=%s', src_file, out_file)
 
-        if out_file is not None:
+        with metrics.span('save'):
             if out_file.lower().endswith(("png")) == False:
-                out_image.convert("RGB").save(out_file)
+                replace_output_file(out_file, out_image.convert("RGB").save)
             else:
-                out_image.save(out_file)
-            print('[DataManager] save_output_file(): Image saved successfully!')
-            return True
-        return False
+                replace_output_file(out_file, out_image.save)
+        log.info('save_output_file() : saved %s', out_file)
+        return True
 
     @classmethod
     def get_prev_file(cls):
-        img_file=DataManager.get_work_file()
-        print('[DataManager] getPrevImageFile() called!!...')
-        for i in range(len(cls.folder_data.get_files())):
-            print('[DataManager] getPrevImageFile() i=', i, cls.folder_data.get_files()[i].get_file_name())
-            if cls.folder_data.get_files()[i].get_file_name() == img_file.get_file_name():
-                if i != 0:
-                    print('[DataManager] getPrevImageFile() - image found : ', cls.folder_data.get_files()[i-1].get_file_name())
-                    cls.set_work_file(cls.folder_data.get_files()[i-1])
-                    return cls.folder_data.get_files()[i-1]
-                else:
-                    break
-        print('[DataManager] getPrevImageFile() - image not found!!')
-        return None
+        # 이전 파일을 구하고 작업 파일로 바꾸는 사이에 감시 스레드가 목록을 바꾸지 않도록 묶음
+        with cls.folder_data.get_lock():
+            prev_file = cls.folder_data.get_prev_file()
+            if prev_file is None:
+                log.debug('getPrevImageFile() - image not found!!')
+                return None
+            log.debug('getPrevImageFile() - image found : %s', prev_file.get_file_name())
+            metrics.count('navigate')
+            cls.set_work_file(prev_file)
+        return prev_file
 
     @classmethod
     def get_next_file(cls):
-        img_file=DataManager.get_work_file()
-        print ('[DataManager] getNextImageFile() called!!...')
-        for i in range(len(cls.folder_data.get_files())):
-            print ('[DataManager] getNextImageFile() i=', i, ', curr_file=', img_file, ', compare=', cls.folder_data.get_files()[i].get_file_name())
-            if cls.folder_data.get_files()[i].get_file_name() == img_file.get_file_name():
-                if (i+1) < len(cls.folder_data.get_files()):
-                    print ('[DataManager] getNextImageFile() - image found : ', cls.folder_data.get_files()[i+1].get_file_name())
-                    return cls.folder_data.get_files()[i+1]
-                else:
-                    break
-        print ('[DataManager] getNextImageFile() - image not found!!')
-        return None
+        next_file = cls.folder_data.get_next_file()
+        if next_file is None:
+            log.debug('getNextImageFile() - image not found!!')
+            return None
+        log.debug('getNextImageFile() - image found : %s', next_file.get_file_name())
+        metrics.count('navigate')
+        cls.__prefetch_around(next_file)
+        return next_file
 
     @classmethod
     def get_image_index(cls):
-        print ('[DataManager] get_image_index() called!!...')
-        img_file = cls.folder_data.get_work_file()
-        target_file = cls.folder_data.get_files()
-        
-        for i in range(len(target_file)):
-            if target_file[i] == img_file:
-                return i
-        return -1
+        return cls.folder_data.get_work_index()
+
+    @classmethod
+    def enable_prefetch(cls, radius=2):
+        """
+        작업 파일 앞뒤 radius개의 이미지를 백그라운드 스레드에서 미리 디코딩합니다.
+        디코딩된 이미지는 get_work_image()로 가져옵니다.
+        """
+        cls.disable_prefetch()
+        cls.image_prefetcher = ImagePrefetcher(radius)
+        cls.__prefetch_around(cls.get_work_file())
+
+    @classmethod
+    def disable_prefetch(cls):
+        if cls.image_prefetcher is not None:
+            cls.image_prefetcher.shutdown()
+            cls.image_prefetcher = None
+
+    @classmethod
+    def get_work_image(cls):
+        """
+        현재 작업 파일을 디코딩한 이미지(BGR ndarray)를 반환합니다.
+        prefetch가 켜져 있으면 미리 디코딩된 결과를 사용합니다.
+        공유 이미지 캐시의 읽기 전용 배열이므로 수정하려면 copy()해서 사용합니다.
+        """
+        img_file = cls.get_work_file().get_file_name()
+        if cls.image_prefetcher is None:
+            return get_image_cache().get(img_file)
+        return cls.image_prefetcher.get(img_file)
+
+    @classmethod
+    def __prefetch_around(cls, file_data):
+        if cls.image_prefetcher is None or file_data is None:
+            return
+        center = cls.folder_data.get_index_of(file_data)
+        cls.image_prefetcher.prefetch(cls.folder_data.get_files(), center, key=FileData.get_file_name)
 
     @classmethod
     def get_texts_from_image(cls):
@@ -320,30 +252,169 @@ class DataManager:
         return: 
             list: OCR 결과로 추출된 텍스트 리스트를 리턴. 
         """
-        print ('[DataManager] get_texts_from_image() called!!...')
-        
-        # 확장자 포함 path 값
-        img_file = cls.folder_data.get_work_file().get_file_name()
         # 현재 작업 이미지 FileData 객체
-        file_index = cls.get_image_index()
-        work_file = cls.folder_data.get_file_by_index(file_index)
+        work_file = cls.folder_data.get_work_file()
+        # 확장자 포함 path 값
+        img_file = work_file.get_file_name()
         ocr_executed_texts_list = []
 
         if work_file.is_ocr_executed():
-            print('[DataManager] get_texts_from_image() called!!... 이미 읽은 데이터입니다.')
+            log.debug('get_texts_from_image() : 이미 읽은 데이터입니다.')
+            metrics.count('ocr.reuse')
             ocr_executed_texts_list = work_file.get_texts_as_string()
     
             return ocr_executed_texts_list
         
-        # easyocr을 통해 읽은 text를 저장
-        ocr_texts = cls.easyocr_reader.readtext(img_file)
-        DataManager.folder_data.get_work_file().set_texts(ocr_texts)
+        # 캐시에 없으면 easyocr을 통해 읽은 text를 저장
+        ocr_texts = cls.ocr_cache.get(img_file) if cls.ocr_cache is not None else None
+        if ocr_texts is None:
+            start = time.perf_counter()
+            # 작업 이미지 컨텍스트의 RGB plane 을 넘겨 easyocr 가 다시 디코딩하지 않게 함
+            # (easyocr 는 경로를 RGB 로 읽고 배열은 그대로 쓰므로 경로를 넘길 때와 같은 RGB 순서여야 함)
+            try:
+                img = cls.get_work_context().get_rgb()
+            except FileNotFoundError:
+                img = img_file
+            reader = cls.get_easyocr_reader()
+            with metrics.span('ocr'):
+                ocr_texts = reader.readtext(img)
+            if cls.ocr_cache is not None:
+                cls.ocr_cache.put(img_file, ocr_texts, time.perf_counter() - start)
+        else:
+            log.debug('get_texts_from_image() : OCR 캐시 사용')
+            metrics.count('ocr.cache_hit')
+        work_file.set_texts(ocr_texts)
 
         ocr_executed_texts_list = work_file.get_texts_as_string()
         
         # can not read texts in image
         if len(ocr_executed_texts_list) == 0:
+            from tkinter import messagebox as mb
             mb.showwarning("경고", "text를 찾을 수 없습니다.")
             return None
 
-        return ocr_executed_texts_list
\ No newline at end of file
+        return ocr_executed_texts_list
+
+    @classmethod
+    def get_work_context(cls):
+        """
+        현재 작업 이미지의 ImageContext 반환 (작업 파일이 바뀌면 새로 만듦)
+        OCR / 얼굴 검출(PrepareImage(path, context)) / 이진화가 같은 plane 을 한 번만 계산하도록 공유합니다.
+        """
+        img_file = cls.folder_data.get_work_file().get_file_name()
+        if cls.work_context is None or cls.work_context.file_path != img_file:
+            cls.work_context = ImageContext(img_file)
+        return cls.work_context
+
+    @classmethod
+    def enable_ocr_cache(cls, cache_path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        OCR 결과를 SQLite 파일에 영구 저장합니다.
+        키는 이미지 내용 해시 + reader 언어 + readtext 파라미터이며,
+        get_texts_from_image()와 run_batch_ocr()가 모델 호출 전에 먼저 확인합니다.
+        """
+        cls.ocr_cache = OcrCache(cls.__get_result_cache(cache_path, max_bytes), cls.ocr_langs)
+
+    @classmethod
+    def enable_face_cache(cls, cache_path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, **detect_kwargs):
+        """
+        얼굴 검출 결과를 SQLite 파일에 영구 저장합니다. (OCR 캐시와 같은 파일/용량 한도 공유)
+        키는 이미지 내용 해시 + cascade 파일 + scaleFactor/minNeighbors/축소 상한이며,
+        run_batch_face_detection()은 캐시에 있는 이미지를 해시 확인만 하고 건너뜁니다.
+
+        param detect_kwargs: FaceCache 검출 파라미터 (scale_factor, min_neighbors, max_side, min_face_size 등)
+        """
+        cls.face_cache = FaceCache(cls.__get_result_cache(cache_path, max_bytes), **detect_kwargs)
+
+    @classmethod
+    def get_face_cache_stats(cls):
+        """CacheStats(hits, misses, stores, evictions, saved_seconds) 반환, 캐시가 없으면 None"""
+        if cls.face_cache is None:
+            return None
+        return cls.face_cache.get_stats()
+
+    @classmethod
+    def __get_result_cache(cls, cache_path, max_bytes):
+        if cls.result_cache is None:
+            cls.result_cache = ResultCache(cache_path, max_bytes)
+        return cls.result_cache
+
+    @classmethod
+    def get_ocr_cache_stats(cls):
+        """CacheStats(hits, misses, stores, evictions, saved_seconds) 반환, 캐시가 없으면 None"""
+        if cls.ocr_cache is None:
+            return None
+        return cls.ocr_cache.get_stats()
+
+    @classmethod
+    def get_image_cache_stats(cls):
+        """공유 이미지 캐시 통계 (hits, misses, evictions, decode_seconds, saved_seconds, bytes, entries)"""
+        return get_image_cache().get_stats()
+
+    @classmethod
+    def enable_metrics(cls, dump_path=None, fmt=None):
+        """
+        scan / decode / OCR / 얼굴 검출 / save 구간의 소요 시간과 카운터를 모읍니다.
+        dump_path를 주면 종료 시 JSON(.json) 또는 Prometheus text(.prom)로 저장합니다.
+        환경 변수 OPENCV_FLOW_METRICS=<경로> 로도 켤 수 있습니다.
+
+        return:
+            Metrics: to_json(), to_prometheus(), dump(path)로 현재 값을 꺼낼 수 있음
+        """
+        return metrics.enable(dump_path, fmt)
+
+    @classmethod
+    def get_metrics(cls):
+        """켜져 있으면 Metrics, 아니면 None"""
+        return metrics.get_metrics()
+
+    @classmethod
+    def run_batch_ocr(cls, workers=2, batch_size=8, on_progress=None):
+        """
+        작업 폴더에서 아직 OCR이 실행되지 않은 모든 파일을 일괄 처리합니다.
+        같은 크기의 이미지끼리 묶어 인식하고, 결과는 FileData.set_texts()로 저장합니다.
+        다른 스레드에서 cancel_batch_ocr()를 호출하면 현재 배치가 끝난 뒤 중단됩니다.
+
+        param workers: 이미지 디코딩/인식 작업 스레드 수 (easyocr reader는 공유)
+        param batch_size: 한 번에 인식할 이미지 수
+        param on_progress: (done, total, images_per_sec)를 받는 콜백
+
+        return:
+            BatchOcrReport: total, processed, failed, elapsed, cancelled, images_per_sec
+        """
+        cls.batch_ocr = BatchOcr(cls.get_easyocr_reader(), workers=workers, batch_size=batch_size, cache=cls.ocr_cache)
+        with metrics.span('ocr.batch_run'):
+            report = cls.batch_ocr.run(cls.folder_data.get_files(), on_progress)
+        log.info('run_batch_ocr() : processed=%d, cache_hits=%d, failed=%d, images/sec=%.2f, cancelled=%s',
+                 report.processed, report.cache_hits, report.failed, report.images_per_sec, report.cancelled)
+        return report
+
+    @classmethod
+    def cancel_batch_ocr(cls):
+        if cls.batch_ocr is not None:
+            cls.batch_ocr.cancel()
+
+    @classmethod
+    def run_batch_face_detection(cls, workers=None, on_progress=None):
+        """
+        작업 폴더의 모든 파일에 대해 얼굴 검출을 CPU 코어 수만큼의 프로세스로 병렬 실행합니다.
+        결과는 끝나는 순서대로 FileData.set_faces()로 저장됩니다.
+        enable_face_cache()로 캐시를 켜 두면 이미 검출한 이미지는 다시 검출하지 않습니다.
+
+        param workers: 프로세스 수 (기본값: CPU 코어 수)
+        param on_progress: (done, total, images_per_sec)를 받는 콜백
+
+        return:
+            BatchFaceReport: total, processed, failed, elapsed, cancelled, cache_hits, images_per_sec
+        """
+        cls.batch_face_detection = BatchFaceDetection(workers, cache=cls.face_cache)
+        with metrics.span('face_detection.batch_run'):
+            report = cls.batch_face_detection.run(cls.folder_data, on_progress)
+        log.info('run_batch_face_detection() : processed=%d, cache_hits=%d, failed=%d, images/sec=%.2f, cancelled=%s',
+                 report.processed, report.cache_hits, report.failed, report.images_per_sec, report.cancelled)
+        return report
+
+    @classmethod
+    def cancel_batch_face_detection(cls):
+        if cls.batch_face_detection is not None:
+            cls.batch_face_detection.cancel()
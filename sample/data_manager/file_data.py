@@ -3,24 +3,35 @@
 FileData 클래스
 - 이미지 파일 1개에 대한 정보 저장 (OCR 결과, 얼굴 인식 결과 등)
 - OCR 처리 여부 및 텍스트, 얼굴 데이터 관리
+- OCR 결과는 TextBoxes(열 단위 배열)로 저장하고, TextData 형식 API 는 뷰로 제공
 """
 import numpy
-from .text_data import TextData
+from .text_boxes import TextBoxes
 from .face_data import FaceData
+from .spatial_index import SpatialIndex, rects_to_bounds
 
 
 class FileData:
     def __init__(self, file):
         self.__name = file
-        self.__texts = []
+        self.__texts = TextBoxes()
         self.__is_ocr_executed = False
         self.__faces = None
+        self.__face_index = None
 
     def get_file_name(self):
         return self.__name
 
     def clear_faces(self):
         self.__faces = None
+        self.__face_index = None
+
+    def clear_results(self):
+        """파일이 바뀌었을 때 OCR/얼굴 인식 결과를 비워 다시 처리되도록 함"""
+        self.__texts = TextBoxes()
+        self.__is_ocr_executed = False
+        self.__faces = None
+        self.__face_index = None
 
     def get_faces(self):
         return self.__faces
@@ -40,37 +51,74 @@ class FileData:
             self.__faces = [
                 FaceData(f"얼굴-{i+1:04d}", p) for i, p in enumerate(positions)
             ]
+            self.__face_index = None
 
     def is_ocr_executed(self):
         return self.__is_ocr_executed
 
     def set_texts(self, ocr_texts):
         """
-        OCR 결과 리스트를 받아 TextData 리스트로 저장
+        OCR 결과 리스트를 받아 TextBoxes 로 저장 (confidence 포함)
         param ocr_texts: List[Tuple[polygon, text, conf]]
         """
-        self.__texts = [TextData(t[1], t[0]) for t in ocr_texts]
+        self.__texts = TextBoxes.from_ocr(ocr_texts)
         self.__is_ocr_executed = True
 
-    def get_texts(self):
+    def get_text_boxes(self):
+        """열 단위 OCR 결과(TextBoxes) 반환 - 신뢰도/영역 검색 등 벡터 연산용"""
         return self.__texts
 
+    def get_texts(self):
+        """TextData 와 같은 인터페이스의 TextBoxView 리스트 반환"""
+        return self.__texts.get_views()
+
     def get_text_by_index(self, index):
-        return self.__texts[index]
+        return self.__texts.get_view(index)
 
     def get_texts_as_string(self):
-        return [t.get_text() for t in self.__texts]
+        return self.__texts.get_texts()
+
+    def get_confidences(self):
+        return self.__texts.get_confidences()
 
     def get_positions_as_string(self):
-        return [t.get_position_info() for t in self.__texts]
+        return self.__texts.get_polygons().tolist()
 
     def get_text_as_string_by_index(self, index):
-        return self.get_texts_as_string()[index]
+        return self.__texts.get_text(index)
 
     def get_rectangle_position_by_texts_index(self, index):
         """
         OCR 텍스트 위치에서 좌측상단과 우측하단 좌표 반환
         return: (start_pos, end_pos)
         """
-        rect = self.get_text_by_index(index).get_position_info()
-        return rect[0], rect[2]
+        rect = self.__texts.get_polygons()[index]
+        return rect[0].tolist(), rect[2].tolist()
+
+    def get_face_index(self):
+        """얼굴 사각형으로 만든 SpatialIndex - 처음 검색할 때 생성, set_faces/clear_faces 시 초기화"""
+        if self.__face_index is None:
+            positions = [f.get_position_info() for f in self.__faces or []]
+            self.__face_index = SpatialIndex(rects_to_bounds(positions))
+        return self.__face_index
+
+    def find_texts_at(self, x, y):
+        """(x, y) 를 포함하는 OCR 박스 인덱스 배열 (클릭 위치 검색용)"""
+        return self.__texts.get_spatial_index().query_point(x, y)
+
+    def find_faces_at(self, x, y):
+        """(x, y) 를 포함하는 얼굴 인덱스 배열"""
+        return self.get_face_index().query_point(x, y)
+
+    def find_texts_in_rect(self, x_min, y_min, x_max, y_max, contained=False):
+        return self.__texts.get_spatial_index().query_rect(x_min, y_min, x_max, y_max, contained)
+
+    def find_faces_in_rect(self, x_min, y_min, x_max, y_max, contained=False):
+        return self.get_face_index().query_rect(x_min, y_min, x_max, y_max, contained)
+
+    def get_text_face_overlaps(self):
+        """겹치는 (OCR 박스 인덱스, 얼굴 인덱스) 쌍 리스트"""
+        if not self.__faces or len(self.__texts) == 0:
+            return []
+        face_bounds = rects_to_bounds([f.get_position_info() for f in self.__faces])
+        return self.__texts.get_spatial_index().query_overlaps(face_bounds)
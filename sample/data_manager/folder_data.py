@@ -3,9 +3,12 @@
 FolderData 클래스
 - 주어진 폴더에서 이미지 파일 목록을 수집하고, 각 파일을 FileData 객체로 관리
 - 작업 대상 파일(work_file)을 설정
+- refresh() 는 감시 스레드(FolderWatcher)에서, 이동은 UI 스레드에서 호출되므로 목록 / 커서는 잠금 안에서만 변경
+  (다음 파일을 구해서 작업 파일로 바꾸는 등 여러 호출을 묶을 때는 get_lock() 사용)
 """
-import glob
-import os
+import threading
+
+from src.files.folder_index import FolderIndex
 from .file_data import FileData
 
 class FolderData:
@@ -13,16 +16,61 @@ class FolderData:
         self.__folder = path
         self.__files = []
         self.__work_file = None
+        self.__cursor = -1          # work_file 의 인덱스
+        self.__positions = {}       # 파일 경로 -> 인덱스
+        self.__lock = threading.RLock()
+        self.__refresh_lock = threading.Lock()
+        self.__index = FolderIndex(path)
         self.__init_work_folder()
 
     def __init_work_folder(self):
-        FILE_EXT = ['png', 'jpg', 'gif']
-        target_files = []
-        [target_files.extend(glob.glob(self.__folder + '/' + '*.' + e)) for e in FILE_EXT]
-        self.__files = [FileData(f) for f in target_files]
+        self.__files = [FileData(e.path) for e in self.__index.scan()]
+        self.__update_positions()
 
         if self.__files:
-            self.__work_file = self.__files[0]
+            self.set_work_file(self.__files[0])
+
+    def __update_positions(self):
+        self.__positions = {f.get_file_name(): i for i, f in enumerate(self.__files)}
+
+    def refresh(self):
+        """
+        폴더를 다시 스캔해서 변경분만 반영
+        - 변경 없는 파일은 기존 FileData(OCR/얼굴 결과 포함)를 그대로 유지
+        - 수정된 파일은 결과를 비워 다시 처리되도록 함
+        return: FolderChanges(added, removed, modified)
+        """
+        # 디스크 스캔은 이동을 막지 않도록 목록 잠금 밖에서 (refresh 끼리는 순서대로)
+        with self.__refresh_lock:
+            changes = self.__index.refresh()
+            if changes.is_empty():
+                return changes
+            with self.__lock:
+                self.__apply_changes(changes)
+            return changes
+
+    def __apply_changes(self, changes):
+        by_name = {f.get_file_name(): f for f in self.__files}
+        for path in changes.modified:
+            if path in by_name:
+                by_name[path].clear_results()
+
+        self.__files = [by_name.get(e.path) or FileData(e.path) for e in self.__index.get_entries()]
+        self.__update_positions()
+
+        # 작업 파일이 삭제되었으면 같은 위치의 파일로 이동
+        if self.__work_file is None or self.__work_file.get_file_name() in changes.removed:
+            old_pos = max(self.__cursor, 0)
+            self.__work_file = None
+            self.__cursor = -1
+            if self.__files:
+                self.set_work_file(self.__files[min(old_pos, len(self.__files) - 1)])
+        else:
+            self.__cursor = self.get_index_of(self.__work_file)
+
+    def get_lock(self):
+        """목록 / 작업 파일을 바꾸지 못하게 막는 잠금 (RLock, with 문으로 사용)"""
+        return self.__lock
 
     def get_work_file(self):
         """현재 작업 대상 파일 반환"""
@@ -30,7 +78,34 @@ class FolderData:
 
     def set_work_file(self, target_file):
         """작업 대상 파일 변경"""
-        self.__work_file = target_file
+        with self.__lock:
+            self.__work_file = target_file
+            self.__cursor = self.get_index_of(target_file)
+
+    def get_work_index(self):
+        """현재 작업 파일의 인덱스 반환, 없으면 -1"""
+        return self.__cursor
+
+    def get_index_of(self, file_data):
+        """FileData 의 인덱스를 O(1)로 반환, 목록에 없으면 -1"""
+        if file_data is None:
+            return -1
+        with self.__lock:
+            return self.__positions.get(file_data.get_file_name(), -1)
+
+    def get_next_file(self):
+        """작업 파일 다음 FileData 반환 (작업 파일은 바꾸지 않음), 없으면 None"""
+        with self.__lock:
+            if self.__cursor < 0 or self.__cursor + 1 >= len(self.__files):
+                return None
+            return self.__files[self.__cursor + 1]
+
+    def get_prev_file(self):
+        """작업 파일 이전 FileData 반환 (작업 파일은 바꾸지 않음), 없으면 None"""
+        with self.__lock:
+            if self.__cursor <= 0:
+                return None
+            return self.__files[self.__cursor - 1]
 
     def get_files(self):
         """모든 FileData 리스트 반환"""
@@ -44,6 +119,10 @@ class FolderData:
         """파일 이름 리스트 반환"""
         return [f.get_file_name() for f in self.__files]
 
+    def get_folder_index(self):
+        """폴더 인덱스(FolderIndex) 반환"""
+        return self.__index
+
     def get_folder_path(self):
         """작업 폴더 경로 반환"""
         return self.__folder
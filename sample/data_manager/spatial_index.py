@@ -0,0 +1,126 @@
+# data_manager/spatial_index.py
+"""
+SpatialIndex 클래스
+- 사각형(x_min, y_min, x_max, y_max) 목록에 대한 균일 격자(uniform grid) 인덱스
+- 점/사각형/겹침 검색을 전체 순회 없이 주변 격자 칸의 후보만 검사
+- 격자는 비어있지 않은 칸만 정렬된 배열(CSR)로 저장해 이미지 크기와 무관하게 작음
+- MAX_ITEM_CELLS 칸보다 많이 걸치는 큰 항목은 격자에 넣지 않고 따로 모아 매번 직접 검사
+  (작은 항목 사이에 큰 항목 하나가 있어도 격자 크기가 폭증하지 않도록)
+"""
+import numpy as np
+
+# 항목 하나가 격자에 들어갈 수 있는 최대 칸 수 (넘으면 큰 항목 목록으로)
+MAX_ITEM_CELLS = 64
+
+
+def rects_to_bounds(rects):
+    """(x, y, w, h) 배열을 (x_min, y_min, x_max, y_max) 배열로 변환"""
+    rects = np.asarray(rects, np.int64).reshape(-1, 4)
+    return np.concatenate([rects[:, :2], rects[:, :2] + rects[:, 2:]], axis=1)
+
+
+class SpatialIndex:
+    def __init__(self, bounds, cell_size: int = None):
+        """
+        param bounds: (N, 4) 배열 - 항목별 x_min, y_min, x_max, y_max
+        param cell_size: 격자 한 칸 크기(px), None 이면 항목 크기의 중앙값 사용
+        """
+        self.__bounds = np.asarray(bounds, np.int64).reshape(-1, 4)
+        n = len(self.__bounds)
+        if cell_size is None:
+            if n:
+                sizes = np.maximum(self.__bounds[:, 2] - self.__bounds[:, 0], self.__bounds[:, 3] - self.__bounds[:, 1])
+                cell_size = int(np.median(sizes))
+            else:
+                cell_size = 1
+        self.__cell = max(1, cell_size)
+        self.__origin = self.__bounds[:, :2].min(axis=0) if n else np.zeros(2, np.int64)
+        self.__grid_w = 1
+        if n:
+            self.__grid_w = int((self.__bounds[:, 2].max() - self.__origin[0]) // self.__cell) + 1
+        self.__build()
+
+    def __len__(self):
+        return len(self.__bounds)
+
+    def __cell_range(self, x_min, y_min, x_max, y_max):
+        cx0 = (x_min - self.__origin[0]) // self.__cell
+        cy0 = (y_min - self.__origin[1]) // self.__cell
+        cx1 = (x_max - self.__origin[0]) // self.__cell
+        cy1 = (y_max - self.__origin[1]) // self.__cell
+        return cx0, cy0, cx1, cy1
+
+    def __build(self):
+        b = self.__bounds
+        self.__cell_ids = np.zeros(0, np.int64)
+        self.__items = np.zeros(0, np.int64)
+        self.__large = np.zeros(0, np.int64)
+        if len(b) == 0:
+            return
+        cx0, cy0, cx1, cy1 = self.__cell_range(b[:, 0], b[:, 1], b[:, 2], b[:, 3])
+        span_x = cx1 - cx0 + 1
+        counts = span_x * (cy1 - cy0 + 1)
+
+        large = counts > MAX_ITEM_CELLS
+        self.__large = np.flatnonzero(large)
+        small = np.flatnonzero(~large)
+        if len(small) == 0:
+            return
+        cx0, cy0, span_x, counts = cx0[small], cy0[small], span_x[small], counts[small]
+
+        # 항목이 걸치는 모든 칸에 대해 (칸 번호, 항목 번호) 쌍을 벡터 연산으로 생성
+        items = np.repeat(small, counts)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        local = np.arange(counts.sum()) - starts
+        sx = np.repeat(span_x, counts)
+        cells = (np.repeat(cy0, counts) + local // sx) * self.__grid_w + np.repeat(cx0, counts) + local % sx
+
+        order = np.argsort(cells, kind='stable')
+        self.__cell_ids = cells[order]
+        self.__items = items[order]
+
+    def __candidates(self, x_min, y_min, x_max, y_max):
+        found = [self.__large] if len(self.__large) else []
+        cx0, cy0, cx1, cy1 = self.__cell_range(x_min, y_min, x_max, y_max)
+        cx0 = max(cx0, 0)
+        cx1 = min(cx1, self.__grid_w - 1)
+        cy0 = max(cy0, 0)
+        if cx0 <= cx1 and len(self.__cell_ids):
+            cy1 = min(cy1, self.__cell_ids[-1] // self.__grid_w)
+            for cy in range(cy0, cy1 + 1):
+                lo = np.searchsorted(self.__cell_ids, cy * self.__grid_w + cx0, 'left')
+                hi = np.searchsorted(self.__cell_ids, cy * self.__grid_w + cx1, 'right')
+                if hi > lo:
+                    found.append(self.__items[lo:hi])
+        if not found:
+            return np.zeros(0, np.int64)
+        return np.unique(np.concatenate(found))
+
+    def query_point(self, x, y):
+        """(x, y) 를 포함하는 항목 인덱스 배열"""
+        cand = self.__candidates(x, y, x, y)
+        b = self.__bounds[cand]
+        return cand[(b[:, 0] <= x) & (b[:, 1] <= y) & (b[:, 2] >= x) & (b[:, 3] >= y)]
+
+    def query_rect(self, x_min, y_min, x_max, y_max, contained=False):
+        """
+        사각형과 겹치는 항목 인덱스 배열
+        param contained: True 면 사각형 안에 완전히 들어있는 항목만 반환
+        """
+        cand = self.__candidates(x_min, y_min, x_max, y_max)
+        b = self.__bounds[cand]
+        if contained:
+            mask = (b[:, 0] >= x_min) & (b[:, 1] >= y_min) & (b[:, 2] <= x_max) & (b[:, 3] <= y_max)
+        else:
+            mask = (b[:, 0] <= x_max) & (b[:, 1] <= y_max) & (b[:, 2] >= x_min) & (b[:, 3] >= y_min)
+        return cand[mask]
+
+    def query_overlaps(self, bounds):
+        """
+        다른 사각형 목록과 겹치는 (이 인덱스의 항목, bounds 의 항목) 쌍 리스트
+        param bounds: (M, 4) 배열 - x_min, y_min, x_max, y_max
+        """
+        pairs = []
+        for j, (x_min, y_min, x_max, y_max) in enumerate(np.asarray(bounds, np.int64).reshape(-1, 4)):
+            pairs.extend((int(i), j) for i in self.query_rect(x_min, y_min, x_max, y_max))
+        return pairs
@@ -0,0 +1,146 @@
+# data_manager/text_boxes.py
+"""
+TextBoxes 클래스
+- 이미지 1개의 OCR 결과를 열(column) 단위 배열로 저장
+  polygons: (N, 4, 2) int32, confidences: (N,) float32, 텍스트: 문자열 하나 + 오프셋 배열
+- 박스마다 파이썬 객체를 만들지 않아 박스가 많은 문서에서 메모리 사용량이 작음
+- 신뢰도/영역 조건 검색을 벡터 연산으로 처리
+TextBoxView 클래스
+- TextBoxes 의 i번째 박스를 TextData 와 같은 인터페이스로 보여주는 얇은 뷰
+"""
+import numpy as np
+from .spatial_index import SpatialIndex
+
+
+class TextBoxes:
+    def __init__(self, polygons=None, confidences=None, texts=()):
+        """
+        param polygons: (N, 4, 2) 좌표 배열
+        param confidences: (N,) 신뢰도 배열
+        param texts: N개의 문자열
+        """
+        texts = list(texts)
+        n = len(texts)
+        if polygons is None:
+            polygons = np.zeros((n, 4, 2), np.int32)
+        if confidences is None:
+            confidences = np.ones(n, np.float32)
+        self.__polygons = np.asarray(polygons, np.int32).reshape(n, 4, 2)
+        self.__confidences = np.asarray(confidences, np.float32).reshape(n)
+        self.__packed = ''.join(texts)
+        self.__offsets = np.zeros(n + 1, np.int64)
+        np.cumsum(np.fromiter((len(t) for t in texts), np.int64, n), out=self.__offsets[1:])
+        self.__tr_texts = {}    # index -> 번역 텍스트 (번역된 박스만 저장)
+        self.__bounds = None
+        self.__spatial_index = None
+
+    @classmethod
+    def from_ocr(cls, ocr_texts):
+        """
+        easyocr readtext 결과로 생성
+        param ocr_texts: [(polygon, text, confidence), ...]
+        """
+        if len(ocr_texts) == 0:
+            return cls()
+        polygons = np.rint(np.asarray([t[0] for t in ocr_texts], np.float64))
+        confidences = [t[2] if len(t) > 2 else 1.0 for t in ocr_texts]
+        return cls(polygons, confidences, [t[1] for t in ocr_texts])
+
+    def __len__(self):
+        return len(self.__confidences)
+
+    def get_polygons(self):
+        return self.__polygons
+
+    def get_confidences(self):
+        return self.__confidences
+
+    def get_text(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('text index out of range')
+        return self.__packed[self.__offsets[index]:self.__offsets[index + 1]]
+
+    def get_texts(self):
+        offsets = self.__offsets.tolist()
+        return [self.__packed[offsets[i]:offsets[i + 1]] for i in range(len(self))]
+
+    def get_position(self, index):
+        """[[x1, y1], ..., [x4, y4]] 형태의 리스트로 반환 (TextData 와 같은 형식)"""
+        return self.__polygons[index].tolist()
+
+    def get_tr_text(self, index):
+        return self.__tr_texts.get(index)
+
+    def set_tr_text_with_position(self, index, tr_text, position):
+        self.__tr_texts[index] = tr_text
+        self.__polygons[index] = np.asarray(position, np.int32).reshape(4, 2)
+        self.__bounds = None
+        self.__spatial_index = None
+
+    def get_bounds(self):
+        """(N, 4) 배열: 박스별 x_min, y_min, x_max, y_max"""
+        if self.__bounds is None:
+            if len(self) == 0:
+                self.__bounds = np.zeros((0, 4), np.int32)
+            else:
+                self.__bounds = np.concatenate([self.__polygons.min(axis=1), self.__polygons.max(axis=1)], axis=1)
+        return self.__bounds
+
+    def get_spatial_index(self):
+        """박스 경계로 만든 SpatialIndex - 처음 검색할 때 생성"""
+        if self.__spatial_index is None:
+            self.__spatial_index = SpatialIndex(self.get_bounds())
+        return self.__spatial_index
+
+    def indices_above(self, threshold: float):
+        """신뢰도가 threshold 이상인 박스 인덱스 배열"""
+        return np.flatnonzero(self.__confidences >= threshold)
+
+    def indices_in_rect(self, x_min, y_min, x_max, y_max, contained=True):
+        """
+        사각형 영역에 들어있는 박스 인덱스 배열
+        param contained: True 면 박스 전체가 영역 안에 있어야 함, False 면 겹치기만 해도 포함
+        """
+        b = self.get_bounds()
+        if contained:
+            mask = (b[:, 0] >= x_min) & (b[:, 1] >= y_min) & (b[:, 2] <= x_max) & (b[:, 3] <= y_max)
+        else:
+            mask = (b[:, 0] <= x_max) & (b[:, 1] <= y_max) & (b[:, 2] >= x_min) & (b[:, 3] >= y_min)
+        return np.flatnonzero(mask)
+
+    def get_view(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('text index out of range')
+        return TextBoxView(self, index)
+
+    def get_views(self):
+        return [TextBoxView(self, i) for i in range(len(self))]
+
+
+class TextBoxView:
+    def __init__(self, boxes: TextBoxes, index: int):
+        self.__boxes = boxes
+        self.__index = index
+
+    def get_index(self):
+        return self.__index
+
+    def get_text(self):
+        return self.__boxes.get_text(self.__index)
+
+    def get_position_info(self):
+        return self.__boxes.get_position(self.__index)
+
+    def get_confidence(self):
+        return float(self.__boxes.get_confidences()[self.__index])
+
+    def get_tr_text(self):
+        return self.__boxes.get_tr_text(self.__index)
+
+    def set_tr_text_with_position(self, tr_text, position):
+        """번역 텍스트 및 위치 정보 설정"""
+        self.__boxes.set_tr_text_with_position(self.__index, tr_text, position)
@@ -0,0 +1,157 @@
+# cache/image_cache.py
+"""
+ImageCache 클래스
+- 프로세스 전체에서 공유하는 디코딩된 이미지 캐시 (OCR / 얼굴 검출 / 전처리가 함께 사용)
+- 키: 파일 경로 + mtime (파일이 바뀌면 자동으로 새로 디코딩)
+- 바이트 한도 기반 LRU, 회색조 등 파생 이미지(plane)도 같은 한도 안에서 보관
+- 캐시된 배열은 읽기 전용이므로, 그림을 그리는 등 수정이 필요하면 copy() 해서 사용
+- 통계: hit/miss, 디코딩에 쓴 시간, hit 으로 아낀 시간
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+import cv2
+
+from src.metrics import metrics
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# 파생 이미지 이름 -> 원본(BGR)에서 만드는 함수
+PLANES = {
+    'gray': lambda img: cv2.cvtColor(img, cv2.COLOR_BGR2GRAY),
+    'rgb': lambda img: cv2.cvtColor(img, cv2.COLOR_BGR2RGB),
+}
+
+
+class ImageCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    decode_seconds: float
+    saved_seconds: float
+    bytes: int
+    entries: int
+
+
+class ImageCache:
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, loader=None):
+        """
+        param max_bytes: 보관할 이미지 배열 전체 크기 한도
+        param loader: (경로, flags) 를 받아 이미지를 반환하는 함수 (기본값 cv2.imread)
+        """
+        self.__max_bytes = max_bytes
+        self.__loader = loader or cv2.imread
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()  # 키 -> (배열, 만드는 데 걸린 시간)
+        self.__bytes = 0
+        self.__stats = [0, 0, 0, 0.0, 0.0]  # hits, misses, evictions, decode_seconds, saved_seconds
+
+    def set_max_bytes(self, max_bytes: int):
+        with self.__lock:
+            self.__max_bytes = max_bytes
+            self.__evict()
+
+    def get(self, path, flags: int = cv2.IMREAD_COLOR):
+        """디코딩된 이미지(읽기 전용) 반환, 파일을 읽을 수 없으면 None"""
+        path = os.fspath(path)
+        key = self.__make_key(path, ('decode', flags))
+        if key is None:
+            return None
+        return self.__get_or_create(key, lambda: self.__loader(path, flags))
+
+    def get_plane(self, path, name: str):
+        """
+        파생 이미지 반환 (예: 'gray'), 원본 디코딩 결과도 캐시를 거침
+        (원본 디코딩은 get() 의 항목으로 따로 집계하고, plane 에는 변환 시간만 기록)
+        param name: PLANES 에 등록된 이름
+        """
+        path = os.fspath(path)
+        key = self.__make_key(path, ('plane', name))
+        if key is None:
+            return None
+        return self.__get_or_create(key, PLANES[name], source=lambda: self.get(path))
+
+    def invalidate(self, path=None):
+        """path 의 항목(파생 이미지 포함)을 제거, path 가 None 이면 전체 제거"""
+        with self.__lock:
+            if path is None:
+                self.__entries.clear()
+                self.__bytes = 0
+                return
+            path = os.path.abspath(os.fspath(path))
+            for key in [k for k in self.__entries if k[0] == path]:
+                self.__bytes -= self.__entries.pop(key)[0].nbytes
+
+    def get_stats(self) -> ImageCacheStats:
+        with self.__lock:
+            return ImageCacheStats(*self.__stats, self.__bytes, len(self.__entries))
+
+    def __make_key(self, path, kind):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size, kind)
+
+    def __get_or_create(self, key, create, source=None):
+        """
+        param create: 항목을 만드는 함수 (source 가 있으면 그 결과를 인자로 받음)
+        param source: 시간 측정 전에 준비할 입력을 반환하는 함수 (None 을 반환하면 만들지 않음)
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+                self.__stats[0] += 1
+                self.__stats[4] += entry[1]
+                metrics.count('image_cache.hit')
+                return entry[0]
+            self.__stats[1] += 1
+        metrics.count('image_cache.miss')
+
+        args = ()
+        if source is not None:
+            src = source()
+            if src is None:
+                return None
+            args = (src,)
+
+        # 디코딩은 잠금 밖에서 (다른 스레드의 hit 을 막지 않도록)
+        start = time.perf_counter()
+        img = create(*args)
+        elapsed = time.perf_counter() - start
+        # 원본 디코딩과 파생 이미지(plane) 계산을 구분해서 기록
+        metrics.observe('decode' if key[3][0] == 'decode' else 'decode.plane', elapsed)
+        if img is None:
+            return None
+        img.flags.writeable = False
+
+        with self.__lock:
+            self.__stats[3] += elapsed
+            if key not in self.__entries and img.nbytes <= self.__max_bytes:
+                self.__entries[key] = (img, elapsed)
+                self.__bytes += img.nbytes
+                self.__evict()
+        return img
+
+    def __evict(self):
+        while self.__bytes > self.__max_bytes and self.__entries:
+            _, (img, _) = self.__entries.popitem(last=False)
+            self.__bytes -= img.nbytes
+            self.__stats[2] += 1
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """프로세스 전체에서 공유하는 ImageCache 반환"""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ImageCache()
+        return _default_cache
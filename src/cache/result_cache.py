@@ -0,0 +1,183 @@
+# cache/result_cache.py
+"""
+ResultCache 클래스
+- 이미지 내용 해시 기반 결과 캐시 (SQLite 파일 하나에 저장)
+- namespace 로 OCR / 얼굴 검출 등 결과 종류를 구분하고, 전체 용량 한도는 공유
+- 용량 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- namespace 별 hit/miss/eviction 통계와 계산을 건너뛴 시간(saved_seconds) 집계
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'open-cv-flow', 'results.sqlite')
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+    saved_seconds: float
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# 경로 -> (크기, mtime_ns, 해시), 가장 오래 쓰지 않은 경로부터 버림
+# 경로당 최신 값 하나만 두므로 수정된 파일의 이전 해시는 남지 않음
+FILE_HASH_MEMO_SIZE = 4096
+_file_hash_memo = OrderedDict()
+_file_hash_lock = threading.Lock()
+
+
+def hash_file(path: str) -> str:
+    """
+    이미지 파일 내용의 sha1 해시 반환
+    같은 프로세스에서 크기/mtime 이 그대로인 파일은 다시 읽지 않는다 (최근 FILE_HASH_MEMO_SIZE 개 경로).
+    """
+    st = os.stat(path)
+    path = os.path.abspath(path)
+    stamp = (st.st_size, st.st_mtime_ns)
+    with _file_hash_lock:
+        memo = _file_hash_memo.get(path)
+        if memo is not None and memo[:2] == stamp:
+            _file_hash_memo.move_to_end(path)
+            return memo[2]
+    with open(path, 'rb') as f:
+        digest = hashlib.file_digest(f, 'sha1').hexdigest()
+    with _file_hash_lock:
+        _file_hash_memo[path] = stamp + (digest,)
+        _file_hash_memo.move_to_end(path)
+        while len(_file_hash_memo) > FILE_HASH_MEMO_SIZE:
+            _file_hash_memo.popitem(last=False)
+    return digest
+
+
+class ResultCache:
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        param path: SQLite 파일 경로 (':memory:' 가능)
+        param max_bytes: 저장 값 전체 크기 한도
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.__max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        self.__stats = {}   # namespace -> [hits, misses, stores, evictions, saved_seconds]
+        self.__conn = sqlite3.connect(path, check_same_thread=False)
+        # 조회마다 last_access 를 갱신하므로 WAL 로 쓰기 비용을 줄임
+        self.__conn.execute('PRAGMA journal_mode=WAL')
+        self.__conn.execute('PRAGMA synchronous=NORMAL')
+        with self.__conn:
+            self.__conn.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                ' namespace TEXT NOT NULL,'
+                ' key TEXT NOT NULL,'
+                ' value BLOB NOT NULL,'
+                ' size INTEGER NOT NULL,'
+                ' cost REAL NOT NULL,'
+                ' last_access REAL NOT NULL,'
+                ' PRIMARY KEY (namespace, key))'
+            )
+            self.__conn.execute('CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)')
+        self.__total_bytes = self.__conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def get(self, namespace: str, key: str):
+        """저장된 값(bytes) 반환, 없으면 None"""
+        with self.__lock:
+            row = self.__conn.execute(
+                'SELECT value, cost FROM results WHERE namespace = ? AND key = ?', (namespace, key)
+            ).fetchone()
+            stats = self.__get_stats_row(namespace)
+            if row is None:
+                stats[1] += 1
+                return None
+            with self.__conn:
+                self.__conn.execute(
+                    'UPDATE results SET last_access = ? WHERE namespace = ? AND key = ?',
+                    (time.time(), namespace, key),
+                )
+            stats[0] += 1
+            stats[4] += row[1]
+            return row[0]
+
+    def put(self, namespace: str, key: str, value: bytes, cost: float = 0.0):
+        """
+        값 저장
+        param cost: 이 값을 계산하는 데 걸린 시간(초), 이후 hit 될 때마다 saved_seconds 에 더해짐
+        """
+        size = len(value)
+        if size > self.__max_bytes:
+            return
+        with self.__lock:
+            with self.__conn:
+                old = self.__conn.execute(
+                    'SELECT size FROM results WHERE namespace = ? AND key = ?', (namespace, key)
+                ).fetchone()
+                self.__conn.execute(
+                    'INSERT OR REPLACE INTO results (namespace, key, value, size, cost, last_access)'
+                    ' VALUES (?, ?, ?, ?, ?, ?)',
+                    (namespace, key, value, size, cost, time.time()),
+                )
+            self.__total_bytes += size - (old[0] if old else 0)
+            self.__get_stats_row(namespace)[2] += 1
+            if self.__total_bytes > self.__max_bytes:
+                self.__evict()
+
+    def get_stats(self, namespace: str = None) -> CacheStats:
+        """namespace 별 통계, namespace 가 None 이면 전체 합계"""
+        with self.__lock:
+            if namespace is not None:
+                return CacheStats(*self.__get_stats_row(namespace))
+            rows = list(self.__stats.values()) or [[0, 0, 0, 0, 0.0]]
+            return CacheStats(*(sum(col) for col in zip(*rows)))
+
+    def get_total_bytes(self):
+        return self.__total_bytes
+
+    def get_max_bytes(self):
+        return self.__max_bytes
+
+    def clear(self, namespace: str = None):
+        with self.__lock:
+            with self.__conn:
+                if namespace is None:
+                    self.__conn.execute('DELETE FROM results')
+                else:
+                    self.__conn.execute('DELETE FROM results WHERE namespace = ?', (namespace,))
+            self.__total_bytes = self.__conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def close(self):
+        with self.__lock:
+            self.__conn.close()
+
+    def __get_stats_row(self, namespace):
+        return self.__stats.setdefault(namespace, [0, 0, 0, 0, 0.0])
+
+    def __evict(self):
+        # 한도의 90% 까지 오래된 항목부터 삭제 (매 put 마다 삭제가 일어나지 않도록 여유를 둠)
+        target = int(self.__max_bytes * 0.9)
+        rows = self.__conn.execute(
+            'SELECT namespace, key, size FROM results ORDER BY last_access'
+        )
+        victims = []
+        freed = 0
+        for namespace, key, size in rows:
+            if self.__total_bytes - freed <= target:
+                break
+            victims.append((namespace, key))
+            freed += size
+        rows.close()
+        with self.__conn:
+            self.__conn.executemany('DELETE FROM results WHERE namespace = ? AND key = ?', victims)
+        self.__total_bytes -= freed
+        for namespace, _ in victims:
+            self.__get_stats_row(namespace)[3] += 1
@@ -5,4 +5,13 @@ class DataManager:
     def __init__(self, folder_path):
         self.folder_manager = FolderManager(folder_path)
         self.image_data_map = {f: ImageData(f) for f in self.folder_manager.get_files()}
+
+    def refresh(self):
+        """변경된 파일만 ImageData를 새로 만들고 나머지는 결과와 함께 유지"""
+        changes = self.folder_manager.refresh()
+        for f in changes.removed + changes.modified:
+            self.image_data_map.pop(f, None)
+        for f in changes.added + changes.modified:
+            self.image_data_map[f] = ImageData(f)
+        return changes
     # ...OCR 등 기능 추가...
\ No newline at end of file
@@ -0,0 +1,180 @@
+# features/batch_face_detection.py
+"""
+BatchFaceDetection 클래스
+- 폴더(FolderData) 또는 경로 리스트 전체에 대해 얼굴 검출을 프로세스 풀로 병렬 실행
+- 끝난 순서대로 결과를 스트리밍 (iter_results), 동시에 처리 중인 작업 수를 제한해 메모리 보호
+- FileData 가 주어지면 결과를 FileData.set_faces 로 저장
+- 처리 속도(images/sec) 보고 및 중간 취소 지원
+- FaceCache 가 주어지면 이미 검출한 이미지는 해시 확인만 하고 건너뜀
+- 작업 중 예외가 난 파일은 positions=None 결과(실패)로 보고하고 나머지는 계속 처리
+"""
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import NamedTuple
+
+import numpy as np
+
+from src.features.modules.cascade_registry import FRONTAL_FACE
+from src.features.modules.face_detector import detect_face_positions, read_detection_gray
+from src.metrics import metrics
+from src.metrics.log import get_logger
+
+log = get_logger('BatchFaceDetection')
+
+
+class FaceResult(NamedTuple):
+    path: str
+    positions: np.ndarray   # (N, 4) x, y, w, h - 이미지를 읽지 못하면 None
+    elapsed: float
+
+
+class BatchFaceReport(NamedTuple):
+    total: int
+    processed: int
+    failed: int
+    elapsed: float
+    cancelled: bool
+    cache_hits: int = 0
+
+    @property
+    def images_per_sec(self):
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def detect_file(path, cascade=FRONTAL_FACE, scale_factor=1.1, min_neighbors=4, max_side=None, min_face_size=None):
+    """
+    작업 프로세스에서 실행되는 1장 검출 함수 (pickle 가능하도록 모듈 최상위에 둠)
+    작업 프로세스의 이미지 캐시를 채우지 않도록 직접 (회색조로, 가능하면 축소해서) 디코딩한다.
+    """
+    start = time.perf_counter()
+    gray, source_scale = read_detection_gray(path, max_side, min_face_size, cascade)
+    if gray is None:
+        return FaceResult(path, None, time.perf_counter() - start)
+    positions = detect_face_positions(gray, scale_factor, min_neighbors, max_side, min_face_size, cascade,
+                                      source_scale)
+    return FaceResult(path, positions, time.perf_counter() - start)
+
+
+class BatchFaceDetection:
+    def __init__(self, workers: int = None, max_pending: int = None, detect=detect_file, cache=None,
+                 **detect_kwargs):
+        """
+        param workers: 프로세스 수 (기본값: CPU 코어 수)
+        param max_pending: 동시에 제출해 둘 최대 작업 수 (기본값: workers * 4)
+        param detect: 경로를 받아 FaceResult 를 반환하는 함수 (pickle 가능해야 함)
+        param cache: FaceCache - 주어지면 검출 파라미터는 캐시 키와 같은 값을 사용
+        param detect_kwargs: detect 에 전달할 인자 (cascade, scale_factor, min_neighbors, max_side, min_face_size)
+        """
+        if cache is not None:
+            detect_kwargs = {**detect_kwargs, **cache.get_detect_kwargs()}
+        self.__workers = workers or os.cpu_count() or 1
+        self.__max_pending = max_pending or self.__workers * 4
+        self.__detect = detect
+        self.__detect_kwargs = detect_kwargs
+        self.__cache = cache
+        self.__cancel_event = threading.Event()
+
+    def cancel(self):
+        """이미 제출된 작업만 마치고 중단"""
+        self.__cancel_event.set()
+
+    def is_cancelled(self):
+        return self.__cancel_event.is_set()
+
+    def iter_results(self, paths):
+        """
+        끝난 순서대로 FaceResult 를 yield
+        소비하는 쪽이 다음 결과를 가져갈 때까지 새 작업을 제출하지 않는다 (backpressure).
+        검출 중 예외가 난 파일은 positions=None 인 FaceResult 로 yield (읽지 못한 파일과 같이 실패 처리).
+        """
+        self.__cancel_event.clear()
+        paths = iter(paths)
+        with ProcessPoolExecutor(self.__workers) as pool:
+            pending = {}   # future -> 경로
+            exhausted = False
+            while True:
+                while not exhausted and not self.is_cancelled() and len(pending) < self.__max_pending:
+                    path = next(paths, None)
+                    if path is None:
+                        exhausted = True
+                        break
+                    pending[pool.submit(self.__detect, path, **self.__detect_kwargs)] = path
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # 손상된 파일 / 작업 프로세스 종료 등 - 이 파일만 실패로 보고
+                        log.error('%s : 얼굴 검출 실패 (%s)', path, e)
+                        result = FaceResult(path, None, 0.0)
+                    yield result
+
+    def run(self, target, on_progress=None):
+        """
+        param target: FolderData, FileData 리스트, 또는 경로 리스트
+        param on_progress: (done, total, images_per_sec) 를 받는 콜백
+        return: BatchFaceReport
+        """
+        files = target.get_files() if hasattr(target, 'get_files') else list(target)
+        by_path = {}
+        for f in files:
+            by_path[f.get_file_name() if hasattr(f, 'get_file_name') else os.fspath(f)] = f
+
+        total = len(by_path)
+        processed = failed = cache_hits = 0
+        start = time.perf_counter()
+
+        def report_progress():
+            if on_progress is not None:
+                elapsed = time.perf_counter() - start
+                on_progress(processed + failed, total, processed / elapsed if elapsed > 0 else 0.0)
+
+        self.__cancel_event.clear()
+        missing = []
+        for path in by_path:
+            if self.is_cancelled():
+                break
+            positions = self.__get_cached(path)
+            if positions is None:
+                missing.append(path)
+                continue
+            self.__apply(by_path[path], positions)
+            processed += 1
+            cache_hits += 1
+            metrics.count('face_cache.hit')
+            report_progress()
+
+        results = () if self.is_cancelled() else self.iter_results(missing)
+        for result in results:
+            # 작업 프로세스에서 잰 파일 1장 처리 시간 (디코딩 + 검출)
+            metrics.observe('face_detection.file', result.elapsed)
+            if result.positions is None:
+                failed += 1
+                metrics.count('face_detection.failed')
+            else:
+                self.__apply(by_path[result.path], result.positions)
+                if self.__cache is not None:
+                    self.__cache.put(result.path, result.positions, result.elapsed)
+                processed += 1
+            report_progress()
+
+        return BatchFaceReport(total, processed, failed, time.perf_counter() - start, self.is_cancelled(), cache_hits)
+
+    def __get_cached(self, path):
+        if self.__cache is None:
+            return None
+        try:
+            return self.__cache.get(path)
+        except OSError:
+            # 파일을 읽을 수 없으면 검출 단계에서 실패로 집계
+            return None
+
+    @staticmethod
+    def __apply(file_data, positions):
+        if hasattr(file_data, 'set_faces'):
+            file_data.set_faces(positions)
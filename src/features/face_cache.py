@@ -0,0 +1,66 @@
+# features/face_cache.py
+"""
+FaceCache 클래스
+- 얼굴 검출 결과(사각형 배열)를 ResultCache 에 영구 저장
+- 키: 이미지 내용 해시 + cascade 파일 내용 해시 + scaleFactor / minNeighbors / 축소 상한
+  (같은 이미지라도 검출 파라미터가 다르면 다른 결과로 취급)
+- 값: (N, 4) int32 배열의 little-endian 바이트 (얼굴이 없으면 빈 값)
+"""
+import hashlib
+import json
+
+import numpy as np
+
+from src.cache.result_cache import ResultCache, hash_file
+from src.features.modules.cascade_registry import FRONTAL_FACE, resolve_cascade_path
+
+NAMESPACE = 'faces'
+
+
+class FaceCache:
+    def __init__(self, cache: ResultCache, cascade: str = FRONTAL_FACE, scale_factor: float = 1.1,
+                 min_neighbors: int = 4, max_side: int = None, min_face_size: int = None):
+        """
+        param cache: 결과를 저장할 ResultCache (OCR 캐시 등과 공유 가능)
+        param cascade, scale_factor, min_neighbors, max_side, min_face_size: 검출 파라미터
+        """
+        self.__cache = cache
+        self.__detect_kwargs = dict(
+            cascade=cascade, scale_factor=scale_factor, min_neighbors=min_neighbors,
+            max_side=max_side, min_face_size=min_face_size,
+        )
+        params = json.dumps(
+            {**self.__detect_kwargs, 'cascade': hash_file(resolve_cascade_path(cascade))}, sort_keys=True
+        )
+        self.__params_digest = hashlib.sha1(params.encode('utf-8')).hexdigest()
+
+    def get_result_cache(self):
+        return self.__cache
+
+    def get_detect_kwargs(self):
+        """이 캐시의 키와 같은 검출 파라미터 (detect_file 인자)"""
+        return dict(self.__detect_kwargs)
+
+    def make_key(self, path: str) -> str:
+        return hash_file(path) + ':' + self.__params_digest
+
+    def get(self, path: str):
+        """
+        캐시된 얼굴 위치 반환, 없으면 None
+        return: (N, 4) int32 배열 - x, y, w, h
+        """
+        value = self.__cache.get(NAMESPACE, self.make_key(path))
+        if value is None:
+            return None
+        return np.frombuffer(value, '<i4').astype(np.int32).reshape(-1, 4)
+
+    def put(self, path: str, positions, cost: float = 0.0):
+        """
+        param positions: (N, 4) 얼굴 위치 배열 (얼굴이 없어도 저장해서 다시 검출하지 않도록 함)
+        param cost: 검출에 걸린 시간(초)
+        """
+        value = np.asarray(positions, '<i4').reshape(-1, 4).tobytes()
+        self.__cache.put(NAMESPACE, self.make_key(path), value, cost)
+
+    def get_stats(self):
+        return self.__cache.get_stats(NAMESPACE)
@@ -1,5 +1,5 @@
-import cv2
-import numpy as np
+from src.cache.image_cache import get_image_cache
+from src.features.modules.face_detector import detect_face_positions, read_detection_gray
 
 class FaceData:
     def __init__(self, name, position):
@@ -16,36 +16,43 @@ class FaceDetection:
         self.file_path = file_path
         self.faces = []
 
-    def detect_faces_cv2(self):
+    def detect_faces_cv2(self, max_side: int = None, min_face_size: int = None):
         """
         OpenCV의 Haar Cascade 분류기를 사용해 이미지에서 얼굴을 검출한다.
 
         처리 과정:
-        1. 정면 얼굴 검출용 Haar Cascade XML 파일을 로드한다.
-        2. 지정된 파일 경로에서 이미지를 읽어들인다.
-        3. 처리 속도와 정확도를 위해 이미지를 그레이스케일로 변환한다.
+        1. 정면 얼굴 검출용 Haar Cascade 분류기를 가져온다 (스레드별로 한 번만 로드).
+        2~3. 지정된 파일 경로의 이미지를 처음부터 그레이스케일로 읽어들인다 (상한이 있으면 축소 디코딩).
         4. 분류기를 사용해 얼굴 위치를 검출한다.
         - scaleFactor: 이미지 크기를 단계별로 축소하는 비율 (기본값 1.1)
         - minNeighbors: 얼굴 후보 사각형이 가져야 할 최소 인접 개수 (기본값 5)
+        - max_side / min_face_size 가 주어지면 축소한 이미지에서 검출하고 좌표를 원본 기준으로 되돌린다.
         5. 얼굴이 검출되면, 각각에 고유한 이름을 부여하고 위치 정보와 함께 저장한다.
 
+        Args:
+            max_side (int): 검출용 작업 이미지의 긴 변 최대 길이. None 이면 원본 해상도.
+            min_face_size (int): 찾을 얼굴의 최소 크기(px). 지정하면 그에 맞춰 축소 후 검출.
+
         업데이트되는 속성:
             self.faces (List[FaceData]): 검출된 얼굴의 이름과 위치 정보를 담은 리스트
         """
-        # 1. OpenCV의 Haar Cascade 분류기 불러오기
-        face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        # => 얼굴 검출에 사용되는 사전 학습된 XML 파일을 로드한다.
-
-        # 2. 이미지 파일 읽기
-        image = cv2.imread(self.file_path)
-        # => self.file_path 경로의 이미지를 BGR 컬러로 읽어들인다.
+        # 1. OpenCV의 Haar Cascade 분류기는 detect_face_positions 안에서 가져온다.
+        # => 사전 학습된 XML 파일은 스레드마다 처음 한 번만 로드되고 이후 호출에서는 재사용된다.
 
-        # 3. 그레이스케일로 변환
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        # => 얼굴 검출은 색상 정보 불필요하므로, 처리 속도와 정확도 향상을 위해 흑백 이미지로 변환한다.
+        # 2~3. 이미지 파일 읽기 + 그레이스케일 변환
+        gray, source_scale = read_detection_gray(self.file_path, max_side, min_face_size,
+                                                 read=get_image_cache().get)
+        if gray is None:
+            raise FileNotFoundError(f'이미지 없음: {self.file_path}')
+        # => 컬러(BGR)로 디코딩한 뒤 변환하지 않고 바로 흑백으로 디코딩한다.
+        #    max_side / min_face_size 가 허용하면 디코딩 단계에서 1/2, 1/4, 1/8 로 축소해서 읽는다.
+        #    결과는 공유 이미지 캐시에 보관되어 같은 파일을 다시 검출할 때 디코딩하지 않는다.
+        #    얼굴 검출은 색상 정보 불필요하므로, 처리 속도와 정확도 향상을 위해 흑백 이미지를 사용한다.
 
         # 4. 얼굴 위치 검출
-        positions = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5)
+        positions = detect_face_positions(gray, scale_factor=1.1, min_neighbors=5,
+                                          max_side=max_side, min_face_size=min_face_size,
+                                          source_scale=source_scale)
         # => 이미지 내 얼굴 위치를 (x, y, w, h) 형태로 배열로 반환한다.
         #    scaleFactor: 이미지 크기 조정 비율 (1.1은 10%씩 축소하며 탐색)
         #    minNeighbors: 얼굴로 인식할 최소 인접 사각형 수(클러스터 크기)
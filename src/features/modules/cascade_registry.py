@@ -0,0 +1,51 @@
+# features/modules/cascade_registry.py
+"""
+CascadeRegistry 클래스
+- Haar Cascade XML 을 파일마다 한 번만 읽어 재사용
+- cv2.CascadeClassifier 는 스레드 간 공유가 안전하지 않으므로 스레드마다 따로 보관
+- 같은 스레드에서는 호출마다 XML 을 다시 파싱하지 않음
+"""
+import os
+import threading
+
+import cv2
+
+FRONTAL_FACE = 'haarcascade_frontalface_default.xml'
+
+
+def resolve_cascade_path(name: str) -> str:
+    """파일명만 주면 OpenCV 기본 haarcascades 폴더에서 찾음"""
+    if os.path.isfile(name):
+        return os.path.abspath(name)
+    return os.path.join(cv2.data.haarcascades, name)
+
+
+class CascadeRegistry:
+    def __init__(self):
+        self.__local = threading.local()
+
+    def get(self, name: str = FRONTAL_FACE) -> cv2.CascadeClassifier:
+        """
+        현재 스레드용 CascadeClassifier 반환 (없으면 로드)
+        Raises:
+            FileNotFoundError: cascade 파일을 읽지 못했을 경우.
+        """
+        detectors = getattr(self.__local, 'detectors', None)
+        if detectors is None:
+            detectors = self.__local.detectors = {}
+        detector = detectors.get(name)
+        if detector is None:
+            path = resolve_cascade_path(name)
+            detector = cv2.CascadeClassifier(path)
+            if detector.empty():
+                raise FileNotFoundError(f'cascade 로드 실패: {path}')
+            detectors[name] = detector
+        return detector
+
+
+_registry = CascadeRegistry()
+
+
+def get_cascade(name: str = FRONTAL_FACE) -> cv2.CascadeClassifier:
+    """프로세스 공용 레지스트리에서 현재 스레드용 CascadeClassifier 반환"""
+    return _registry.get(name)
@@ -1,6 +1,10 @@
 import cv2
 import numpy as np
 
+from src.cache.image_cache import get_image_cache
+from src.features.modules.face_detector import detect_face_positions, read_detection_gray
+from src.features.modules.preprocess_engine import get_preprocess_engine
+
 class FaceData:
     def __init__(self, name, position):
         self.name = name
@@ -27,24 +31,43 @@ class FaceDetection:
         if positions is not None and isinstance(positions, np.ndarray) and len(positions) > 0:
             self.faces = [FaceData(f'얼굴-{i+1:04d}', p) for i, p in enumerate(positions)]
 
-    def detect_faces(self):
+    def detect_faces(self, max_side: int = None, min_face_size: int = None, with_image: bool = True):
         """
         Detect faces in the image file specified by `file_path`.
 
+        Args:
+            max_side (int): 검출용 작업 이미지의 긴 변 최대 길이. None 이면 원본 해상도.
+            min_face_size (int): 찾을 얼굴의 최소 크기(px). 지정하면 그에 맞춰 축소 후 검출.
+            with_image (bool): False 면 컬러 디코딩을 생략하고 None 반환.
+
         Returns:
-            np.ndarray: 원본 이미지 (BGR).
+            np.ndarray: 원본 이미지 (BGR), with_image=False 면 None.
         
         Raises:
             FileNotFoundError: 이미지 파일을 찾지 못했을 경우.
         """
-        detector = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        img = cv2.imread(self.file_path)
-        if img is None:
+        cache = get_image_cache()
+        read = cache.get
+        if with_image:
+            # 컬러 이미지를 어차피 반환하므로, 원본 크기 회색조는 컬러 디코딩 결과에서 cvtColor 로 만듦
+            # (한 번만 디코딩, 축소 디코딩이 가능한 경우만 회색조로 따로 디코딩)
+            def read(path, flags):
+                if flags == cv2.IMREAD_GRAYSCALE:
+                    return cache.get_plane(path, 'gray')
+                return cache.get(path, flags)
+        # with_image=False 면 컬러 디코딩 없이 (가능하면 축소해서) 바로 회색조로 디코딩
+        gray, source_scale = read_detection_gray(self.file_path, max_side, min_face_size, read=read)
+        if gray is None:
             raise FileNotFoundError(f'이미지 없음: {self.file_path}')
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        faces = detector.detectMultiScale(gray, 1.1, 4)
+        faces = detect_face_positions(gray, 1.1, 4, max_side, min_face_size, source_scale=source_scale)
         self.set_faces(faces)
-        return img
+        if not with_image:
+            return None
+        img = cache.get(self.file_path)
+        if img is None:
+            raise FileNotFoundError(f'이미지 없음: {self.file_path}')
+        # 캐시 배열은 읽기 전용이므로 호출자가 그림을 그릴 수 있도록 복사본 반환
+        return img.copy()
 
     def remove_alpha(self, img: np.ndarray) -> np.ndarray:
         """
@@ -54,14 +77,8 @@ class FaceDetection:
         Returns:
             np.ndarray: 알파 채널 제거된 RGB 이미지
         """
-        if img.shape[2] == 4:
-            alpha = img[:, :, 3] / 255.0
-            rgb = img[:, :, :3].astype(float)
-            white_bg = np.ones_like(rgb) * 255
-            img_rgb = (rgb * alpha[:, :, None] + white_bg * (1 - alpha[:, :, None])).astype(np.uint8)
-        else:
-            img_rgb = img
-        return img_rgb
+        # float64 임시 배열 없이 LUT 로 합성 (결과는 기존 float 계산과 동일)
+        return get_preprocess_engine().flatten_alpha(img)
 
     def binarize_image(self, img_rgb: np.ndarray) -> np.ndarray:
         """
@@ -73,8 +90,6 @@ class FaceDetection:
         Returns:
             np.ndarray: 이진화된 흑백 이미지 (dtype=uint8).
         """
-        gray = cv2.cvtColor(img_rgb, cv2.COLOR_BGR2GRAY)
-        blur = cv2.GaussianBlur(gray, (5, 5), 0)
-        _, binary = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        return binary
+        # gray / blur 중간 버퍼는 스레드별 엔진이 재사용
+        return get_preprocess_engine().binarize(img_rgb, flatten_alpha=False)
 
@@ -0,0 +1,104 @@
+# features/modules/face_detector.py
+"""
+얼굴 검출 공용 함수
+- 모든 detect_faces 경로가 같은 detectMultiScale 호출을 쓰도록 모음
+- max_side / min_face_size 로 작업 해상도 상한을 두고, 축소된 이미지에서 검출한 뒤
+  사각형 좌표를 원본 해상도로 되돌림 (고해상도 사진에서 의미 없는 작은 스케일 탐색 생략)
+- 검출용 회색조 이미지는 컬러 디코딩 + cvtColor 없이 바로 회색조로 디코딩하고,
+  상한이 허용하면 IMREAD_REDUCED_GRAYSCALE_2/4/8 로 축소 디코딩 (JPEG 는 DCT 단계에서 축소됨)
+"""
+import cv2
+import numpy as np
+
+from src.features.modules.cascade_registry import FRONTAL_FACE, get_cascade
+from src.files.folder_index import read_image_size
+from src.metrics import metrics
+
+# (축소 배율, imread 플래그) - 큰 배율부터
+REDUCED_GRAYSCALE = (
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+
+
+def compute_detection_scale(shape, window_size, max_side: int = None, min_face_size: int = None) -> float:
+    """
+    원본 대비 작업 이미지 배율 (1.0 이하)
+    param shape: 원본 이미지 shape (h, w[, c])
+    param window_size: cascade 의 원래 검출 창 크기 (w, h)
+    param max_side: 작업 이미지의 긴 변 최대 길이(px)
+    param min_face_size: 찾을 얼굴의 최소 크기(원본 px) - 이 크기가 검출 창 크기가 되도록 축소
+    """
+    h, w = shape[:2]
+    scale = 1.0
+    if max_side:
+        scale = min(scale, max_side / max(h, w))
+    if min_face_size:
+        scale = min(scale, min(window_size) / min_face_size)
+    return scale
+
+
+def read_detection_gray(path, max_side: int = None, min_face_size: int = None,
+                        cascade: str = FRONTAL_FACE, read=cv2.imread):
+    """
+    검출용 회색조 이미지 디코딩
+
+    Args:
+        path: 이미지 파일 경로.
+        max_side, min_face_size: 작업 해상도 상한 - 허용되는 가장 큰 배율로 축소 디코딩.
+        cascade (str): cascade 파일명 (검출 창 크기 확인용).
+        read: (경로, flags) 를 받아 이미지를 반환하는 함수 (예: cv2.imread, ImageCache.get).
+
+    Returns:
+        (np.ndarray, float): 회색조 이미지와 원본 대비 배율 - 읽지 못하면 (None, 1.0).
+    """
+    size = read_image_size(path) if (max_side or min_face_size) else None
+    if size:
+        window = get_cascade(cascade).getOriginalWindowSize()
+        scale = compute_detection_scale(size[::-1], window, max_side, min_face_size)
+        for factor, flag in REDUCED_GRAYSCALE:
+            if scale * factor > 1.0:
+                continue
+            gray = read(path, flag)
+            if gray is not None:
+                # EXIF 회전으로 가로/세로가 바뀔 수 있으므로 긴 변끼리 비교
+                return gray, max(gray.shape[:2]) / max(size)
+            break
+    # 축소 디코딩을 지원하지 않는 포맷이거나 상한이 없으면 원본 크기로 디코딩
+    return read(path, cv2.IMREAD_GRAYSCALE), 1.0
+
+
+def detect_face_positions(gray: np.ndarray, scale_factor: float = 1.1, min_neighbors: int = 4,
+                          max_side: int = None, min_face_size: int = None,
+                          cascade: str = FRONTAL_FACE, source_scale: float = 1.0) -> np.ndarray:
+    """
+    흑백 이미지에서 얼굴 위치 검출
+
+    Args:
+        gray (np.ndarray): 흑백 이미지.
+        scale_factor, min_neighbors: detectMultiScale 인자.
+        max_side, min_face_size: 원본 기준 작업 해상도 상한 (compute_detection_scale 참고).
+        cascade (str): cascade 파일명.
+        source_scale (float): gray 가 이미 원본 대비 축소된 배율 (read_detection_gray 반환값).
+
+    Returns:
+        np.ndarray: (N, 4) int32 배열 - 원본 좌표 기준 (x, y, w, h).
+    """
+    detector = get_cascade(cascade)
+    original_shape = (gray.shape[0] / source_scale, gray.shape[1] / source_scale)
+    scale = compute_detection_scale(original_shape, detector.getOriginalWindowSize(), max_side, min_face_size)
+    resize = min(1.0, scale / source_scale)
+
+    work = gray
+    if resize < 1.0:
+        work = cv2.resize(gray, None, fx=resize, fy=resize, interpolation=cv2.INTER_AREA)
+
+    with metrics.span('face_detection'):
+        positions = detector.detectMultiScale(work, scale_factor, min_neighbors)
+    positions = np.asarray(positions, np.float64).reshape(-1, 4)
+    total = source_scale * resize
+    if total != 1.0:
+        # 축소 이미지 좌표 -> 원본 좌표
+        positions = np.rint(positions / total)
+    return positions.astype(np.int32)
@@ -0,0 +1,157 @@
+# features/modules/image_context.py
+"""
+ImageContext 클래스
+- 이미지 1장을 처리하는 동안 얼굴 검출 / 이진화 / OCR 이 함께 쓰는 중간 결과(plane) 보관
+- plane 은 처음 요청될 때 한 번만 계산하고, 이후 요청은 같은 배열을 반환
+    source : BGR 디코딩 결과 (cv2.imread 기본값, EXIF 회전 적용, 공유 이미지 캐시를 거침 - 얼굴 검출 / 화면 표시용)
+    rgb    : source 의 RGB 순서 (easyocr 가 경로를 읽을 때와 같은 입력)
+    bgr    : 알파를 흰 배경으로 합성한 BGR 이미지 (이진화용, 알파가 없으면 source 와 같은 배열)
+    gray   : source 의 흑백 (얼굴 검출용)
+    blur   : bgr 흑백의 5x5 가우시안 블러
+    binary : Otsu 이진화 결과
+- 알파 채널은 bgr 을 만들 때만 IMREAD_UNCHANGED 로 다시 읽고, EXIF 회전을 직접 적용해 모든 plane 의 좌표를 맞춤
+- 반환되는 배열은 읽기 전용이므로, 그림을 그리는 등 수정이 필요하면 copy() 해서 사용
+"""
+import os
+
+import cv2
+import numpy as np
+
+from src.cache.image_cache import get_image_cache
+from src.features.modules.preprocess_engine import PreprocessEngine, get_preprocess_engine
+
+PLANE_NAMES = ('source', 'rgb', 'bgr', 'gray', 'blur', 'binary')
+# 알파 채널이 없는 형식 (bgr 을 만들 때 알파를 읽으려고 다시 디코딩하지 않음)
+NO_ALPHA_EXT = ('.jpg', '.jpeg', '.jpe', '.jfif', '.bmp')
+EXIF_ORIENTATION = 0x0112
+
+
+class ImageContext:
+    def __init__(self, file_path, cache=None, engine: PreprocessEngine = None):
+        """
+        param file_path: 이미지 파일 경로
+        param cache: 디코딩에 쓸 ImageCache (기본값: 공유 이미지 캐시)
+        param engine: 흑백/블러/이진화에 쓸 PreprocessEngine (기본값: 현재 스레드용 엔진)
+        """
+        self.file_path = os.fspath(file_path)
+        self.__cache = cache or get_image_cache()
+        self.__engine = engine
+        self.__planes = {}
+        self.__computed = dict.fromkeys(PLANE_NAMES, 0)
+        self.__threshold = None
+
+    def get_source(self):
+        """
+        원본 이미지 (BGR uint8, EXIF 회전 적용 - cv2.imread 와 같은 결과)
+        Raises:
+            FileNotFoundError: 이미지 파일을 읽지 못했을 경우.
+        """
+        return self.__get('source', self.__decode)
+
+    def get_rgb(self):
+        """OCR 입력용 RGB 이미지"""
+        return self.__get('rgb', lambda: cv2.cvtColor(self.get_source(), cv2.COLOR_BGR2RGB))
+
+    def get_bgr(self):
+        """알파 채널을 흰 배경으로 합성한 BGR 이미지 (알파가 없으면 source)"""
+        return self.__get('bgr', self.__make_bgr)
+
+    def get_gray(self):
+        return self.__get('gray', lambda: self.__get_engine().to_gray(self.get_source()))
+
+    def get_blur(self):
+        return self.__get('blur', self.__make_blur)
+
+    def get_binary(self):
+        return self.__get('binary', self.__make_binary)
+
+    def get_threshold(self):
+        """binary 를 만들 때 Otsu 가 고른 임계값 (아직 만들지 않았으면 None)"""
+        return self.__threshold
+
+    def has_plane(self, name: str) -> bool:
+        return name in self.__planes
+
+    def get_compute_counts(self):
+        """plane 별 계산 횟수 (같은 컨텍스트에서는 최대 1)"""
+        return dict(self.__computed)
+
+    def release(self):
+        """보관 중인 plane 해제 (이미지 처리가 끝났을 때)"""
+        self.__planes.clear()
+
+    def __get(self, name, create):
+        plane = self.__planes.get(name)
+        if plane is None:
+            plane = create()
+            plane.flags.writeable = False
+            self.__planes[name] = plane
+            self.__computed[name] += 1
+        return plane
+
+    def __get_engine(self):
+        return self.__engine or get_preprocess_engine()
+
+    def __decode(self):
+        img = self.__cache.get(self.file_path)
+        if img is None:
+            raise FileNotFoundError(f'이미지 없음: {self.file_path}')
+        return img
+
+    def __make_bgr(self):
+        source = self.get_source()
+        alpha = self.__read_alpha(source.shape[:2])
+        if alpha is None:
+            return source
+        return self.__get_engine().flatten_alpha(np.dstack((source, alpha)))
+
+    def __make_blur(self):
+        bgr = self.get_bgr()
+        # 알파가 없으면 bgr 은 source 이므로 얼굴 검출용 흑백 plane 을 그대로 사용
+        gray = self.get_gray() if bgr is self.get_source() else self.__get_engine().to_gray(bgr)
+        return cv2.GaussianBlur(gray, (5, 5), 0)
+
+    def __read_alpha(self, shape):
+        """source 와 같은 방향 / 크기의 8bit 알파 채널, 알파가 없으면 None"""
+        if self.file_path.lower().endswith(NO_ALPHA_EXT):
+            return None
+        img = self.__cache.get(self.file_path, cv2.IMREAD_UNCHANGED)
+        if img is None or img.ndim != 3 or img.shape[2] not in (2, 4):
+            return None
+        alpha = img[:, :, -1]
+        if alpha.dtype == np.uint16:
+            # IMREAD_COLOR 의 16bit -> 8bit 변환과 같이 상위 바이트 사용
+            alpha = (alpha >> 8).astype(np.uint8)
+        elif alpha.dtype != np.uint8:
+            return None
+        # IMREAD_UNCHANGED 는 EXIF 회전을 적용하지 않으므로 source 와 방향을 맞춤
+        alpha = apply_orientation(alpha, read_orientation(self.file_path))
+        return alpha if alpha.shape == shape else None
+
+    def __make_binary(self):
+        self.__threshold, binary = cv2.threshold(
+            self.get_blur(), 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+        )
+        return binary
+
+
+def read_orientation(file_path) -> int:
+    """EXIF Orientation 값 (1~8), 없거나 읽을 수 없으면 1"""
+    try:
+        from PIL import Image
+        with Image.open(file_path) as img:
+            orientation = img.getexif().get(EXIF_ORIENTATION, 1)
+    except (ImportError, OSError, ValueError):
+        return 1
+    return orientation if orientation in range(1, 9) else 1
+
+
+def apply_orientation(img, orientation: int):
+    """
+    cv2.imread 가 EXIF Orientation 에 따라 하는 회전 / 뒤집기를 img 에 적용
+    (IMREAD_UNCHANGED 로 읽은 이미지를 IMREAD_COLOR 결과와 같은 방향으로 맞출 때 사용)
+    """
+    if orientation in (5, 6, 7, 8):
+        img = cv2.transpose(img)
+    flip = {2: 1, 3: -1, 4: 0, 6: 1, 7: -1, 8: 0}.get(orientation)
+    return img if flip is None else cv2.flip(img, flip)
@@ -1,6 +1,11 @@
-import cv2
 import numpy as np
 
+from src.cache.image_cache import get_image_cache
+from src.features.modules.face_detector import detect_face_positions, read_detection_gray
+from src.features.modules.image_context import ImageContext
+from src.features.modules.preprocess_engine import get_preprocess_engine
+from src.features.modules.tiled_binarizer import DEFAULT_MEMORY_BUDGET, TiledBinarizer
+
 class FaceData:
     def __init__(self, name, position):
         self.name = name
@@ -12,10 +17,17 @@ class TextData:
         self.position = position
 
 class PrepareImage:
-    def __init__(self, file_path):
+    def __init__(self, file_path, context: ImageContext = None):
         self.file_path = file_path
         self.texts = []
         self.faces = []
+        self.context = context
+
+    def get_context(self) -> ImageContext:
+        """얼굴 검출 / 이진화 / OCR 이 중간 이미지(plane)를 공유하는 ImageContext (없으면 생성)"""
+        if self.context is None:
+            self.context = ImageContext(self.file_path)
+        return self.context
 
     def set_faces(self, positions):
         """
@@ -27,24 +39,37 @@ class PrepareImage:
         if positions is not None and isinstance(positions, np.ndarray) and len(positions) > 0:
             self.faces = [FaceData(f'얼굴-{i+1:04d}', p) for i, p in enumerate(positions)]
 
-    def detect_faces(self):
+    def detect_faces(self, max_side: int = None, min_face_size: int = None, with_image: bool = True):
         """
         Detect faces in the image file specified by `file_path`.
 
+        Args:
+            max_side (int): 검출용 작업 이미지의 긴 변 최대 길이. None 이면 원본 해상도.
+            min_face_size (int): 찾을 얼굴의 최소 크기(px). 지정하면 그에 맞춰 축소 후 검출.
+            with_image (bool): False 면 컬러 디코딩을 생략하고 None 반환.
+
         Returns:
-            np.ndarray: 원본 이미지 (BGR).
+            np.ndarray: 원본 이미지 (BGR), with_image=False 면 None.
         
         Raises:
             FileNotFoundError: 이미지 파일을 찾지 못했을 경우.
         """
-        detector = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        img = cv2.imread(self.file_path)
-        if img is None:
-            raise FileNotFoundError(f'이미지 없음: {self.file_path}')
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        faces = detector.detectMultiScale(gray, 1.1, 4)
+        context = self.get_context()
+        if context.has_plane('gray') or (with_image and not (max_side or min_face_size)):
+            # 이미 만든 흑백 plane 이 있거나 어차피 컬러로 디코딩해야 하면 plane 을 공유
+            gray, source_scale = context.get_gray(), 1.0
+        else:
+            # 컬러 이미지가 필요 없으면 (축소된) 흑백으로 바로 디코딩하는 편이 쌈
+            gray, source_scale = read_detection_gray(self.file_path, max_side, min_face_size,
+                                                     read=get_image_cache().get)
+            if gray is None:
+                raise FileNotFoundError(f'이미지 없음: {self.file_path}')
+        faces = detect_face_positions(gray, 1.1, 4, max_side, min_face_size, source_scale=source_scale)
         self.set_faces(faces)
-        return img
+        if not with_image:
+            return None
+        # plane 은 읽기 전용이므로 호출자가 그림을 그릴 수 있도록 복사본 반환
+        return context.get_source().copy()
 
     def remove_alpha(self, img: np.ndarray) -> np.ndarray:
         """
@@ -54,14 +79,8 @@ class PrepareImage:
         Returns:
             np.ndarray: 알파 채널 제거된 RGB 이미지
         """
-        if img.shape[2] == 4:
-            alpha = img[:, :, 3] / 255.0
-            rgb = img[:, :, :3].astype(float)
-            white_bg = np.ones_like(rgb) * 255
-            img_rgb = (rgb * alpha[:, :, None] + white_bg * (1 - alpha[:, :, None])).astype(np.uint8)
-        else:
-            img_rgb = img
-        return img_rgb
+        # float64 임시 배열 없이 LUT 로 합성 (결과는 기존 float 계산과 동일)
+        return get_preprocess_engine().flatten_alpha(img)
 
     def binarize_image(self, img_rgb: np.ndarray) -> np.ndarray:
         """
@@ -73,8 +92,31 @@ class PrepareImage:
         Returns:
             np.ndarray: 이진화된 흑백 이미지 (dtype=uint8).
         """
-        gray = cv2.cvtColor(img_rgb, cv2.COLOR_BGR2GRAY)
-        blur = cv2.GaussianBlur(gray, (5, 5), 0)
-        _, binary = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        # gray / blur 중간 버퍼는 스레드별 엔진이 재사용
+        return get_preprocess_engine().binarize(img_rgb, flatten_alpha=False)
+
+    def binarize(self) -> np.ndarray:
+        """
+        file_path 이미지의 알파 제거 + 흑백 + 블러 + Otsu 이진화 결과
+        흑백/블러 plane 은 ImageContext 에서 얼굴 검출과 공유하며 한 번만 계산한다.
+
+        Returns:
+            np.ndarray: 이진화된 흑백 이미지 (읽기 전용).
+        """
+        return self.get_context().get_binary()
+
+    def binarize_large_image(self, src, dst=None, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        """
+        메모리에 한 번에 올릴 수 없는 초대형 이미지를 타일 단위로 알파 제거 + 이진화
+
+        Args:
+            src: (H, W[, C]) uint8 배열, np.memmap 또는 .npy 파일 경로.
+            dst: 출력 배열, np.memmap 또는 .npy 파일 경로 (None 이면 새 배열).
+            memory_budget (int): 타일 처리에 쓸 최대 메모리(byte).
+
+        Returns:
+            np.ndarray: 이진화된 흑백 이미지 (dst 가 경로면 해당 파일의 memmap).
+        """
+        _, binary = TiledBinarizer(memory_budget).binarize(src, dst)
         return binary
 
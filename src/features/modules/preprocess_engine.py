@@ -0,0 +1,132 @@
+# features/modules/preprocess_engine.py
+"""
+PreprocessEngine 클래스
+- 알파 제거(흰 배경 합성) -> 흑백 변환 -> 가우시안 블러 -> Otsu 이진화를 버퍼를 재사용하며 처리
+- 알파 합성은 (알파, 채널값) 65536 칸짜리 uint8 표(LUT)로 계산해 float64 임시 배열을 만들지 않음
+  (표는 기존 remove_alpha 와 같은 float64 식으로 만들었으므로 결과가 비트 단위로 같음)
+- 알파 합성과 흑백 변환은 행 묶음(strip) 단위로 이어서 처리해 합성된 RGB 전체 배열을 만들지 않음
+- 중간 버퍼는 엔진이 보관해 같은 크기의 이미지를 반복 처리할 때 다시 할당하지 않음
+- 출력은 out 인자로 호출자가 준 배열에 쓰거나, 없으면 새로 할당
+- 버퍼를 공유하므로 스레드마다 엔진을 따로 사용 (get_preprocess_engine)
+"""
+import threading
+
+import cv2
+import numpy as np
+
+DEFAULT_STRIP_ROWS = 256
+
+
+def _build_alpha_lut():
+    """lut[(a << 8) | c] == uint8(c * (a / 255) + 255 * (1 - a / 255)) - remove_alpha 와 같은 float64 식"""
+    alpha = (np.arange(256) / 255.0)[:, None]
+    rgb = np.arange(256, dtype=np.float64)[None, :]
+    white_bg = np.full_like(rgb, 255.0)
+    return (rgb * alpha + white_bg * (1 - alpha)).astype(np.uint8).ravel()
+
+
+_ALPHA_LUT = _build_alpha_lut()
+
+
+class PreprocessEngine:
+    def __init__(self, strip_rows: int = DEFAULT_STRIP_ROWS):
+        """
+        param strip_rows: 알파 합성 / 흑백 변환을 한 번에 처리할 행 수 (임시 버퍼 크기를 결정)
+        """
+        self.__strip_rows = max(1, strip_rows)
+        self.__buffers = {}     # 이름 -> ndarray
+        self.__last_threshold = None
+
+    def get_last_threshold(self):
+        """직전 binarize 에서 Otsu 가 고른 임계값"""
+        return self.__last_threshold
+
+    def get_buffer_bytes(self):
+        """엔진이 보관 중인 중간 버퍼 전체 크기"""
+        return sum(b.nbytes for b in self.__buffers.values())
+
+    def release(self):
+        """보관 중인 중간 버퍼 해제"""
+        self.__buffers.clear()
+
+    def flatten_alpha(self, img: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        알파 채널을 흰 배경으로 합성한 3채널 이미지 (remove_alpha 와 같은 결과)
+        알파 채널이 없으면 img 를 그대로 (out 이 주어지면 복사해서) 반환
+        """
+        if img.ndim != 3 or img.shape[2] != 4:
+            if out is None:
+                return img
+            np.copyto(out, img)
+            return out
+        h, w = img.shape[:2]
+        out = self.__output(out, (h, w, 3))
+        for r0 in range(0, h, self.__strip_rows):
+            r1 = min(h, r0 + self.__strip_rows)
+            self.__flatten_rows(img[r0:r1], out[r0:r1])
+        return out
+
+    def to_gray(self, img: np.ndarray, out: np.ndarray = None, flatten_alpha: bool = True) -> np.ndarray:
+        """
+        흑백 변환 (BGR 기준, cv2.COLOR_BGR2GRAY 와 같은 결과)
+        param flatten_alpha: 4채널이면 흰 배경 합성 후 변환 (False 면 cvtColor 처럼 알파 무시)
+        """
+        h, w = img.shape[:2]
+        out = self.__output(out, (h, w))
+        if img.ndim == 2:
+            np.copyto(out, img)
+        elif img.shape[2] == 4 and flatten_alpha:
+            for r0 in range(0, h, self.__strip_rows):
+                r1 = min(h, r0 + self.__strip_rows)
+                rgb = self.__buffer('strip_rgb', (self.__strip_rows, w, 3), np.uint8)[:r1 - r0]
+                self.__flatten_rows(img[r0:r1], rgb)
+                cv2.cvtColor(rgb, cv2.COLOR_BGR2GRAY, dst=out[r0:r1])
+        else:
+            cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=out)
+        return out
+
+    def binarize(self, img: np.ndarray, out: np.ndarray = None, flatten_alpha: bool = True) -> np.ndarray:
+        """
+        흑백 변환 -> 5x5 가우시안 블러 -> Otsu 이진화 (binarize_image 와 같은 결과)
+        param flatten_alpha: 4채널이면 흰 배경 합성 후 처리 (remove_alpha + binarize_image 를 한 번에)
+        """
+        h, w = img.shape[:2]
+        gray = self.to_gray(img, self.__buffer('gray', (h, w), np.uint8), flatten_alpha)
+        blur = self.__buffer('blur', (h, w), np.uint8)
+        cv2.GaussianBlur(gray, (5, 5), 0, dst=blur)
+        out = self.__output(out, (h, w))
+        self.__last_threshold, _ = cv2.threshold(blur, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=out)
+        return out
+
+    def __flatten_rows(self, src, dst):
+        # 인덱스 = (알파 << 8) | 채널값, 표에서 바로 합성 결과를 가져옴
+        index = self.__buffer('strip_index', (self.__strip_rows,) + dst.shape[1:], np.uint16)[:len(dst)]
+        np.left_shift(src[:, :, 3:4], 8, out=index, dtype=np.uint16)
+        np.bitwise_or(index, src[:, :, :3], out=index)
+        # np.take 는 인덱스를 intp(8 byte)로 변환한 사본을 만들므로 fancy indexing 사용 (strip 크기 uint8 하나만 할당)
+        dst[...] = _ALPHA_LUT[index]
+
+    def __buffer(self, name, shape, dtype):
+        buf = self.__buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = self.__buffers[name] = np.empty(shape, dtype)
+        return buf
+
+    @staticmethod
+    def __output(out, shape):
+        if out is None:
+            return np.empty(shape, np.uint8)
+        if out.shape != shape or out.dtype != np.uint8 or not out.flags.c_contiguous:
+            raise ValueError(f'out 은 {shape} 크기의 연속된 uint8 배열이어야 함: {out.shape} {out.dtype}')
+        return out
+
+
+_local = threading.local()
+
+
+def get_preprocess_engine() -> PreprocessEngine:
+    """현재 스레드용 PreprocessEngine 반환 (중간 버퍼를 스레드 간에 공유하지 않도록)"""
+    engine = getattr(_local, 'engine', None)
+    if engine is None:
+        engine = _local.engine = PreprocessEngine()
+    return engine
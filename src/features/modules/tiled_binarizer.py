@@ -0,0 +1,157 @@
+# features/modules/tiled_binarizer.py
+"""
+TiledBinarizer 클래스
+- 이미지 전체를 메모리에 올리지 않고 타일 단위로 이진화 (지도/포스터 같은 초대형 스캔용)
+- 1차 패스: 타일마다 흑백 변환 + 블러 후 히스토그램을 누적해 전체 이미지의 Otsu 임계값 계산
+- 2차 패스: 타일마다 다시 블러 후 임계값 적용, 결과를 출력 배열의 해당 위치에 기록
+- 타일은 블러 커널 반지름만큼 겹쳐 읽으므로 경계가 이어지고, 결과는 전체 이미지 binarize 와 같음
+- 입력/출력은 ndarray, np.memmap 또는 .npy 파일 경로 (메모리 매핑으로 열어 필요한 부분만 읽고 씀)
+- 타일 크기는 이미지 크기가 아니라 memory_budget 으로 결정
+"""
+import os
+
+import cv2
+import numpy as np
+
+from src.features.modules.preprocess_engine import PreprocessEngine
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+BLUR_KSIZE = (5, 5)
+HALO = BLUR_KSIZE[0] // 2
+# calcHist 는 float32 로 세므로 한 타일의 화소 수가 2^24 을 넘지 않도록 제한
+MAX_TILE_SIDE = 4096
+MIN_TILE_SIDE = 64
+
+_FLT_EPSILON = float(np.finfo(np.float32).eps)
+
+
+def otsu_threshold(hist) -> int:
+    """
+    256 칸 히스토그램에서 Otsu 임계값 계산 (cv2.THRESH_OTSU 와 같은 계산 순서)
+    param hist: 밝기별 화소 수
+    """
+    hist = np.asarray(hist, np.float64).ravel()
+    total = hist.sum()
+    if total == 0:
+        return 0
+    scale = 1.0 / total
+    mu = float(np.dot(np.arange(256), hist)) * scale
+
+    q1 = mu1 = max_sigma = 0.0
+    max_val = 0
+    for i in range(256):
+        p_i = hist[i] * scale
+        mu1 *= q1
+        q1 += p_i
+        q2 = 1.0 - q1
+        if min(q1, q2) < _FLT_EPSILON or max(q1, q2) > 1.0 - _FLT_EPSILON:
+            continue
+        mu1 = (mu1 + i * p_i) / q1
+        mu2 = (mu - q1 * mu1) / q2
+        sigma = q1 * q2 * (mu1 - mu2) * (mu1 - mu2)
+        if sigma > max_sigma:
+            max_sigma = sigma
+            max_val = i
+    return max_val
+
+
+def open_array(src, mode: str = 'r'):
+    """.npy 경로면 메모리 매핑으로 열고, 배열이면 그대로 반환"""
+    if isinstance(src, (str, os.PathLike)):
+        return np.load(src, mmap_mode=mode)
+    return src
+
+
+class TiledBinarizer:
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET, tile_size: int = None,
+                 flatten_alpha: bool = True):
+        """
+        param memory_budget: 타일 처리에 쓸 최대 메모리(byte) - 타일 크기를 정하는 기준
+        param tile_size: 타일 한 변 길이를 직접 지정 (None 이면 memory_budget 으로 계산)
+        param flatten_alpha: 4채널이면 흰 배경 합성 후 처리 (PreprocessEngine.binarize 와 같음)
+        """
+        self.__memory_budget = memory_budget
+        self.__tile_size = tile_size
+        self.__flatten_alpha = flatten_alpha
+        self.__engine = PreprocessEngine()
+        self.__buffers = {}
+        self.__tile_pixels = 0  # 겹침 포함 가장 큰 타일의 화소 수
+
+    def get_tile_size(self, channels: int) -> int:
+        """
+        타일 한 변 길이
+        화소당 입력 복사본(channels) + gray + blur 버퍼 + 합성용 strip 여유분으로 계산
+        """
+        if self.__tile_size:
+            return min(self.__tile_size, MAX_TILE_SIDE)
+        per_pixel = channels + 4
+        side = int((self.__memory_budget / per_pixel) ** 0.5) - 2 * HALO
+        return max(MIN_TILE_SIDE, min(MAX_TILE_SIDE, side))
+
+    def iter_tiles(self, shape):
+        """(y0, y1, x0, x1) 타일 영역을 행 우선 순서로 yield"""
+        h, w = shape[:2]
+        side = self.get_tile_size(shape[2] if len(shape) == 3 else 1)
+        self.__tile_pixels = (side + 2 * HALO) ** 2
+        for y0 in range(0, h, side):
+            for x0 in range(0, w, side):
+                yield y0, min(h, y0 + side), x0, min(w, x0 + side)
+
+    def histogram(self, src) -> np.ndarray:
+        """1차 패스: 블러된 흑백 이미지 전체의 히스토그램 (256,) int64"""
+        src = open_array(src)
+        hist = np.zeros(256, np.int64)
+        for tile in self.iter_tiles(src.shape):
+            blur, inner = self.__blur_tile(src, *tile)
+            counts = cv2.calcHist([blur[inner]], [0], None, [256], [0, 256])
+            hist += counts.ravel().astype(np.int64)
+        return hist
+
+    def binarize(self, src, dst=None):
+        """
+        2-패스 타일 이진화
+        param src: (H, W[, C]) uint8 배열, np.memmap 또는 .npy 경로
+        param dst: 출력 (H, W) uint8 배열, np.memmap 또는 .npy 경로 (없으면 새로 만듦 / 경로면 새 파일)
+        return: (threshold, dst)
+        """
+        src = open_array(src)
+        h, w = src.shape[:2]
+        if isinstance(dst, (str, os.PathLike)):
+            dst = np.lib.format.open_memmap(dst, mode='w+', dtype=np.uint8, shape=(h, w))
+        elif dst is None:
+            dst = np.empty((h, w), np.uint8)
+        elif dst.shape != (h, w) or dst.dtype != np.uint8:
+            raise ValueError(f'dst 는 {(h, w)} 크기의 uint8 배열이어야 함: {dst.shape} {dst.dtype}')
+
+        threshold = otsu_threshold(self.histogram(src))
+        for y0, y1, x0, x1 in self.iter_tiles(src.shape):
+            blur, inner = self.__blur_tile(src, y0, y1, x0, x1)
+            cv2.threshold(blur, threshold, 255, cv2.THRESH_BINARY, dst=blur)
+            dst[y0:y1, x0:x1] = blur[inner]
+        if isinstance(dst, np.memmap):
+            dst.flush()
+        return threshold, dst
+
+    def __blur_tile(self, src, y0, y1, x0, x1):
+        """겹침(HALO) 포함 영역을 읽어 흑백 + 블러, (블러 배열, 안쪽 영역 slice) 반환"""
+        h, w = src.shape[:2]
+        top, left = max(0, y0 - HALO), max(0, x0 - HALO)
+        bottom, right = min(h, y1 + HALO), min(w, x1 + HALO)
+        tile = np.ascontiguousarray(src[top:bottom, left:right])
+
+        shape = tile.shape[:2]
+        gray = self.__buffer('gray', shape)
+        self.__engine.to_gray(tile, gray, self.__flatten_alpha)
+        blur = self.__buffer('blur', shape)
+        # 이미지 가장자리 타일은 cv2 기본 경계 처리(BORDER_REFLECT_101)가 전체 이미지와 같게 적용됨
+        cv2.GaussianBlur(gray, BLUR_KSIZE, 0, dst=blur)
+        return blur, (slice(y0 - top, y1 - top), slice(x0 - left, x1 - left))
+
+    def __buffer(self, name, shape):
+        # 가장 큰 타일 크기로 한 번 할당하고, 작은 타일은 앞부분을 연속 배열로 잘라 사용
+        size = shape[0] * shape[1]
+        buf = self.__buffers.get(name)
+        if buf is None or buf.size < size:
+            buf = self.__buffers[name] = None
+            buf = self.__buffers[name] = np.empty(max(size, self.__tile_pixels), np.uint8)
+        return buf[:size].reshape(shape)
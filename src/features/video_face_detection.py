@@ -0,0 +1,231 @@
+# features/video_face_detection.py
+"""
+VideoFaceDetection 클래스
+- 동영상 프레임마다 cascade 를 돌리지 않고, 키프레임(N 프레임마다 또는 장면 전환 시)에서만 검출
+- 키프레임 사이에는 템플릿 매칭으로 이전 위치 주변만 탐색해 얼굴 상자를 이어감
+- 키프레임 검출 결과는 IoU 로 기존 추적과 짝지어 얼굴 ID(이름)를 유지
+- target_fps 가 주어지면 검출/추적에 걸린 시간을 보고 N 을 자동으로 조절
+"""
+import time
+from typing import NamedTuple
+
+import cv2
+import numpy as np
+
+from src.features.face_detection import FaceData
+from src.features.modules.face_detector import detect_face_positions
+
+# 장면 전환 판단용 축소 이미지 크기
+THUMB_SIZE = (64, 36)
+
+
+class VideoFaceStats(NamedTuple):
+    frames: int
+    keyframes: int
+    elapsed: float
+    detect_every: int
+
+    @property
+    def fps(self):
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _Track:
+    def __init__(self, track_id, box, template):
+        self.track_id = track_id
+        self.box = box          # np.ndarray (x, y, w, h) int32
+        self.template = template
+
+
+def iou(a, b):
+    """(x, y, w, h) 두 사각형의 IoU"""
+    x0, y0 = max(a[0], b[0]), max(a[1], b[1])
+    x1, y1 = min(a[0] + a[2], b[0] + b[2]), min(a[1] + a[3], b[1] + b[3])
+    inter = max(0, x1 - x0) * max(0, y1 - y0)
+    union = a[2] * a[3] + b[2] * b[3] - inter
+    return inter / union if union > 0 else 0.0
+
+
+class VideoFaceDetection:
+    def __init__(self, detect_every: int = 10, target_fps: float = None,
+                 scene_threshold: float = 30.0, match_threshold: float = 0.6,
+                 iou_threshold: float = 0.3, search_margin: float = 0.5,
+                 min_neighbors: int = 4, max_side: int = None, min_face_size: int = None,
+                 min_every: int = 1, max_every: int = 60):
+        """
+        param detect_every: 키프레임 간격 N (target_fps 가 있으면 시작값)
+        param target_fps: 유지할 처리 속도, None 이면 N 고정
+        param scene_threshold: 직전 키프레임과 축소 이미지 평균 밝기 차이가 이 값을 넘으면 장면 전환으로 보고 검출
+        param match_threshold: 템플릿 매칭 점수(TM_CCOEFF_NORMED)가 이보다 낮으면 추적 종료
+        param iou_threshold: 키프레임 검출 결과를 기존 추적과 같은 얼굴로 볼 최소 IoU
+        param search_margin: 추적 시 탐색 범위 (상자 크기 대비 여백 비율)
+        param min_neighbors, max_side, min_face_size: detect_face_positions 인자
+        param min_every, max_every: 자동 조절 시 N 의 범위
+        """
+        self.__detect_every = detect_every
+        self.__target_fps = target_fps
+        self.__scene_threshold = scene_threshold
+        self.__match_threshold = match_threshold
+        self.__iou_threshold = iou_threshold
+        self.__search_margin = search_margin
+        self.__detect_kwargs = dict(min_neighbors=min_neighbors, max_side=max_side, min_face_size=min_face_size)
+        self.__min_every = min_every
+        self.__max_every = max_every
+        self.reset()
+
+    def reset(self):
+        """추적 상태와 통계 초기화 (새 동영상을 시작할 때)"""
+        self.__tracks = []
+        self.__next_id = 1
+        self.__since_keyframe = None
+        self.__key_thumb = None
+        self.__detect_seconds = None   # 키프레임 1장 처리 시간 (지수 이동 평균)
+        self.__track_seconds = None    # 추적 프레임 1장 처리 시간 (지수 이동 평균)
+        self.__frames = 0
+        self.__keyframes = 0
+        self.__elapsed = 0.0
+
+    def get_detect_every(self):
+        return self.__detect_every
+
+    def set_detect_every(self, detect_every: int):
+        self.__detect_every = max(1, int(detect_every))
+
+    def set_target_fps(self, target_fps: float):
+        self.__target_fps = target_fps
+
+    def get_stats(self) -> VideoFaceStats:
+        return VideoFaceStats(self.__frames, self.__keyframes, self.__elapsed, self.__detect_every)
+
+    def process(self, frame: np.ndarray):
+        """
+        프레임 1장 처리
+        param frame: BGR 또는 흑백 프레임
+        return: FaceData 리스트 - name 은 추적이 이어지는 동안 같은 값('얼굴-0001' 등)
+        """
+        start = time.perf_counter()
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        thumb = cv2.resize(gray, THUMB_SIZE, interpolation=cv2.INTER_AREA)
+
+        keyframe = (
+            self.__since_keyframe is None
+            or self.__since_keyframe + 1 >= self.__detect_every
+            or self.__is_scene_change(thumb)
+        )
+        if keyframe:
+            self.__detect(gray)
+            self.__key_thumb = thumb
+            self.__since_keyframe = 0
+            self.__keyframes += 1
+        else:
+            self.__track(gray)
+            self.__since_keyframe += 1
+
+        elapsed = time.perf_counter() - start
+        self.__update_timing(keyframe, elapsed)
+        self.__frames += 1
+        self.__elapsed += elapsed
+        return [FaceData(f'얼굴-{t.track_id:04d}', t.box.copy()) for t in self.__tracks]
+
+    def iter_video(self, source):
+        """
+        동영상 전체를 처리하며 (프레임 번호, 프레임, FaceData 리스트) 를 yield
+        param source: 파일 경로, 카메라 번호 또는 cv2.VideoCapture
+        """
+        cap = source if isinstance(source, cv2.VideoCapture) else cv2.VideoCapture(source)
+        if not cap.isOpened():
+            raise FileNotFoundError(f'동영상을 열 수 없음: {source}')
+        self.reset()
+        try:
+            index = 0
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                yield index, frame, self.process(frame)
+                index += 1
+        finally:
+            if cap is not source:
+                cap.release()
+
+    def __is_scene_change(self, thumb):
+        if self.__key_thumb is None:
+            return True
+        return cv2.absdiff(thumb, self.__key_thumb).mean() > self.__scene_threshold
+
+    def __detect(self, gray):
+        positions = detect_face_positions(gray, 1.1, **self.__detect_kwargs)
+
+        # IoU 가 큰 쌍부터 기존 추적과 짝지음 (같은 얼굴이면 ID 유지)
+        pairs = sorted(
+            ((iou(t.box, p), ti, pi) for ti, t in enumerate(self.__tracks) for pi, p in enumerate(positions)),
+            reverse=True,
+        )
+        owner = {}
+        used = set()
+        for score, ti, pi in pairs:
+            if score < self.__iou_threshold:
+                break
+            if ti in used or pi in owner:
+                continue
+            owner[pi] = self.__tracks[ti].track_id
+            used.add(ti)
+
+        tracks = []
+        for pi, box in enumerate(positions):
+            track_id = owner.get(pi)
+            if track_id is None:
+                track_id = self.__next_id
+                self.__next_id += 1
+            tracks.append(_Track(track_id, box, self.__crop(gray, box)))
+        self.__tracks = tracks
+
+    def __track(self, gray):
+        h, w = gray.shape[:2]
+        tracks = []
+        for t in self.__tracks:
+            x, y, bw, bh = (int(v) for v in t.box)
+            mx, my = int(bw * self.__search_margin), int(bh * self.__search_margin)
+            x0, y0 = max(0, x - mx), max(0, y - my)
+            x1, y1 = min(w, x + bw + mx), min(h, y + bh + my)
+            th, tw = t.template.shape[:2]
+            if x1 - x0 < tw or y1 - y0 < th:
+                continue
+            result = cv2.matchTemplate(gray[y0:y1, x0:x1], t.template, cv2.TM_CCOEFF_NORMED)
+            _, score, _, loc = cv2.minMaxLoc(result)
+            if score < self.__match_threshold:
+                # 얼굴이 가려지거나 화면 밖으로 나감 -> 다음 키프레임에서 다시 검출
+                continue
+            t.box = np.array([x0 + loc[0], y0 + loc[1], bw, bh], np.int32)
+            tracks.append(t)
+        self.__tracks = tracks
+
+    def __crop(self, gray, box):
+        x, y, w, h = (int(v) for v in box)
+        return gray[y:y + h, x:x + w].copy()
+
+    def __update_timing(self, keyframe, elapsed):
+        """
+        키프레임/추적 프레임 처리 시간으로 target_fps 를 지킬 수 있는 가장 작은 N 계산
+        평균 프레임 시간 (d + (N - 1) * t) / N <= 1 / fps  =>  N >= (d - t) / (1 / fps - t)
+        """
+        if keyframe:
+            self.__detect_seconds = self.__ema(self.__detect_seconds, elapsed)
+        else:
+            self.__track_seconds = self.__ema(self.__track_seconds, elapsed)
+        if not self.__target_fps or self.__detect_seconds is None or self.__track_seconds is None:
+            return
+
+        budget = 1.0 / self.__target_fps
+        d, t = self.__detect_seconds, self.__track_seconds
+        if d <= budget:
+            every = self.__min_every
+        elif t >= budget:
+            every = self.__max_every
+        else:
+            every = int(np.ceil((d - t) / (budget - t)))
+        self.__detect_every = min(self.__max_every, max(self.__min_every, every))
+
+    @staticmethod
+    def __ema(prev, value, alpha=0.2):
+        return value if prev is None else prev + alpha * (value - prev)
@@ -0,0 +1,209 @@
+# files/folder_index.py
+"""
+FolderIndex 클래스
+- os.scandir 한 번으로 폴더의 이미지 파일을 수집 (확장자 대소문자 구분 없음)
+- (파일명, 크기, mtime, 포맷) 매니페스트를 __OUTPUT_FILES__ 옆에 저장
+- 다시 열 때는 stat 값만 비교해서 바뀐 파일만 포맷을 다시 판별
+"""
+import json
+import os
+from typing import NamedTuple
+
+from src.metrics import metrics
+
+FILE_EXT = ('png', 'jpg', 'gif')
+MANIFEST_NAME = '__FOLDER_INDEX__.json'
+MANIFEST_VERSION = 1
+
+# 파일 헤더(매직 넘버)로 실제 포맷 판별
+_MAGIC = (
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+)
+_EXT_FORMAT = {'png': 'png', 'jpg': 'jpeg', 'jpeg': 'jpeg', 'gif': 'gif'}
+
+
+class FolderEntry(NamedTuple):
+    path: str
+    size: int
+    mtime_ns: int
+    format: str
+
+
+class FolderChanges(NamedTuple):
+    added: list
+    removed: list
+    modified: list
+
+    def is_empty(self):
+        return not (self.added or self.removed or self.modified)
+
+
+def detect_format(path: str) -> str:
+    """파일 헤더로 이미지 포맷 판별, 읽을 수 없으면 확장자로 대신함"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(8)
+    except OSError:
+        head = b''
+    for magic, fmt in _MAGIC:
+        if head.startswith(magic):
+            return fmt
+    ext = os.path.splitext(path)[1][1:].lower()
+    return _EXT_FORMAT.get(ext, 'unknown')
+
+
+def read_image_size(path: str):
+    """
+    파일 헤더만 읽어 (width, height) 반환, 알 수 없는 포맷이거나 읽을 수 없으면 None
+    (JPEG 의 EXIF 회전은 반영하지 않음)
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(26)
+            if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+                return int.from_bytes(head[16:20], 'big'), int.from_bytes(head[20:24], 'big')
+            if head[:6] in (b'GIF87a', b'GIF89a'):
+                return int.from_bytes(head[6:8], 'little'), int.from_bytes(head[8:10], 'little')
+            if head.startswith(b'\xff\xd8'):
+                f.seek(2)
+                return _read_jpeg_size(f)
+    except OSError:
+        pass
+    return None
+
+
+def _read_jpeg_size(f):
+    """SOI 다음부터 마커를 건너뛰며 SOFn 세그먼트의 크기를 찾음"""
+    while True:
+        if f.read(1) != b'\xff':
+            return None
+        marker = f.read(1)
+        while marker == b'\xff':
+            # 채움(fill) 바이트
+            marker = f.read(1)
+        if not marker:
+            return None
+        code = marker[0]
+        if code in (0x01, 0xd8) or 0xd0 <= code <= 0xd7:
+            # 길이 필드가 없는 마커
+            continue
+        length = f.read(2)
+        if len(length) < 2:
+            return None
+        length = int.from_bytes(length, 'big')
+        if 0xc0 <= code <= 0xcf and code not in (0xc4, 0xc8, 0xcc):
+            sof = f.read(5)
+            if len(sof) < 5:
+                return None
+            return int.from_bytes(sof[3:5], 'big'), int.from_bytes(sof[1:3], 'big')
+        if code in (0xd9, 0xda):
+            return None
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+class FolderIndex:
+    def __init__(self, folder: str, file_ext=FILE_EXT):
+        self.__folder = folder
+        self.__file_ext = tuple('.' + e.lower() for e in file_ext)
+        self.__manifest_path = os.path.join(folder, MANIFEST_NAME)
+        self.__stats = {}   # 파일명 -> (size, mtime_ns, format)
+
+    def get_manifest_path(self):
+        return self.__manifest_path
+
+    def get_entries(self):
+        """파일명 순으로 정렬된 FolderEntry 리스트 반환"""
+        join = os.path.join
+        return [
+            FolderEntry(join(self.__folder, name), *self.__stats[name])
+            for name in sorted(self.__stats)
+        ]
+
+    def get_paths(self):
+        return [e.path for e in self.get_entries()]
+
+    def scan(self):
+        """
+        폴더를 한 번 훑어 인덱스를 갱신하고 FolderEntry 리스트를 반환
+        매니페스트와 크기/mtime 이 같은 파일은 헤더를 다시 읽지 않는다.
+        """
+        with metrics.span('scan'):
+            self.__update(self.__stats or self.__load_manifest())
+            return self.get_entries()
+
+    def refresh(self):
+        """
+        직전 스캔 결과와 비교해 폴더 변경분만 반환 (폴링 방식)
+        return: FolderChanges(added, removed, modified) - 각각 파일 경로 리스트
+        """
+        with metrics.span('scan.refresh'):
+            return self.__update(self.__stats)
+
+    def __update(self, known):
+        stats = {}
+        added, modified = [], []
+
+        for entry, st in self.__scandir():
+            name = entry.name
+            prev = known.get(name)
+            if prev is not None and prev[0] == st.st_size and prev[1] == st.st_mtime_ns:
+                stats[name] = prev
+                continue
+            stats[name] = (st.st_size, st.st_mtime_ns, detect_format(entry.path))
+            (added if prev is None else modified).append(name)
+
+        removed = [name for name in known if name not in stats]
+        if added or removed or modified:
+            self.__save_manifest(stats)
+        self.__stats = stats
+
+        join = os.path.join
+        return FolderChanges(
+            [join(self.__folder, n) for n in sorted(added)],
+            [join(self.__folder, n) for n in sorted(removed)],
+            [join(self.__folder, n) for n in sorted(modified)],
+        )
+
+    def __scandir(self):
+        try:
+            it = os.scandir(self.__folder)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        with it:
+            for entry in it:
+                if not entry.name.lower().endswith(self.__file_ext):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    yield entry, entry.stat()
+                except OSError:
+                    # 스캔 도중 삭제된 파일
+                    continue
+
+    def __load_manifest(self):
+        try:
+            with open(self.__manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {}
+        return {name: (size, mtime_ns, fmt) for name, size, mtime_ns, fmt in manifest.get('entries', [])}
+
+    def __save_manifest(self, stats):
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'entries': [[name, *stats[name]] for name in sorted(stats)],
+        }
+        tmp_path = self.__manifest_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.__manifest_path)
+        except OSError:
+            # 읽기 전용 폴더 등: 매니페스트 없이도 동작은 한다
+            pass
@@ -1,17 +1,24 @@
-import glob, os, shutil
+from src.files.folder_index import FolderIndex
+from src.files.output_files import OUTPUT_MODE_LAZY, materialize_outputs, resolve_output_file
 
 class FolderManager:
     def __init__(self, path):
         self.folder = path
+        self.index = FolderIndex(path)
         self.files = self._scan_files()
         self.work_file = self.files[0] if self.files else None
 
     def _scan_files(self):
-        FILE_EXT = ['png', 'jpg', 'gif']
-        files = []
-        for ext in FILE_EXT:
-            files.extend(glob.glob(os.path.join(self.folder, f'*.{ext}')))
-        return files
+        return [e.path for e in self.index.scan()]
+
+    def refresh(self):
+        """폴더 변경분(FolderChanges)만 반영하고 반환"""
+        changes = self.index.refresh()
+        if not changes.is_empty():
+            self.files = self.index.get_paths()
+            if self.work_file not in self.files:
+                self.work_file = self.files[0] if self.files else None
+        return changes
 
     def get_work_file(self):
         return self.work_file
@@ -23,11 +30,12 @@ class FolderManager:
     def get_files(self):
         return self.files
 
-    def init_output_folder(self):
-        output_folder = os.path.join(self.folder, '__OUTPUT_FILES__')
-        if not os.path.isdir(output_folder):
-            os.makedirs(output_folder)
-        for src_file in self.files:
-            out_file = os.path.join(output_folder, os.path.basename(src_file))
-            if not os.path.isfile(out_file):
-                shutil.copy(src_file, out_file)
\ No newline at end of file
+    def init_output_folder(self, mode=OUTPUT_MODE_LAZY):
+        """
+        __OUTPUT_FILES__ 준비 - mode 는 'lazy'(저장 시 생성) / 'link' / 'copy'
+        """
+        materialize_outputs(self.folder, self.files, mode)
+
+    def get_output_file(self, file_path):
+        """출력 파일이 있으면 그 경로, 없으면 원본 경로"""
+        return resolve_output_file(file_path)
@@ -0,0 +1,57 @@
+# files/folder_watcher.py
+"""
+FolderWatcher 클래스
+- 플랫폼별 파일 알림(inotify 등) 없이 주기적으로 폴더를 다시 스캔하는 폴링 감시자
+- refresh 함수가 돌려주는 FolderChanges 가 비어있지 않을 때만 콜백 호출
+- 감시 스레드에서 난 예외(refresh / 콜백)는 로그로 남기고 다음 주기에 계속 감시
+"""
+import threading
+
+from src.metrics.log import get_logger
+
+log = get_logger('FolderWatcher')
+
+
+class FolderWatcher:
+    def __init__(self, refresh, on_change=None, interval: float = 2.0):
+        """
+        param refresh: 호출하면 FolderChanges 를 반환하는 함수 (예: FolderData.refresh)
+        param on_change: 변경분이 있을 때 FolderChanges 를 인자로 받는 콜백 (감시 스레드에서 호출됨)
+        param interval: 폴링 간격(초)
+        """
+        self.__refresh = refresh
+        self.__on_change = on_change
+        self.__interval = interval
+        self.__stop_event = threading.Event()
+        self.__thread = None
+
+    def is_running(self):
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self):
+        if self.is_running():
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__run, name='FolderWatcher', daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout=None):
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+        self.__thread = None
+
+    def poll(self):
+        """한 번만 변경분을 확인하고 FolderChanges 반환"""
+        changes = self.__refresh()
+        if not changes.is_empty() and self.__on_change is not None:
+            self.__on_change(changes)
+        return changes
+
+    def __run(self):
+        while not self.__stop_event.wait(self.__interval):
+            try:
+                self.poll()
+            except Exception:
+                # 일시적인 오류(폴더 접근 불가 등)로 감시가 조용히 멈추지 않도록 기록만 하고 계속
+                log.exception('poll() 실패')
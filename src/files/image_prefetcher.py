@@ -0,0 +1,72 @@
+# files/image_prefetcher.py
+"""
+ImagePrefetcher 클래스
+- 현재 작업 파일 앞뒤 N개의 이미지를 백그라운드 스레드에서 미리 디코딩
+- 뷰어는 get() 으로 디코딩된 이미지를 바로 받음 (아직 디코딩 중이면 그 결과를 기다림)
+"""
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+from src.cache.image_cache import get_image_cache
+
+
+class ImagePrefetcher:
+    def __init__(self, radius: int = 2, loader=None, max_workers: int = 1):
+        """
+        param radius: 현재 파일 기준 앞뒤로 미리 읽을 파일 수
+        param loader: 경로를 받아 이미지를 반환하는 함수 (기본값: 공유 ImageCache 를 거친 디코딩)
+        param max_workers: 디코딩 스레드 수
+        """
+        self.__radius = radius
+        self.__loader = loader or get_image_cache().get
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ImagePrefetcher')
+        self.__lock = threading.Lock()
+        self.__futures = {}     # 경로 -> Future
+
+    def get_radius(self):
+        return self.__radius
+
+    def prefetch(self, items, center: int, key=None):
+        """
+        items[center] 앞뒤 radius 범위의 이미지를 미리 디코딩하도록 예약
+        범위를 벗어난 이미지는 버려서 메모리를 제한한다.
+
+        param items: 경로 리스트, 또는 key 로 경로를 얻을 수 있는 객체 리스트 (예: FileData)
+        param key: items 의 원소에서 경로를 얻는 함수 (예: FileData.get_file_name)
+        """
+        if center < 0 or not items:
+            return
+        lo = max(center - self.__radius, 0)
+        hi = min(center + self.__radius + 1, len(items))
+        # 가까운 파일부터 예약
+        window = sorted(range(lo, hi), key=lambda i: abs(i - center))
+        wanted = [key(items[i]) if key else items[i] for i in window]
+
+        with self.__lock:
+            for path in list(self.__futures):
+                if path not in wanted:
+                    self.__futures.pop(path).cancel()
+            for path in wanted:
+                if path not in self.__futures:
+                    self.__futures[path] = self.__executor.submit(self.__loader, path)
+
+    def get(self, path):
+        """디코딩된 이미지 반환, 예약되지 않은 경로면 즉시 디코딩"""
+        with self.__lock:
+            future = self.__futures.get(path)
+        if future is not None:
+            try:
+                return future.result()
+            except CancelledError:
+                pass
+        return self.__loader(path)
+
+    def clear(self):
+        with self.__lock:
+            for future in self.__futures.values():
+                future.cancel()
+            self.__futures.clear()
+
+    def shutdown(self):
+        self.clear()
+        self.__executor.shutdown(wait=False)
@@ -0,0 +1,105 @@
+# files/output_files.py
+"""
+__OUTPUT_FILES__ 폴더 관리 함수
+- OUTPUT_MODE_LAZY: 폴더를 열 때는 아무것도 만들지 않고, 처음 저장할 때 출력 파일 생성
+- OUTPUT_MODE_LINK: 폴더를 열 때 reflink / hardlink 로 출력 파일 생성 (지원 안 되면 복사)
+- OUTPUT_MODE_COPY: 기존 방식, 폴더를 열 때 원본을 모두 복사
+- 출력 파일이 아직 없으면 resolve_output_file() 은 원본 경로를 반환
+- 저장은 임시 파일에 쓴 뒤 os.replace 로 교체하므로 hardlink 된 원본은 절대 수정되지 않음
+"""
+import os
+import shutil
+
+OUTPUT_FOLDER_NAME = '__OUTPUT_FILES__'
+
+OUTPUT_MODE_LAZY = 'lazy'
+OUTPUT_MODE_LINK = 'link'
+OUTPUT_MODE_COPY = 'copy'
+
+# linux/fs.h: FICLONE = _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+
+def get_output_folder(folder: str) -> str:
+    return os.path.join(folder, OUTPUT_FOLDER_NAME)
+
+
+def get_output_path(src_file: str) -> str:
+    """원본 파일에 대응하는 출력 파일 경로 (존재 여부와 무관)"""
+    folder, name = os.path.split(src_file)
+    return os.path.join(get_output_folder(folder), name)
+
+
+def resolve_output_file(src_file: str) -> str:
+    """출력 파일이 있으면 그 경로, 아직 없으면 원본 경로 반환"""
+    out_file = get_output_path(src_file)
+    return out_file if os.path.isfile(out_file) else src_file
+
+
+def _reflink(src: str, dst: str) -> bool:
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        if os.path.exists(dst):
+            os.remove(dst)
+        return False
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    reflink -> hardlink -> 복사 순서로 시도해서 dst 생성
+    return: 사용된 방식 ('reflink', 'hardlink', 'copy')
+    """
+    if _reflink(src, dst):
+        return 'reflink'
+    try:
+        os.link(src, dst)
+        return 'hardlink'
+    except OSError:
+        shutil.copy(src, dst)
+        return 'copy'
+
+
+def materialize_outputs(folder: str, src_files, mode: str = OUTPUT_MODE_LAZY):
+    """
+    출력 폴더를 만들고 mode 에 따라 출력 파일을 준비
+    이미 있는 출력 파일은 건드리지 않는다.
+    """
+    output_folder = get_output_folder(folder)
+    os.makedirs(output_folder, exist_ok=True)
+    if mode == OUTPUT_MODE_LAZY:
+        return
+
+    existing = set(os.listdir(output_folder))
+    for src_file in src_files:
+        name = os.path.basename(src_file)
+        if name in existing:
+            continue
+        out_file = os.path.join(output_folder, name)
+        if mode == OUTPUT_MODE_LINK:
+            link_or_copy(src_file, out_file)
+        else:
+            shutil.copy(src_file, out_file)
+
+
+def replace_output_file(out_file: str, write):
+    """
+    write(tmp_path) 로 임시 파일을 쓴 뒤 out_file 로 교체
+    hardlink 였던 출력 파일도 새 inode 로 바뀌므로 원본은 그대로 남는다.
+    임시 파일은 확장자를 유지해서 PIL 등이 포맷을 판단할 수 있게 한다.
+    """
+    folder, name = os.path.split(out_file)
+    os.makedirs(folder, exist_ok=True)
+    tmp_path = os.path.join(folder, '.~' + name)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, out_file)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,61 @@
+# metrics/log.py
+"""
+레벨별 로거
+- print 대신 logging 을 사용해 레벨로 출력량을 조절 (파일 이동 같은 잦은 호출은 DEBUG)
+- 출력 형식은 기존 print 와 같은 '[이름] 메시지'
+- 기본 레벨은 INFO, 환경 변수 OPENCV_FLOW_LOG_LEVEL(DEBUG/INFO/WARNING...) 또는 set_log_level() 로 변경
+- 메시지는 logger.debug('... %s', value) 처럼 인자로 넘겨 레벨이 꺼져 있으면 문자열을 만들지 않음
+"""
+import logging
+import os
+import sys
+
+ROOT_LOGGER = 'opencv_flow'
+ENV_LOG_LEVEL = 'OPENCV_FLOW_LOG_LEVEL'
+
+
+class _ShortNameFormatter(logging.Formatter):
+    """'opencv_flow.DataManager' -> '[DataManager] 메시지'"""
+
+    def format(self, record):
+        message = f'[{record.name.rpartition(".")[2]}] {record.getMessage()}'
+        if record.exc_info:
+            message += '\n' + self.formatException(record.exc_info)
+        return message
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """출력할 때마다 sys.stdout 을 찾음 - 기존 print 처럼 contextlib.redirect_stdout 을 따름"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def _init_root():
+    root = logging.getLogger(ROOT_LOGGER)
+    if not root.handlers:
+        handler = _StdoutHandler()
+        handler.setFormatter(_ShortNameFormatter())
+        root.addHandler(handler)
+        root.setLevel(os.environ.get(ENV_LOG_LEVEL, 'INFO').upper())
+        root.propagate = False
+    return root
+
+
+def get_logger(name: str) -> logging.Logger:
+    """'[name] 메시지' 형식으로 출력하는 로거 반환"""
+    _init_root()
+    return logging.getLogger(f'{ROOT_LOGGER}.{name}')
+
+
+def set_log_level(level):
+    """level: logging.DEBUG 같은 정수 또는 'DEBUG' 같은 이름"""
+    _init_root().setLevel(level.upper() if isinstance(level, str) else level)
@@ -0,0 +1,274 @@
+# metrics/metrics.py
+"""
+Metrics 클래스
+- 이름 붙인 구간(span)의 소요 시간을 히스토그램으로, 이벤트 수를 카운터로 모음
+    with span('ocr'): ...           # 구간 시간 측정
+    observe('decode', elapsed)      # 이미 잰 시간 기록
+    count('ocr.cache_hit')          # 카운터 증가
+- 꺼져 있으면(기본값) span() 은 공유 no-op 객체를 반환하고 count()/observe() 는 바로 반환하므로 비용이 거의 없음
+- enable() 또는 환경 변수 OPENCV_FLOW_METRICS=<경로> 로 켜고, 종료 시 JSON(.json) 또는
+  Prometheus text(.prom / .txt) 파일로 저장
+- 히스토그램 버킷은 누적(le 이하) 개수로 보관 (Prometheus 형식과 같음)
+"""
+import atexit
+import bisect
+import json
+import multiprocessing
+import os
+import threading
+import time
+
+ENV_METRICS = 'OPENCV_FLOW_METRICS'
+PROMETHEUS_PREFIX = 'opencv_flow'
+# 초 단위 버킷 상한 (마지막 +Inf 는 자동 추가)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+FORMAT_JSON = 'json'
+FORMAT_PROMETHEUS = 'prometheus'
+
+
+class _NullSpan:
+    """꺼져 있을 때 span() 이 반환하는 공유 객체"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('__metrics', '__name', '__start')
+
+    def __init__(self, metrics, name):
+        self.__metrics = metrics
+        self.__name = name
+        self.__start = 0.0
+
+    def __enter__(self):
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.__metrics.observe(self.__name, time.perf_counter() - self.__start)
+        return False
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)     # 구간별 개수 (마지막은 +Inf)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def get_cumulative(self):
+        """[(상한 문자열, 누적 개수)] - 마지막은 '+Inf'"""
+        bounds = [repr(b) for b in self.buckets] + ['+Inf']
+        total, result = 0, []
+        for bound, n in zip(bounds, self.counts):
+            total += n
+            result.append((bound, total))
+        return result
+
+    def get_quantile(self, q: float):
+        """버킷 상한으로 근사한 분위수 (값이 없으면 None)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        total = 0
+        for n, upper in zip(self.counts, self.buckets + (self.max,)):
+            total += n
+            if total >= rank:
+                return min(upper, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.get_quantile(0.5),
+            'p95': self.get_quantile(0.95),
+            'buckets': dict(self.get_cumulative()),
+        }
+
+
+class Metrics:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.__buckets = tuple(sorted(buckets))
+        self.__histograms = {}  # span 이름 -> Histogram
+        self.__counters = {}    # 카운터 이름 -> int
+        self.__lock = threading.Lock()
+
+    def span(self, name: str):
+        return _Span(self, name)
+
+    def observe(self, name: str, seconds: float):
+        with self.__lock:
+            histogram = self.__histograms.get(name)
+            if histogram is None:
+                histogram = self.__histograms[name] = Histogram(self.__buckets)
+            histogram.observe(seconds)
+
+    def count(self, name: str, n: int = 1):
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + n
+
+    def get_histogram(self, name: str):
+        return self.__histograms.get(name)
+
+    def get_counter(self, name: str) -> int:
+        return self.__counters.get(name, 0)
+
+    def reset(self):
+        with self.__lock:
+            self.__histograms.clear()
+            self.__counters.clear()
+
+    def to_dict(self):
+        with self.__lock:
+            return {
+                'spans': {name: h.to_dict() for name, h in sorted(self.__histograms.items())},
+                'counters': dict(sorted(self.__counters.items())),
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition 형식 (span -> <prefix>_span_seconds, 카운터 -> <prefix>_events_total)"""
+        data = self.to_dict()
+        lines = []
+        if data['spans']:
+            metric = f'{PROMETHEUS_PREFIX}_span_seconds'
+            lines.append(f'# HELP {metric} Latency of named processing stages.')
+            lines.append(f'# TYPE {metric} histogram')
+            for name, h in data['spans'].items():
+                label = _escape_label(name)
+                for bound, total in h['buckets'].items():
+                    lines.append(f'{metric}_bucket{{span="{label}",le="{bound}"}} {total}')
+                lines.append(f'{metric}_sum{{span="{label}"}} {h["sum"]!r}')
+                lines.append(f'{metric}_count{{span="{label}"}} {h["count"]}')
+        if data['counters']:
+            metric = f'{PROMETHEUS_PREFIX}_events_total'
+            lines.append(f'# HELP {metric} Number of named events.')
+            lines.append(f'# TYPE {metric} counter')
+            for name, n in data['counters'].items():
+                lines.append(f'{metric}{{event="{_escape_label(name)}"}} {n}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str, fmt: str = None):
+        """path 에 저장, fmt 가 없으면 확장자로 판단 (.prom / .txt -> Prometheus, 그 외 JSON)"""
+        fmt = fmt or get_format(path)
+        text = self.to_prometheus() if fmt == FORMAT_PROMETHEUS else self.to_json()
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def get_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    return FORMAT_PROMETHEUS if ext in ('.prom', '.txt') else FORMAT_JSON
+
+
+# 켜져 있을 때만 Metrics 객체, 꺼져 있으면 None (span/count/observe 가 이 값 하나만 확인)
+_active = None
+_dump_targets = []
+_atexit_registered = False
+_owner_pid = None
+
+
+def enable(dump_path: str = None, fmt: str = None, buckets=DEFAULT_BUCKETS) -> Metrics:
+    """
+    계측 켜기 (이미 켜져 있으면 기존 Metrics 를 유지)
+    param dump_path: 종료 시 저장할 파일 경로 (None 이면 저장하지 않음, 이미 등록된 경로 / 형식이면 다시 등록하지 않음)
+    param fmt: 'json' | 'prometheus' (None 이면 확장자로 판단)
+    """
+    global _active, _atexit_registered, _owner_pid
+    if _active is None:
+        _active = Metrics(buckets)
+    if dump_path is not None:
+        target = (os.path.abspath(dump_path), fmt or get_format(dump_path))
+        if target not in _dump_targets:
+            _dump_targets.append(target)
+        if not _atexit_registered:
+            # fork 된 작업 프로세스가 부모의 결과 파일을 덮어쓰지 않도록 등록한 프로세스에서만 저장
+            _owner_pid = os.getpid()
+            atexit.register(_dump_at_exit)
+            _atexit_registered = True
+    return _active
+
+
+def disable():
+    """계측 끄기 (모은 값과 종료 시 저장 예약은 버림)"""
+    global _active
+    _active = None
+    _dump_targets.clear()
+
+
+def is_enabled() -> bool:
+    return _active is not None
+
+
+def get_metrics():
+    """켜져 있으면 Metrics, 아니면 None"""
+    return _active
+
+
+def span(name: str):
+    """
+    구간 시간 측정용 context manager
+    꺼져 있으면 공유 no-op 객체를 반환
+    """
+    metrics = _active
+    if metrics is None:
+        return _NULL_SPAN
+    return _Span(metrics, name)
+
+
+def observe(name: str, seconds: float):
+    metrics = _active
+    if metrics is not None:
+        metrics.observe(name, seconds)
+
+
+def count(name: str, n: int = 1):
+    metrics = _active
+    if metrics is not None:
+        metrics.count(name, n)
+
+
+def _dump_at_exit():
+    metrics = _active
+    if metrics is None or os.getpid() != _owner_pid:
+        return
+    for path, fmt in _dump_targets:
+        try:
+            metrics.dump(path, fmt)
+        except OSError:
+            pass
+
+
+# spawn 방식 작업 프로세스는 모듈을 다시 import 하므로 메인 프로세스에서만 환경 변수로 켬
+if os.environ.get(ENV_METRICS) and multiprocessing.parent_process() is None:
+    enable(os.environ[ENV_METRICS])
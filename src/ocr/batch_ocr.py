@@ -0,0 +1,180 @@
+# ocr/batch_ocr.py
+"""
+BatchOcr 클래스
+- 폴더 전체(FileData 리스트) 중 OCR 이 아직 실행되지 않은 파일을 일괄 처리
+- 같은 크기의 이미지끼리 묶어 easyocr readtext_batched 로 한 번에 인식
+- 하나의 (이미 로드된) easyocr Reader 를 여러 작업 스레드가 공유
+- 처리 속도(images/sec) 보고 및 중간 취소 지원
+- OcrCache 가 주어지면 모델을 부르기 전에 캐시부터 확인 (readtext 파라미터는 캐시 키와 같은 값 사용)
+- 디코딩 / 인식 중 예외가 난 배치는 실패로 세고 다음 배치를 계속 처리
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from src.cache.image_cache import get_image_cache
+from src.metrics import metrics
+from src.metrics.log import get_logger
+
+log = get_logger('BatchOcr')
+
+
+# __recognize 가 예외로 끝난 배치
+_FAILED = object()
+
+
+class BatchOcrReport(NamedTuple):
+    total: int
+    processed: int
+    failed: int
+    elapsed: float
+    cancelled: bool
+    cache_hits: int = 0
+
+    @property
+    def images_per_sec(self):
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def read_rgb(path):
+    """
+    easyocr 가 경로를 읽을 때와 같은 RGB 이미지, 읽을 수 없으면 None
+    공유 이미지 캐시를 거치므로 미리 읽어 둔(prefetch) 이미지는 다시 디코딩하지 않음 (읽기 전용 배열)
+    """
+    return get_image_cache().get_plane(path, 'rgb')
+
+
+class BatchOcr:
+    def __init__(self, reader, workers: int = 2, batch_size: int = 8, loader=None, readtext_kwargs=None,
+                 cache=None):
+        """
+        param reader: 로드된 easyocr.Reader (모든 작업 스레드가 공유)
+        param workers: 디코딩/인식 작업 스레드 수
+        param batch_size: readtext_batched 한 번에 넣을 이미지 수
+        param loader: 경로를 받아 RGB 이미지를 반환하는 함수 (기본값 read_rgb)
+                      easyocr 는 배열을 RGB 로 보고 그대로 쓰므로 BGR 을 넘기면 경로를 넘길 때와 결과가 달라짐
+        param readtext_kwargs: readtext_batched 에 그대로 전달할 인자 (cache 가 있으면 생략 시 캐시의 값 사용)
+        param cache: OcrCache (없으면 캐시를 사용하지 않음)
+        Raises:
+            ValueError: readtext_kwargs 가 cache 의 키에 쓰는 파라미터와 다를 경우.
+        """
+        if cache is not None:
+            cache_kwargs = cache.get_readtext_kwargs()
+            if readtext_kwargs is not None and dict(readtext_kwargs) != cache_kwargs:
+                raise ValueError(f'readtext_kwargs 가 OcrCache 파라미터와 다름: {readtext_kwargs} != {cache_kwargs}')
+            readtext_kwargs = cache_kwargs
+        self.__reader = reader
+        self.__workers = max(1, workers)
+        self.__batch_size = max(1, batch_size)
+        self.__loader = loader or read_rgb
+        self.__readtext_kwargs = readtext_kwargs or {}
+        self.__cache = cache
+        self.__cancel_event = threading.Event()
+
+    def cancel(self):
+        """진행 중인 run() 을 현재 배치가 끝나는 대로 중단"""
+        self.__cancel_event.set()
+
+    def is_cancelled(self):
+        return self.__cancel_event.is_set()
+
+    def run(self, files, on_progress=None):
+        """
+        param files: FileData 리스트 (is_ocr_executed / get_file_name / set_texts 사용)
+        param on_progress: (done, total, images_per_sec) 를 받는 콜백
+        return: BatchOcrReport
+        """
+        self.__cancel_event.clear()
+        targets = [f for f in files if not f.is_ocr_executed()]
+        total = len(targets)
+        processed = failed = cache_hits = 0
+        start = time.perf_counter()
+
+        # 한 번에 디코딩해 둘 이미지 수를 제한해서 메모리 사용량을 묶어 둔다
+        chunk_size = self.__workers * self.__batch_size * 2
+        with ThreadPoolExecutor(self.__workers, thread_name_prefix='BatchOcr') as pool:
+            for offset in range(0, total, chunk_size):
+                if self.is_cancelled():
+                    break
+                chunk = targets[offset:offset + chunk_size]
+                if self.__cache is not None:
+                    chunk, hits = self.__apply_cached(pool, chunk)
+                    cache_hits += hits
+                    processed += hits
+                images = list(pool.map(self.__load, [f.get_file_name() for f in chunk]))
+
+                batches = []
+                for group in self.__group_by_size(chunk, images):
+                    for i in range(0, len(group), self.__batch_size):
+                        batches.append(group[i:i + self.__batch_size])
+                failed += sum(1 for img in images if img is None)
+
+                for batch, results in zip(batches, pool.map(self.__recognize, batches)):
+                    if results is None:
+                        continue
+                    if results is _FAILED:
+                        failed += len(batch)
+                    else:
+                        for (file_data, _), ocr_texts in zip(batch, results):
+                            file_data.set_texts(ocr_texts)
+                        processed += len(batch)
+                    if on_progress is not None:
+                        elapsed = time.perf_counter() - start
+                        on_progress(processed + failed, total, processed / elapsed if elapsed > 0 else 0.0)
+
+        return BatchOcrReport(total, processed, failed, time.perf_counter() - start, self.is_cancelled(), cache_hits)
+
+    def __apply_cached(self, pool, files):
+        """캐시에 결과가 있는 파일은 바로 set_texts 하고, 나머지 파일 리스트와 hit 수를 반환"""
+        misses = []
+        hits = 0
+        for file_data, ocr_texts in zip(files, pool.map(self.__cache_get, files)):
+            if ocr_texts is None:
+                misses.append(file_data)
+            else:
+                file_data.set_texts(ocr_texts)
+                hits += 1
+        return misses, hits
+
+    def __cache_get(self, file_data):
+        try:
+            return self.__cache.get(file_data.get_file_name())
+        except OSError:
+            return None
+
+    def __load(self, path):
+        try:
+            return self.__loader(path)
+        except Exception as e:
+            log.warning('%s : 이미지를 읽을 수 없음 (%s)', path, e)
+            return None
+
+    def __group_by_size(self, files, images):
+        """같은 (높이, 너비, 채널) 이미지끼리 묶음 - 리사이즈 없이 배치 인식하기 위함"""
+        groups = {}
+        for file_data, img in zip(files, images):
+            if img is None:
+                continue
+            groups.setdefault(img.shape, []).append((file_data, img))
+        return groups.values()
+
+    def __recognize(self, batch):
+        if self.is_cancelled():
+            return None
+        start = time.perf_counter()
+        try:
+            results = self.__reader.readtext_batched([img for _, img in batch], **self.__readtext_kwargs)
+        except Exception as e:
+            # 손상된 이미지 / 메모리 부족 등 - 이 배치만 실패로 처리하고 나머지는 계속
+            log.error('readtext_batched 실패 (%d 장, 첫 파일 %s) : %s', len(batch), batch[0][0].get_file_name(), e)
+            metrics.count('ocr.failed', len(batch))
+            return _FAILED
+        elapsed = time.perf_counter() - start
+        metrics.observe('ocr.batch', elapsed)
+        metrics.count('ocr.images', len(batch))
+        if self.__cache is not None:
+            cost = elapsed / len(batch)
+            for (file_data, _), ocr_texts in zip(batch, results):
+                self.__cache.put(file_data.get_file_name(), ocr_texts, cost)
+        return results
@@ -1,6 +1,9 @@
-import cv2
 import numpy as np
 
+from src.cache.image_cache import get_image_cache
+from src.features.modules.face_detector import detect_face_positions, read_detection_gray
+from src.features.modules.image_context import ImageContext
+
 class FaceData:
     def __init__(self, name, position):
         self.name = name
@@ -12,21 +15,36 @@ class TextData:
         self.position = position
 
 class ImageData:
-    def __init__(self, file_path):
+    def __init__(self, file_path, context: ImageContext = None):
         self.file_path = file_path
         self.texts = []
         self.faces = []
+        self.context = context
+
+    def get_context(self) -> ImageContext:
+        """얼굴 검출 / 이진화 / OCR 이 중간 이미지(plane)를 공유하는 ImageContext (없으면 생성)"""
+        if self.context is None:
+            self.context = ImageContext(self.file_path)
+        return self.context
 
     def set_faces(self, positions):
         if positions is not None and isinstance(positions, np.ndarray) and len(positions) > 0:
             self.faces = [FaceData(f'얼굴-{i+1:04d}', p) for i, p in enumerate(positions)]
 
-    def detect_faces(self):
-        detector = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        img = cv2.imread(self.file_path)
-        if img is None:
-            raise FileNotFoundError(f'이미지 없음: {self.file_path}')
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        faces = detector.detectMultiScale(gray, 1.1, 4)
+    def detect_faces(self, max_side: int = None, min_face_size: int = None, with_image: bool = True):
+        context = self.get_context()
+        if context.has_plane('gray') or (with_image and not (max_side or min_face_size)):
+            # 이미 만든 흑백 plane 이 있거나 어차피 컬러로 디코딩해야 하면 plane 을 공유
+            gray, source_scale = context.get_gray(), 1.0
+        else:
+            # 컬러 이미지가 필요 없으면 (축소된) 흑백으로 바로 디코딩하는 편이 쌈
+            gray, source_scale = read_detection_gray(self.file_path, max_side, min_face_size,
+                                                     read=get_image_cache().get)
+            if gray is None:
+                raise FileNotFoundError(f'이미지 없음: {self.file_path}')
+        faces = detect_face_positions(gray, 1.1, 4, max_side, min_face_size, source_scale=source_scale)
         self.set_faces(faces)
-        return img  # 이미지도 같이 반환
+        if not with_image:
+            return None
+        # plane 은 읽기 전용이므로 호출자가 그림을 그릴 수 있도록 복사본 반환
+        return context.get_source().copy()  # 이미지도 같이 반환
@@ -0,0 +1,67 @@
+# ocr/ocr_cache.py
+"""
+OcrCache 클래스
+- easyocr 결과를 ResultCache 에 영구 저장
+- 키: 이미지 내용 해시 + reader 언어 + readtext 파라미터
+  (같은 이미지라도 언어나 파라미터가 다르면 다른 결과로 취급)
+"""
+import hashlib
+import json
+
+from src.cache.result_cache import ResultCache, hash_file
+
+NAMESPACE = 'ocr'
+
+
+def _to_builtin(value):
+    # easyocr 결과에 섞여 있는 numpy 정수/실수를 JSON 으로 저장하기 위함
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f'JSON 변환 불가: {type(value)}')
+
+
+class OcrCache:
+    def __init__(self, cache: ResultCache, langs, readtext_kwargs=None):
+        """
+        param cache: 결과를 저장할 ResultCache (얼굴 검출 캐시 등과 공유 가능)
+        param langs: easyocr reader 언어 리스트 (예: ['ch_sim', 'en'])
+        param readtext_kwargs: readtext 에 넘기는 파라미터
+        """
+        self.__cache = cache
+        self.__readtext_kwargs = dict(readtext_kwargs or {})
+        # 언어 순서가 다르면 reader 의 문자 목록이 달라지므로 순서도 키에 포함
+        params = json.dumps(
+            {'langs': list(langs), 'readtext': self.__readtext_kwargs}, sort_keys=True, default=str
+        )
+        self.__params_digest = hashlib.sha1(params.encode('utf-8')).hexdigest()
+
+    def get_result_cache(self):
+        return self.__cache
+
+    def get_readtext_kwargs(self):
+        """키에 들어가는 readtext 파라미터 (캐시에 넣을 결과는 이 파라미터로 인식해야 함)"""
+        return dict(self.__readtext_kwargs)
+
+    def make_key(self, path: str) -> str:
+        return hash_file(path) + ':' + self.__params_digest
+
+    def get(self, path: str):
+        """
+        캐시된 OCR 결과 반환, 없으면 None
+        return: [(polygon, text, confidence), ...] - readtext 반환 형식과 동일
+        """
+        value = self.__cache.get(NAMESPACE, self.make_key(path))
+        if value is None:
+            return None
+        return [tuple(t) for t in json.loads(value)]
+
+    def put(self, path: str, ocr_texts, cost: float = 0.0):
+        """
+        param ocr_texts: readtext 결과
+        param cost: readtext 에 걸린 시간(초)
+        """
+        value = json.dumps([list(t) for t in ocr_texts], ensure_ascii=False, default=_to_builtin)
+        self.__cache.put(NAMESPACE, self.make_key(path), value.encode('utf-8'), cost)
+
+    def get_stats(self):
+        return self.__cache.get_stats(NAMESPACE)
@@ -0,0 +1,62 @@
+# ocr/reader_pool.py
+"""
+ReaderPool 클래스
+- easyocr.Reader 를 처음 OCR 할 때 만들고(lazy), 언어 조합별로 보관
+- 언어를 바꿨다가 되돌아와도 모델을 다시 로드하지 않음
+- warm_up() 으로 백그라운드 스레드에서 미리 로드 가능
+- easyocr(torch) 는 Reader 를 처음 만들 때 import 하므로 모듈 import 비용이 없음
+"""
+import threading
+
+
+def _create_easyocr_reader(langs):
+    import easyocr
+    return easyocr.Reader(list(langs))
+
+
+class ReaderPool:
+    def __init__(self, factory=None):
+        """
+        param factory: 언어 튜플을 받아 reader 를 만드는 함수 (기본값 easyocr.Reader)
+        """
+        self.__factory = factory or _create_easyocr_reader
+        self.__readers = {}     # 언어 튜플 -> reader
+        self.__locks = {}       # 언어 튜플 -> 생성 중 잠금
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def make_key(langs):
+        # easyocr 는 언어 순서대로 문자 목록을 합치므로 ['en', 'ch_sim'] 과 ['ch_sim', 'en'] 은 다른 reader
+        return tuple(langs)
+
+    def get(self, langs):
+        """langs 에 해당하는 reader 반환, 없으면 생성 (다른 스레드가 생성 중이면 기다림)"""
+        key = self.make_key(langs)
+        reader = self.__readers.get(key)
+        if reader is not None:
+            return reader
+
+        with self.__lock:
+            key_lock = self.__locks.setdefault(key, threading.Lock())
+        with key_lock:
+            reader = self.__readers.get(key)
+            if reader is None:
+                reader = self.__factory(key)
+                self.__readers[key] = reader
+        return reader
+
+    def is_loaded(self, langs):
+        return self.make_key(langs) in self.__readers
+
+    def warm_up(self, langs):
+        """백그라운드 스레드에서 reader 를 미리 로드하고 그 스레드를 반환"""
+        thread = threading.Thread(target=self.get, args=(langs,), name='ReaderWarmUp', daemon=True)
+        thread.start()
+        return thread
+
+    def release(self, langs):
+        """langs 의 reader 를 풀에서 제거 (GPU/메모리 반환용)"""
+        self.__readers.pop(self.make_key(langs), None)
+
+    def clear(self):
+        self.__readers.clear()
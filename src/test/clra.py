@@ -1,48 +1,11 @@
-import cv2
-import mediapipe as mp
+import os
+import sys
 
-# 초기화
-mp_pose = mp.solutions.pose
-pose = mp_pose.Pose()
-mp_drawing = mp.solutions.drawing_utils
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-# 동영상 입력
-cap = cv2.VideoCapture('sample.mp4')
+from src.video.cli import main
 
-# 동영상 저장 설정
-fourcc = cv2.VideoWriter_fourcc(*'mp4v')  # 코덱 지정 (mp4)
-fps = cap.get(cv2.CAP_PROP_FPS)
-width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-out = cv2.VideoWriter('output.mp4', fourcc, fps, (width, height))
-
-while cap.isOpened():
-    ret, frame = cap.read()
-    if not ret:
-        break
-
-    # BGR → RGB 변환
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    result = pose.process(rgb)
-
-    # 포즈 정보가 있으면 뼈대 그리기
-    if result.pose_landmarks:
-        mp_drawing.draw_landmarks(
-            frame,
-            result.pose_landmarks,
-            mp_pose.POSE_CONNECTIONS,
-            landmark_drawing_spec=mp_drawing.DrawingSpec(color=(0,255,0), thickness=2, circle_radius=2),
-            connection_drawing_spec=mp_drawing.DrawingSpec(color=(255,0,0), thickness=2)
-        )
-
-    # 처리한 프레임 저장
-    out.write(frame)
-
-    # 화면 출력
-    cv2.imshow('Pose Estimation', frame)
-    if cv2.waitKey(1) & 0xFF == 27:  # ESC 키로 종료
-        break
-
-cap.release()
-out.release()
-cv2.destroyAllWindows()
+# 포즈 추정 -> 뼈대 그리기 -> output.mp4 저장 / 화면 출력 (ESC 키로 종료)
+# 인자로 입력 / 출력 경로와 옵션을 바꿀 수 있음 (python main.py pose -h 참고)
+if __name__ == '__main__':
+    sys.exit(main(input='sample.mp4', output='output.mp4', overlay='skeleton', window='Pose Estimation', preview_every=1))
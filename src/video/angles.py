@@ -0,0 +1,127 @@
+# video/angles.py
+"""
+관절 각도 계산 (clra_hajung copy 2 / copy 4 에서 옮김)
+- calculate_angle: 세 점 a-b-c 에서 꼭짓점 b 의 각도(도) - 한 번에 한 각도
+- angle_alert: 관절별 정상 범위를 벗어났는지 판단
+- compute_angles: (프레임, 랜드마크, 2/3) 배열과 각도 표(AngleTable)로 모든 프레임의 모든 각도를 한 번에 계산
+  발목처럼 세 번째 점이 없는 각도는 "꼭짓점 + offset" 가짜 점으로 표에 기록 (calculate_angle 과 같은 결과)
+- compute_alerts: ALERT_RANGES 를 각도 배열 전체에 적용한 bool 마스크
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from src.video.pose import LANDMARK
+
+
+def calculate_angle(a, b, c):
+    a = np.array(a)
+    b = np.array(b)
+    c = np.array(c)
+    ba = a - b
+    bc = c - b
+    cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
+    cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
+    angle = np.arccos(cosine_angle)
+    return np.degrees(angle)
+
+
+def angle_alert(angle, joint):
+    if joint == "knee":
+        return angle < 90 or angle > 180
+    if joint == "hip":
+        return angle < 70 or angle > 180
+    if joint == "ankle":
+        return angle < 70 or angle > 110
+    if joint == "shoulder":
+        return angle < 70 or angle > 180
+    return False
+
+
+# 관절 종류 -> (최소, 최대) 정상 범위 (도) - angle_alert 와 같은 값
+ALERT_RANGES = {
+    "knee": (90, 180),
+    "hip": (70, 180),
+    "ankle": (70, 110),
+    "shoulder": (70, 180),
+}
+
+# (표시 이름, 점 a, 꼭짓점 b, 점 c, 관절 종류, c 대신 쓸 b 기준 offset)
+# c 가 None 이면 b + offset 을 세 번째 점으로 사용 (발목: 발목 20px 아래의 가짜 발끝)
+POSE_ANGLE_SPECS = (
+    ("L Shoulder", 'LEFT_HIP', 'LEFT_SHOULDER', 'RIGHT_SHOULDER', "shoulder", None),
+    ("L Hip", 'LEFT_SHOULDER', 'LEFT_HIP', 'LEFT_KNEE', "hip", None),
+    ("L Knee", 'LEFT_HIP', 'LEFT_KNEE', 'LEFT_ANKLE', "knee", None),
+    ("L Ankle", 'LEFT_KNEE', 'LEFT_ANKLE', None, "ankle", (0, 20)),
+    ("R Shoulder", 'RIGHT_HIP', 'RIGHT_SHOULDER', 'LEFT_SHOULDER', "shoulder", None),
+    ("R Hip", 'RIGHT_SHOULDER', 'RIGHT_HIP', 'RIGHT_KNEE', "hip", None),
+    ("R Knee", 'RIGHT_HIP', 'RIGHT_KNEE', 'RIGHT_ANKLE', "knee", None),
+    ("R Ankle", 'RIGHT_KNEE', 'RIGHT_ANKLE', None, "ankle", (0, 20)),
+)
+
+
+class AngleTable(NamedTuple):
+    names: tuple
+    joints: tuple
+    a: np.ndarray           # (K,) 랜드마크 번호
+    b: np.ndarray           # (K,) 꼭짓점 랜드마크 번호
+    c: np.ndarray           # (K,) 랜드마크 번호 (가짜 점이면 b 와 같음)
+    offset: np.ndarray      # (K, 2) c 에 더할 (x, y) - 실제 점이면 0
+    low: np.ndarray         # (K,) 정상 범위 최소
+    high: np.ndarray        # (K,) 정상 범위 최대
+
+
+def make_angle_table(specs, ranges=ALERT_RANGES) -> AngleTable:
+    """
+    param specs: (이름, a, b, c, 관절 종류, offset) 목록 - 점은 LANDMARK 이름 또는 번호
+    param ranges: 관절 종류 -> (최소, 최대), 없는 종류는 경고하지 않음
+    """
+    def index(point):
+        return LANDMARK[point] if isinstance(point, str) else int(point)
+
+    names, joints, a, b, c, offset = [], [], [], [], [], []
+    for name, pa, pb, pc, joint, off in specs:
+        names.append(name)
+        joints.append(joint)
+        a.append(index(pa))
+        b.append(index(pb))
+        c.append(index(pb if pc is None else pc))
+        offset.append(off or (0, 0))
+    low = [ranges.get(j, (-np.inf, np.inf))[0] for j in joints]
+    high = [ranges.get(j, (-np.inf, np.inf))[1] for j in joints]
+    return AngleTable(tuple(names), tuple(joints), np.array(a, np.intp), np.array(b, np.intp),
+                      np.array(c, np.intp), np.array(offset, np.float64), np.array(low, np.float64),
+                      np.array(high, np.float64))
+
+
+POSE_ANGLES = make_angle_table(POSE_ANGLE_SPECS)
+
+
+def compute_angles(points, table: AngleTable = POSE_ANGLES) -> np.ndarray:
+    """
+    param points: (프레임, 랜드마크, 2 또는 3) 좌표 배열, 한 프레임이면 (랜드마크, 2/3)
+                  (offset 은 x, y 에만 더하므로 가짜 점을 쓰는 각도는 points 와 같은 단위(픽셀 등)로 지정)
+    return: (프레임, K) 각도(도) float64, 한 프레임이면 (K,) - 길이가 0인 변이 있으면 nan
+    """
+    points = np.asarray(points, np.float64)
+    single = points.ndim == 2
+    if single:
+        points = points[None]
+    vertex = points[:, table.b]
+    ba = points[:, table.a] - vertex
+    bc = points[:, table.c] - vertex
+    bc[..., :2] += table.offset
+
+    dot = np.einsum('fkd,fkd->fk', ba, bc)
+    norms = np.sqrt(np.einsum('fkd,fkd->fk', ba, ba)) * np.sqrt(np.einsum('fkd,fkd->fk', bc, bc))
+    # calculate_angle 처럼 0 으로 나누면 nan (경고는 내지 않음)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cosine = dot / norms
+    angles = np.degrees(np.arccos(np.clip(cosine, -1.0, 1.0)))
+    return angles[0] if single else angles
+
+
+def compute_alerts(angles, table: AngleTable = POSE_ANGLES) -> np.ndarray:
+    """angles (compute_angles 반환값) 와 같은 모양의 bool 배열 - 정상 범위를 벗어나면 True (nan 은 False)"""
+    angles = np.asarray(angles)
+    return (angles < table.low) | (angles > table.high)
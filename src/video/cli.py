@@ -0,0 +1,177 @@
+# video/cli.py
+"""
+포즈 동영상 일괄 처리 명령 (main.py pose / clra 스크립트가 공유)
+- GUI 없이 최대 속도로 처리해 주석(오버레이)을 그린 mp4 저장 (서버용)
+- --preview-every N 이면 N 프레임마다 한 장만 화면에 표시
+- --metrics 경로를 주면 단계별 소요 시간을 JSON / Prometheus text 로 저장
+- --record 로 랜드마크 시계열(.npz)을 저장하고, --replay 로 저장한 랜드마크를 추론 없이 다시 그림
+- 입력 / 출력 경로, 오버레이 종류, 크기 조정은 모두 인자로 지정
+
+실행 예:
+    python main.py pose sample.mp4 -o output.mp4 --overlay angles
+    python main.py pose videos/*.mp4 -o out_dir --metrics metrics.prom
+    python main.py pose sample.mp4 --preview-every 10
+    python main.py pose sample.mp4 --no-output --record sample_landmarks.npz
+    python main.py pose sample.mp4 --replay sample_landmarks.npz --overlay angles
+"""
+import argparse
+import os
+
+import cv2
+
+from src.metrics import metrics
+from src.metrics.log import get_logger
+from src.video.landmarks import LandmarkRecorder, LandmarkReplay, LandmarkSeries
+from src.video.overlays import OVERLAYS, create_overlay
+from src.video.pipeline import DEFAULT_FOURCC, DEFAULT_QUEUE_SIZE, VideoPipeline
+from src.video.pose import PoseEstimator
+
+VIDEO_EXT = ('.mp4', '.avi', '.mov', '.mkv')
+# fps 를 모르는 입력의 랜드마크 시각 계산용
+DEFAULT_FPS = 30.0
+OUTPUT_SUFFIX = '_pose'
+LANDMARKS_SUFFIX = '_landmarks'
+
+log = get_logger('pose')
+
+
+def parse_size(text: str):
+    """'960x540' -> (960, 540)"""
+    try:
+        width, height = (int(v) for v in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'WxH 형식이어야 함: {text}')
+    return width, height
+
+
+def add_pose_arguments(parser, input=None, output=None, overlay='skeleton', window='Pose Estimation',
+                       preview_every=0, wait_ms=1, resize=None, save=True):
+    """
+    parser 에 pose 명령 인자 추가 (기본값은 호출하는 스크립트별로 지정)
+    param input: 입력 동영상 기본값, None 이면 입력이 필수
+    param output: 출력 기본값, None 이면 입력 옆에 '<이름>_pose.mp4'
+    param save: False 면 -o 를 주지 않는 한 동영상을 저장하지 않음
+    """
+    parser.set_defaults(save=save)
+    parser.add_argument('inputs', nargs='*' if input else '+', default=[input] if input else None,
+                        help='입력 동영상 경로 (여러 개 가능)' + (f' (기본값: {input})' if input else ''))
+    parser.add_argument('-o', '--output', default=output,
+                        help='출력 mp4 경로, 입력이 여러 개면 출력 폴더 (기본값: 입력 옆 <이름>_pose.mp4)')
+    parser.add_argument('--no-output', action='store_true', help='동영상을 저장하지 않음')
+    parser.add_argument('--overlay', choices=sorted(OVERLAYS), default=overlay, help='그릴 오버레이 종류')
+    parser.add_argument('--preview-every', type=int, default=preview_every, metavar='N',
+                        help='N 프레임마다 한 장 화면 표시 (0 이면 GUI 없이 처리)')
+    parser.add_argument('--window', default=window, help='미리보기 창 이름')
+    parser.add_argument('--wait-ms', type=int, default=wait_ms, help='미리보기 표시 후 cv2.waitKey 대기 시간')
+    parser.add_argument('--resize', type=parse_size, default=resize, metavar='WxH', help='처리 전 프레임 크기 조정')
+    parser.add_argument('--max-frames', type=int, default=None, help='동영상마다 처리할 최대 프레임 수')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE, help='단계 사이 큐 크기')
+    parser.add_argument('--fourcc', default=DEFAULT_FOURCC, help='출력 코덱')
+    parser.add_argument('--min-detection-confidence', type=float, default=0.5, help='mediapipe Pose 인자')
+    parser.add_argument('--metrics', default=None, metavar='PATH',
+                        help='단계별 소요 시간 저장 경로 (.json 또는 .prom)')
+    parser.add_argument('--record', default=None, metavar='PATH',
+                        help='랜드마크 시계열 저장 경로 (.npz), 입력이 여러 개면 폴더')
+    parser.add_argument('--replay', default=None, metavar='PATH',
+                        help='--record 로 저장한 랜드마크를 추론 대신 사용 (.npz), 입력이 여러 개면 폴더')
+    return parser
+
+
+def get_output_path(input_path: str, output: str, multiple: bool, suffix: str = OUTPUT_SUFFIX,
+                    ext: str = '.mp4', file_ext=VIDEO_EXT, makedirs: bool = True) -> str:
+    """
+    입력 하나의 출력 경로 (output 이 폴더이거나 입력이 여러 개면 output 폴더 안의 '<이름><suffix><ext>')
+    param makedirs: output 폴더가 없으면 만듦 (읽을 파일 경로를 구할 때는 False)
+    """
+    name = os.path.splitext(os.path.basename(input_path))[0] + suffix + ext
+    if output is None:
+        return os.path.join(os.path.dirname(input_path), name)
+    if multiple or not output.lower().endswith(file_ext):
+        if makedirs:
+            os.makedirs(output, exist_ok=True)
+        return os.path.join(output, name)
+    return output
+
+
+def get_landmarks_path(input_path: str, path: str, multiple: bool, makedirs: bool = True) -> str:
+    """입력 하나의 랜드마크 .npz 경로 (--record / --replay)"""
+    return get_output_path(input_path, path, multiple, LANDMARKS_SUFFIX, '.npz', '.npz', makedirs)
+
+
+def process_video(args, input_path: str, multiple: bool, infer_factory, preprocess):
+    """입력 동영상 하나 처리 (run_pose 가 입력마다 호출, 실패하면 예외)"""
+    save = not args.no_output and (args.save or args.output is not None)
+    writer = get_output_path(input_path, args.output, multiple) if save else None
+    if args.replay:
+        infer = LandmarkReplay(LandmarkSeries.load(get_landmarks_path(input_path, args.replay, multiple, False)))
+    else:
+        infer = infer_factory()
+    recorder = LandmarkRecorder() if args.record else None
+    try:
+        pipeline = VideoPipeline(input_path, infer, create_overlay(args.overlay), writer, preprocess,
+                                 args.queue_size, args.fourcc, args.max_frames)
+
+        def on_frame(packet):
+            if not len(recorder):
+                recorder.set_size(packet.frame.shape[1], packet.frame.shape[0])
+            recorder.add(packet.result, packet.index / (pipeline.get_fps() or DEFAULT_FPS))
+        stats = pipeline.run(args.window if args.preview_every > 0 else None, args.wait_ms,
+                             on_frame if recorder is not None else None, args.preview_every)
+    finally:
+        if hasattr(infer, 'close'):
+            infer.close()
+    metrics.count('video.files')
+    log.info('%s -> %s : %d frames, %.1f fps', input_path, writer or '(저장 안 함)', stats.frames, stats.fps)
+    if recorder is not None:
+        record_path = get_landmarks_path(input_path, args.record, multiple)
+        recorder.save(record_path, pipeline.get_fps())
+        log.info('%s : 랜드마크 %d 프레임 저장', record_path, len(recorder))
+
+
+def run_pose(args, infer_factory=None) -> int:
+    """
+    args: add_pose_arguments 로 만든 인자
+    param infer_factory: 동영상마다 infer 함수를 만드는 함수 (기본값: mediapipe PoseEstimator)
+    return: 종료 코드 (실패한 입력이 있으면 1, 실패한 입력은 기록하고 다음 입력을 계속 처리)
+    """
+    if args.overlay not in OVERLAYS:
+        # add_pose_arguments 의 choices 를 거치지 않고 args 를 만든 경우 - 입력마다 같은 오류를 내지 않도록 먼저 확인
+        log.error('알 수 없는 오버레이: %s (%s)', args.overlay, ', '.join(sorted(OVERLAYS)))
+        return 1
+    if args.metrics:
+        metrics.enable(args.metrics)
+    if infer_factory is None:
+        def infer_factory():
+            return PoseEstimator(min_detection_confidence=args.min_detection_confidence)
+    preprocess = None
+    if args.resize:
+        def preprocess(frame):
+            return cv2.resize(frame, args.resize)
+
+    failed = 0
+    multiple = len(args.inputs) > 1
+    for input_path in args.inputs:
+        # 동영상 하나가 실패해도(디코딩 / 추론 오류 등) 나머지 입력은 계속 처리
+        try:
+            process_video(args, input_path, multiple, infer_factory, preprocess)
+        except OSError as e:
+            log.error('%s : %s', input_path, e)
+            failed += 1
+        except Exception:
+            log.exception('%s : 처리 실패', input_path)
+            failed += 1
+
+    if args.metrics:
+        # 종료 시에도 저장되지만, 호출한 쪽에서 바로 읽을 수 있도록 여기서 한 번 저장
+        metrics.get_metrics().dump(args.metrics)
+    return 1 if failed else 0
+
+
+def main(argv=None, **defaults) -> int:
+    """
+    스크립트용 진입점 - defaults 로 add_pose_arguments 기본값 지정
+    예: main(input='sample.mp4', output='output.mp4', overlay='angles', preview_every=1)
+    """
+    parser = argparse.ArgumentParser(description='포즈 동영상 처리')
+    add_pose_arguments(parser, **defaults)
+    return run_pose(parser.parse_args(argv))
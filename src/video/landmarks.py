@@ -0,0 +1,154 @@
+# video/landmarks.py
+"""
+포즈 랜드마크 시계열 기록 / 재생
+- LandmarkRecorder: 프레임마다 33개 랜드마크 (x, y, z, visibility) 를 미리 잡아 둔 float32 배열에 기록
+  (부족하면 2배로 늘림), 사람이 없던 프레임은 nan
+- LandmarkSeries: 기록 결과 (랜드마크 배열 + 프레임 시각 + fps + 프레임 크기), .npz 로 저장 / 불러오기
+- LandmarkReplay: 저장된 랜드마크를 VideoPipeline 의 infer 자리에 넣어 추론 없이 오버레이 / 분석 재실행
+- 분석은 get_pixel_points() 로 전체 프레임 배열을 받아 compute_angles 등에 한 번에 넘기면 됨
+
+파일 형식 (.npz, 압축 없음):
+    landmarks  (프레임, 33, 4) float32 - 정규화 좌표 x, y, z 와 visibility, 사람이 없으면 nan
+    timestamps (프레임,) float64 - 초
+    fps        () float64 - 모르면 nan
+    size       (2,) int64 - 기록한 프레임의 (너비, 높이), 모르면 (0, 0)
+"""
+import numpy as np
+
+from src.video.pose import LANDMARK_NAMES, PoseFrame
+
+FIELDS = ('x', 'y', 'z', 'visibility')
+DEFAULT_CAPACITY = 1024
+
+
+class LandmarkSeries:
+    def __init__(self, landmarks, timestamps, fps: float = None, size=None):
+        """
+        param landmarks: (프레임, 33, 4) 배열
+        param timestamps: (프레임,) 초
+        param size: 기록한 프레임의 (너비, 높이) - 픽셀 좌표 계산에 사용
+        """
+        self.__landmarks = np.asarray(landmarks, np.float32)
+        self.__timestamps = np.asarray(timestamps, np.float64)
+        if self.__landmarks.shape[1:] != (len(LANDMARK_NAMES), len(FIELDS)):
+            raise ValueError(f'랜드마크 배열 모양이 (프레임, 33, 4) 가 아님: {self.__landmarks.shape}')
+        if len(self.__timestamps) != len(self.__landmarks):
+            raise ValueError('timestamps 와 landmarks 의 프레임 수가 다름')
+        self.__fps = fps
+        self.__size = tuple(size) if size else None
+
+    def __len__(self):
+        return len(self.__landmarks)
+
+    def __getitem__(self, index):
+        """index 프레임의 PoseFrame, 사람이 없던 프레임이면 None"""
+        row = self.__landmarks[index]
+        return None if np.isnan(row[0, 0]) else PoseFrame.from_array(row)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def get_landmarks(self) -> np.ndarray:
+        return self.__landmarks
+
+    def get_timestamps(self) -> np.ndarray:
+        return self.__timestamps
+
+    def get_fps(self):
+        return self.__fps
+
+    def get_size(self):
+        return self.__size
+
+    def get_detected(self) -> np.ndarray:
+        """(프레임,) bool - 사람이 검출된 프레임"""
+        return ~np.isnan(self.__landmarks[:, 0, 0])
+
+    def get_pixel_points(self, size=None) -> np.ndarray:
+        """
+        (프레임, 33, 2) 픽셀 좌표 float64 - get_pixel_point 처럼 소수점 버림, 사람이 없던 프레임은 nan
+        param size: (너비, 높이), None 이면 기록한 프레임 크기
+        """
+        size = size or self.__size
+        if not size:
+            raise ValueError('프레임 크기를 알 수 없음 (size 지정 필요)')
+        return np.trunc(self.__landmarks[..., :2] * np.array(size, np.float64))
+
+    def save(self, path: str):
+        """.npz 로 저장 (확장자가 없으면 numpy 가 붙임)"""
+        np.savez(path, landmarks=self.__landmarks, timestamps=self.__timestamps,
+                 fps=np.float64(np.nan if self.__fps is None else self.__fps),
+                 size=np.array(self.__size or (0, 0), np.int64))
+
+    @classmethod
+    def load(cls, path: str) -> 'LandmarkSeries':
+        with np.load(path) as data:
+            fps = float(data['fps'])
+            size = tuple(int(v) for v in data['size'])
+            return cls(data['landmarks'], data['timestamps'], None if np.isnan(fps) else fps,
+                       size if any(size) else None)
+
+
+class LandmarkRecorder:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, size=None):
+        """
+        param capacity: 미리 잡아 둘 프레임 수 (동영상 프레임 수를 알면 그 값)
+        param size: 프레임 (너비, 높이), 나중에 set_size 로 지정해도 됨
+        """
+        self.__landmarks = np.empty((max(1, capacity), len(LANDMARK_NAMES), len(FIELDS)), np.float32)
+        self.__timestamps = np.empty(len(self.__landmarks), np.float64)
+        self.__count = 0
+        self.__size = size
+
+    def __len__(self):
+        return self.__count
+
+    def set_size(self, width: int, height: int):
+        self.__size = (width, height)
+
+    def add(self, pose_landmarks, timestamp: float):
+        """
+        param pose_landmarks: mediapipe pose_landmarks (또는 PoseFrame), 사람이 없으면 None
+        param timestamp: 프레임 시각 (초)
+        """
+        if self.__count == len(self.__landmarks):
+            self.__grow()
+        row = self.__landmarks[self.__count]
+        if pose_landmarks is None:
+            row.fill(np.nan)
+        else:
+            row[:] = [(lm.x, lm.y, lm.z, lm.visibility) for lm in pose_landmarks.landmark]
+        self.__timestamps[self.__count] = timestamp
+        self.__count += 1
+
+    def get_series(self, fps: float = None) -> LandmarkSeries:
+        """지금까지 기록한 프레임 (복사하지 않은 view)"""
+        return LandmarkSeries(self.__landmarks[:self.__count], self.__timestamps[:self.__count], fps, self.__size)
+
+    def save(self, path: str, fps: float = None):
+        self.get_series(fps).save(path)
+
+    def __grow(self):
+        landmarks = np.empty((len(self.__landmarks) * 2,) + self.__landmarks.shape[1:], np.float32)
+        landmarks[:self.__count] = self.__landmarks[:self.__count]
+        timestamps = np.empty(len(landmarks), np.float64)
+        timestamps[:self.__count] = self.__timestamps[:self.__count]
+        self.__landmarks = landmarks
+        self.__timestamps = timestamps
+
+
+class LandmarkReplay:
+    def __init__(self, series: LandmarkSeries):
+        """
+        VideoPipeline 의 infer 대신 사용 - 호출할 때마다 다음 프레임의 PoseFrame 반환
+        (infer 단계는 스레드 하나에서 순서대로 호출되므로 프레임 번호와 맞음)
+        기록보다 프레임이 많으면 남은 프레임은 None
+        """
+        self.__series = series
+        self.__index = 0
+
+    def __call__(self, frame):
+        index = self.__index
+        self.__index += 1
+        return self.__series[index] if index < len(self.__series) else None
@@ -0,0 +1,277 @@
+# video/overlays.py
+"""
+포즈 오버레이 (VideoPipeline 의 render 단계) - clra 스크립트에서 옮김
+- render(frame, pose_landmarks) 형태, frame 에 직접 그림 (pose_landmarks 가 없으면 그대로)
+    skeleton    : 뼈대만 (clra.py)
+    weight-bias : 좌우 하중 치우침 문구 (clra_hajung.py)
+    weight      : 관절별 하중 박스, 위치 스무딩 (clra_hajung copy.py)
+    load        : 인물 상자 + 어깨/발 가짜 하중 이상치 표시 (clra_hajung copy 3.py)
+    angles      : 관절 각도와 정상 범위 경고 (clra_hajung copy 2.py / copy 4.py)
+- 이전 프레임 값을 쓰는 오버레이는 클래스이므로, 동영상마다 create_overlay() 로 새로 만듦
+"""
+import random
+
+import cv2
+import numpy as np
+
+from src.video.angles import POSE_ANGLES, compute_alerts, compute_angles
+from src.video.pose import LANDMARK, draw_skeleton, get_pixel_point
+
+
+# 관절 각도 오버레이의 바운딩 박스에 쓰는 랜드마크
+BODY_LANDMARKS = [LANDMARK[name] for name in (
+    'LEFT_SHOULDER', 'RIGHT_SHOULDER', 'LEFT_HIP', 'RIGHT_HIP', 'LEFT_KNEE', 'RIGHT_KNEE', 'LEFT_ANKLE', 'RIGHT_ANKLE'
+)]
+
+
+def render_skeleton(frame, pose_landmarks):
+    if pose_landmarks:
+        draw_skeleton(frame, pose_landmarks)
+
+
+# 하중 추정 함수
+def estimate_weight_bias(landmarks):
+    left_hip = landmarks[LANDMARK['LEFT_HIP']]
+    right_hip = landmarks[LANDMARK['RIGHT_HIP']]
+    left_shoulder = landmarks[LANDMARK['LEFT_SHOULDER']]
+    right_shoulder = landmarks[LANDMARK['RIGHT_SHOULDER']]
+    left_heel = landmarks[LANDMARK['LEFT_HEEL']]
+    right_heel = landmarks[LANDMARK['RIGHT_HEEL']]
+
+    pelvis_center_x = (left_hip.x + right_hip.x) / 2
+    shoulder_center_x = (left_shoulder.x + right_shoulder.x) / 2
+    body_center_x = (pelvis_center_x + shoulder_center_x) / 2
+    foot_center_x = (left_heel.x + right_heel.x) / 2
+
+    bias = body_center_x - foot_center_x
+    return bias
+
+
+def render_weight_bias(frame, pose_landmarks):
+    if not pose_landmarks:
+        return
+    draw_skeleton(frame, pose_landmarks)
+
+    # 하중 추정 및 표시
+    bias = estimate_weight_bias(pose_landmarks.landmark)
+    if bias > 0.03:
+        weight_text = "Right side load ↑"
+    elif bias < -0.03:
+        weight_text = "Left side load ↑"
+    else:
+        weight_text = "Balanced load"
+
+    cv2.putText(frame, weight_text, (30, 50), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
+
+
+class WeightInfoOverlay:
+    # 하중 비중
+    WEIGHT_RATIOS = {
+        "left_shoulder": 0.1,
+        "right_shoulder": 0.1,
+        "left_hip": 0.2,
+        "right_hip": 0.2,
+        "left_knee": 0.15,
+        "right_knee": 0.15,
+        "left_heel": 0.05,
+        "right_heel": 0.05,
+    }
+
+    def __init__(self, total_weight: float = 100.0, smooth_factor: float = 0.6):
+        """
+        param smooth_factor: 0~1 사이 값: 1에 가까울수록 움직임 작음
+        """
+        self.__total_weight = total_weight
+        self.__smooth_factor = smooth_factor
+        # 이전 위치 저장용 (이동 스무딩)
+        self.__prev_positions = {}
+
+    def __call__(self, frame, pose_landmarks):
+        if pose_landmarks:
+            draw_skeleton(frame, pose_landmarks)
+            self.draw_weight_info(frame, pose_landmarks.landmark)
+
+    def smooth_position(self, prev, new):
+        if prev is None:
+            return new
+        x = int(prev[0] * self.__smooth_factor + new[0] * (1 - self.__smooth_factor))
+        y = int(prev[1] * self.__smooth_factor + new[1] * (1 - self.__smooth_factor))
+        return (x, y)
+
+    def draw_weight_info(self, frame, landmarks):
+        weights = {}
+        positions = {}
+
+        for name, ratio in self.WEIGHT_RATIOS.items():
+            raw_pos = get_pixel_point(landmarks, LANDMARK[name.upper()], frame)
+
+            # 위치 스무딩
+            smoothed_pos = self.smooth_position(self.__prev_positions.get(name), raw_pos)
+            self.__prev_positions[name] = smoothed_pos
+
+            positions[name] = smoothed_pos
+            weights[name] = self.__total_weight * ratio
+
+        # 통계
+        values = np.array(list(weights.values()))
+        mean, std = values.mean(), values.std()
+
+        for name, value in weights.items():
+            pos = positions[name]
+            color = (0, 0, 255) if abs(value - mean) > std else (0, 255, 0)
+
+            # 텍스트 박스 그리기
+            text = f"{value:.1f}kg"
+            (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+            box_pos = (pos[0] + 10, pos[1] - 20)
+
+            # 사각형 박스
+            cv2.rectangle(frame, (box_pos[0] - 4, box_pos[1] - th - 4),
+                          (box_pos[0] + tw + 4, box_pos[1] + 4), color, -1)
+
+            # 텍스트
+            cv2.putText(frame, text, (box_pos[0], box_pos[1]),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+
+            # 위치 점
+            cv2.circle(frame, pos, 5, color, -1)
+
+
+def draw_text_border(image, text, org, font, scale, color, thickness):
+    cv2.putText(image, text, org, font, scale, (0, 0, 0), thickness + 2, cv2.LINE_AA)
+    cv2.putText(image, text, org, font, scale, color, thickness, cv2.LINE_AA)
+
+
+class LoadMonitorOverlay:
+    # 관심 부위 -> 랜드마크 이름
+    JOINTS = {
+        'left_shoulder': 'LEFT_SHOULDER',
+        'right_shoulder': 'RIGHT_SHOULDER',
+        'left_foot': 'LEFT_ANKLE',
+        'right_foot': 'RIGHT_ANKLE',
+    }
+
+    def __init__(self, max_history: int = 30, seed=None):
+        """
+        param max_history: 표준편차 계산을 위한 기록 길이
+        param seed: 가짜 하중값 난수 seed (None 이면 매번 다름)
+        """
+        self.__max_history = max_history
+        self.__random = random.Random(seed)
+        # 하중 기록용 (moving average)
+        self.__load_history = {name: [] for name in self.JOINTS}
+
+    def __call__(self, frame, pose_landmarks):
+        if not pose_landmarks:
+            return
+        landmarks = pose_landmarks.landmark
+
+        # 관심 부위
+        joints = {name: get_pixel_point(landmarks, LANDMARK[part], frame) for name, part in self.JOINTS.items()}
+
+        # 인물 전체 bounding box
+        all_x = [lm.x * frame.shape[1] for lm in landmarks]
+        all_y = [lm.y * frame.shape[0] for lm in landmarks]
+        min_x, max_x = int(min(all_x)), int(max(all_x))
+        min_y, max_y = int(min(all_y)), int(max(all_y))
+        center_x = (min_x + max_x) // 2
+        center_y = (min_y + max_y) // 2
+        width = int((max_x - min_x) * 2.0)
+        height = int((max_y - min_y) * 2.0)
+
+        top_left = (center_x - width // 2, center_y - height // 2)
+        bottom_right = (center_x + width // 2, center_y + height // 2)
+        cv2.rectangle(frame, top_left, bottom_right, (255, 255, 255), 2)
+
+        # 각 부위별 하중 표시
+        for joint_name, coord in joints.items():
+            # 가짜 하중값 갱신
+            load = self.__random.uniform(20, 100)
+            history = self.__load_history[joint_name]
+            history.append(load)
+            if len(history) > self.__max_history:
+                history.pop(0)
+
+            # 표준편차 이상 여부 판별
+            values = np.array(history)
+            std_dev = np.std(values)
+            avg = np.mean(values)
+            is_abnormal = abs(load - avg) > std_dev * 1.5
+
+            color = (0, 0, 255) if is_abnormal else (0, 255, 0)
+            load_str = f"{joint_name.replace('_', ' ').title()}: {load:.1f}kg"
+
+            # 텍스트 위치 계산 (사각형 테두리 기준)
+            if 'shoulder' in joint_name:
+                # 위쪽 테두리
+                pos = (top_left[0] + 10 if 'left' in joint_name else bottom_right[0] - 250, top_left[1] + 25)
+            elif 'foot' in joint_name:
+                # 아래쪽 테두리
+                pos = (top_left[0] + 10 if 'left' in joint_name else bottom_right[0] - 250, bottom_right[1] - 10)
+            else:
+                pos = coord
+
+            draw_text_border(frame, load_str, pos, cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
+
+        # 포즈 그리기
+        draw_skeleton(frame, pose_landmarks, styled=False)
+
+
+def render_angles(frame, pose_landmarks):
+    if not pose_landmarks:
+        return
+    # 전체 랜드마크의 픽셀 좌표 (33, 2) - 각도 8개를 한 번에 계산
+    points = np.array([get_pixel_point(pose_landmarks.landmark, i, frame) for i in range(len(LANDMARK))])
+    angles = compute_angles(points)
+    alerts = compute_alerts(angles)
+
+    # 전체 바운딩 박스 (각도에 쓰는 어깨 / 엉덩이 / 무릎 / 발목)
+    body = points[BODY_LANDMARKS]
+    x_min, y_min = body.min(axis=0).tolist()
+    x_max, y_max = body.max(axis=0).tolist()
+
+    pad_w = int((x_max - x_min) * 0.25)
+    pad_h = int((y_max - y_min) * 0.25)
+    x_min -= pad_w
+    x_max += pad_w
+    y_min -= pad_h
+    y_max += pad_h
+
+    cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (255, 255, 0), 2)
+
+    # 텍스트 왼쪽, 오른쪽 정렬 위치
+    left_x = x_min - 220
+    right_x = x_max + 10
+
+    # 텍스트 세로 시작 위치와 간격
+    start_y = y_min - 20
+    line_height = 30
+
+    # 왼쪽 / 오른쪽 관절 텍스트 (POSE_ANGLES 순서: 어깨, 엉덩이, 무릎, 발목 - 위부터 아래)
+    for k, name in enumerate(POSE_ANGLES.names):
+        x = left_x if name.startswith('L') else right_x
+        y = start_y + (k % 4) * line_height
+        color = (0, 0, 255) if alerts[k] else (0, 255, 0)
+        cv2.putText(frame, f"{name} Angle: {angles[k]:.1f}", (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2,
+                    cv2.LINE_AA)
+
+    draw_skeleton(frame, pose_landmarks, styled=False)
+
+
+# 오버레이 이름 -> render 함수를 만드는 함수
+OVERLAYS = {
+    'skeleton': lambda: render_skeleton,
+    'weight-bias': lambda: render_weight_bias,
+    'weight': WeightInfoOverlay,
+    'load': LoadMonitorOverlay,
+    'angles': lambda: render_angles,
+}
+
+
+def create_overlay(name: str):
+    """
+    이름에 해당하는 render(frame, pose_landmarks) 반환 (상태가 있는 오버레이는 새 객체)
+    Raises:
+        KeyError: 등록되지 않은 이름일 경우.
+    """
+    return OVERLAYS[name]()
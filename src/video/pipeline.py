@@ -0,0 +1,357 @@
+# video/pipeline.py
+"""
+VideoPipeline 클래스
+- 동영상 처리를 decode -> infer -> render -> encode 4단계 스레드로 나누고 크기 제한 큐로 연결
+  (cap.read / 모델 추론 / 그리기 / out.write 가 서로 겹쳐서 실행됨)
+- 단계마다 스레드 1개, 큐는 FIFO 이므로 프레임 순서가 그대로 유지됨
+  (mediapipe Pose 처럼 이전 프레임 상태를 쓰는 모델 / 스무딩하는 render 도 그대로 사용 가능)
+- 큐가 가득 차면 앞 단계가 기다리므로(backpressure) 메모리 사용량은 queue_size 로 제한
+- 화면 표시(imshow / waitKey)는 GUI 제약 때문에 run() 을 호출한 스레드에서 처리, ESC 로 중단
+- 단계별 처리 프레임 수 / FPS / 바쁜 시간과 큐별 평균 / 최대 대기 수를 get_stats() 로 보고
+"""
+import os
+import queue
+import threading
+import time
+from typing import NamedTuple
+
+import cv2
+
+from src.metrics import metrics
+from src.metrics.log import get_logger
+
+DEFAULT_QUEUE_SIZE = 4
+DEFAULT_FOURCC = 'mp4v'
+ESC_KEY = 27
+STAGE_NAMES = ('decode', 'infer', 'render', 'encode')
+# 중단 요청을 확인하는 간격(초) - 큐 put/get 대기 시간
+_POLL_SECONDS = 0.1
+_END = object()
+
+log = get_logger('VideoPipeline')
+
+
+class FramePacket(NamedTuple):
+    index: int
+    frame: object       # np.ndarray (BGR)
+    result: object      # infer 반환값 (infer 전에는 None)
+
+
+class StageStats(NamedTuple):
+    name: str
+    frames: int
+    busy: float         # 단계 함수 실행에 쓴 시간(초)
+    elapsed: float      # 파이프라인 시작부터 경과 시간(초)
+
+    @property
+    def fps(self):
+        """실제 처리 속도"""
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def capacity_fps(self):
+        """단계가 쉬지 않고 일했을 때의 처리 속도 (가장 낮은 단계가 병목)"""
+        return self.frames / self.busy if self.busy > 0 else 0.0
+
+
+class QueueStats(NamedTuple):
+    name: str           # '<앞 단계>-><뒤 단계>'
+    capacity: int
+    max_depth: int
+    mean_depth: float
+
+
+class PipelineStats(NamedTuple):
+    frames: int
+    elapsed: float
+    stages: tuple
+    queues: tuple
+
+    @property
+    def fps(self):
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    def format(self):
+        """로그용 한 줄 요약"""
+        stages = ', '.join(f'{s.name}={s.fps:.1f}fps(max {s.capacity_fps:.1f})' for s in self.stages)
+        queues = ', '.join(f'{q.name}={q.mean_depth:.1f}/{q.capacity}' for q in self.queues)
+        return f'frames={self.frames}, fps={self.fps:.1f}, stages: {stages}, queues: {queues}'
+
+
+class VideoSink:
+    """cv2.VideoWriter 래퍼 - 첫 프레임 크기로 파일을 열어 크기 / 채널을 미리 알 필요가 없음"""
+
+    def __init__(self, path, fps: float = 30.0, fourcc: str = DEFAULT_FOURCC):
+        self.path = os.fspath(path)
+        self.fps = fps
+        self.__fourcc = cv2.VideoWriter_fourcc(*fourcc)
+        self.__writer = None
+
+    def write(self, frame):
+        if self.__writer is None:
+            h, w = frame.shape[:2]
+            self.__writer = cv2.VideoWriter(self.path, self.__fourcc, self.fps, (w, h), frame.ndim == 3)
+            if not self.__writer.isOpened():
+                raise OSError(f'동영상 파일을 쓸 수 없음: {self.path}')
+        self.__writer.write(frame)
+
+    def release(self):
+        if self.__writer is not None:
+            self.__writer.release()
+            self.__writer = None
+
+
+class _StageQueue:
+    """queue.Queue + 대기 수 통계"""
+
+    def __init__(self, name, size):
+        self.name = name
+        self.queue = queue.Queue(size)
+        self.max_depth = 0
+        self.depth_sum = 0
+        self.samples = 0
+
+    def sample(self):
+        depth = self.queue.qsize()
+        self.max_depth = max(self.max_depth, depth)
+        self.depth_sum += depth
+        self.samples += 1
+
+    def get_stats(self):
+        mean = self.depth_sum / self.samples if self.samples else 0.0
+        return QueueStats(self.name, self.queue.maxsize, self.max_depth, mean)
+
+
+class VideoPipeline:
+    def __init__(self, source, infer=None, render=None, writer=None, preprocess=None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, fourcc: str = DEFAULT_FOURCC, max_frames: int = None):
+        """
+        param source: 동영상 경로, 카메라 번호, read() 가 있는 객체(cv2.VideoCapture 등) 또는 프레임 iterable
+        param infer: frame -> 결과 (예: 포즈 랜드마크), None 이면 결과 없음
+        param render: (frame, 결과) -> 그린 frame 또는 None(frame 에 직접 그린 경우)
+        param writer: 출력 동영상 경로 또는 write(frame) 가 있는 객체, None 이면 저장하지 않음
+        param preprocess: decode 단계에서 frame 에 적용할 함수 (예: 크기 조정)
+        param queue_size: 단계 사이 큐 크기 (단계마다 최대 queue_size 프레임 대기)
+        param fourcc: writer 가 경로일 때 사용할 코덱
+        param max_frames: 처리할 최대 프레임 수
+        """
+        self.__source = source
+        self.__infer = infer
+        self.__render = render
+        self.__writer = writer
+        self.__preprocess = preprocess
+        self.__queue_size = max(1, queue_size)
+        self.__fourcc = fourcc
+        self.__max_frames = max_frames
+        self.__stop_event = threading.Event()
+        self.__fps = None
+        self.__error = None
+        self.__start = None
+        self.__end = None
+        self.__stage_frames = dict.fromkeys(STAGE_NAMES, 0)
+        self.__stage_busy = dict.fromkeys(STAGE_NAMES, 0.0)
+        self.__queues = []
+
+    def stop(self):
+        """다른 스레드(또는 on_frame 콜백)에서 처리 중단 요청"""
+        self.__stop_event.set()
+
+    def is_stopped(self):
+        return self.__stop_event.is_set()
+
+    def get_fps(self):
+        """run() 이 연 source 의 fps (알 수 없으면 None) - on_frame 에서 프레임 시각 계산용"""
+        return self.__fps
+
+    def get_stats(self) -> PipelineStats:
+        """실행 중에도 호출 가능 (현재까지의 값)"""
+        if self.__start is None:
+            return PipelineStats(0, 0.0, (), ())
+        elapsed = (self.__end or time.perf_counter()) - self.__start
+        stages = tuple(
+            StageStats(name, self.__stage_frames[name], self.__stage_busy[name], elapsed) for name in STAGE_NAMES
+        )
+        queues = tuple(q.get_stats() for q in self.__queues)
+        return PipelineStats(self.__stage_frames['encode'], elapsed, stages, queues)
+
+    def run(self, preview: str = None, wait_ms: int = 1, on_frame=None, preview_every: int = 1) -> PipelineStats:
+        """
+        끝까지 처리하고 통계 반환 (단계 스레드에서 난 예외는 여기서 다시 발생)
+        param preview: 화면 표시 창 이름, None 이면 표시하지 않음 (GUI 없이 최대 속도로 처리)
+        param wait_ms: 표시 후 cv2.waitKey 대기 시간
+        param preview_every: N 프레임마다 한 장만 표시 (표시 / waitKey 가 처리 속도를 제한하지 않도록)
+        param on_frame: 저장까지 끝난 FramePacket 을 받는 콜백 (run 을 호출한 스레드에서 실행)
+        """
+        preview_every = max(1, preview_every)
+        self.__stop_event.clear()
+        self.__error = None
+        self.__end = None
+        self.__stage_frames = dict.fromkeys(STAGE_NAMES, 0)
+        self.__stage_busy = dict.fromkeys(STAGE_NAMES, 0.0)
+        names = STAGE_NAMES + ('output',)
+        self.__queues = [_StageQueue(f'{a}->{b}', self.__queue_size) for a, b in zip(names, names[1:])]
+        q_decoded, q_inferred, q_rendered, q_output = self.__queues
+        frames, self.__fps = self.__open_source()
+        writer = self.__open_writer(self.__fps)
+
+        threads = [
+            threading.Thread(target=self.__run_decode, args=(frames, q_decoded), name='VideoDecode', daemon=True),
+            threading.Thread(target=self.__run_stage, args=('infer', self.__do_infer, q_decoded, q_inferred),
+                             name='VideoInfer', daemon=True),
+            threading.Thread(target=self.__run_stage, args=('render', self.__do_render, q_inferred, q_rendered),
+                             name='VideoRender', daemon=True),
+            threading.Thread(target=self.__run_encode, args=(writer, q_rendered, q_output),
+                             name='VideoEncode', daemon=True),
+        ]
+        self.__start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                packet = self.__get(q_output)
+                if packet is _END or packet is None:
+                    break
+                if on_frame is not None:
+                    on_frame(packet)
+                if preview is not None and packet.index % preview_every == 0:
+                    cv2.imshow(preview, packet.frame)
+                    if cv2.waitKey(wait_ms) & 0xFF == ESC_KEY:
+                        self.stop()
+        finally:
+            self.stop()
+            for thread in threads:
+                thread.join()
+            self.__end = time.perf_counter()
+            if preview is not None:
+                cv2.destroyWindow(preview)
+
+        if self.__error is not None:
+            raise self.__error
+        stats = self.get_stats()
+        log.info('run() : %s', stats.format())
+        return stats
+
+    def __do_infer(self, packet):
+        if self.__infer is None:
+            return packet
+        return packet._replace(result=self.__infer(packet.frame))
+
+    def __do_render(self, packet):
+        if self.__render is None:
+            return packet
+        frame = self.__render(packet.frame, packet.result)
+        return packet if frame is None else packet._replace(frame=frame)
+
+    def __run_decode(self, frames, q_out):
+        try:
+            index = 0
+            while not self.is_stopped():
+                if self.__max_frames is not None and index >= self.__max_frames:
+                    break
+                start = time.perf_counter()
+                frame = next(frames, None)
+                if frame is None:
+                    break
+                if self.__preprocess is not None:
+                    frame = self.__preprocess(frame)
+                self.__record('decode', time.perf_counter() - start)
+                if not self.__put(q_out, FramePacket(index, frame, None)):
+                    break
+                index += 1
+        except BaseException as e:
+            self.__fail(e)
+        finally:
+            frames.close()
+            self.__put(q_out, _END)
+
+    def __run_stage(self, name, work, q_in, q_out):
+        try:
+            while True:
+                packet = self.__get(q_in)
+                if packet is _END or packet is None:
+                    break
+                start = time.perf_counter()
+                packet = work(packet)
+                self.__record(name, time.perf_counter() - start)
+                if not self.__put(q_out, packet):
+                    break
+        except BaseException as e:
+            self.__fail(e)
+        finally:
+            self.__put(q_out, _END)
+
+    def __run_encode(self, writer, q_in, q_out):
+        try:
+            self.__run_stage('encode', lambda packet: self.__do_encode(writer, packet), q_in, q_out)
+        finally:
+            if writer is not None and hasattr(writer, 'release'):
+                writer.release()
+
+    def __do_encode(self, writer, packet):
+        if writer is not None:
+            writer.write(packet.frame)
+        return packet
+
+    def __open_writer(self, fps):
+        if self.__writer is None or hasattr(self.__writer, 'write'):
+            return self.__writer
+        return VideoSink(self.__writer, fps or 30.0, self.__fourcc)
+
+    def __open_source(self):
+        """
+        (프레임 generator, 원본 fps 또는 None) 반환
+        경로 / 카메라 번호는 여기서 열어 없는 파일이면 스레드를 만들기 전에 예외 발생
+        """
+        source = self.__source
+        if isinstance(source, (str, int, os.PathLike)):
+            cap = cv2.VideoCapture(source if isinstance(source, int) else os.fspath(source))
+            if not cap.isOpened():
+                raise FileNotFoundError(f'동영상을 열 수 없음: {source}')
+            return self.__iter_capture(cap, release=True), cap.get(cv2.CAP_PROP_FPS) or None
+        if hasattr(source, 'read'):
+            fps = source.get(cv2.CAP_PROP_FPS) or None if hasattr(source, 'get') else None
+            return self.__iter_capture(source), fps
+        return (frame for frame in source), getattr(source, 'fps', None)
+
+    @staticmethod
+    def __iter_capture(cap, release=False):
+        try:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    return
+                yield frame
+        finally:
+            if release:
+                cap.release()
+
+    def __record(self, name, seconds):
+        self.__stage_frames[name] += 1
+        self.__stage_busy[name] += seconds
+        metrics.observe('video.' + name, seconds)
+
+    def __put(self, stage_queue, item):
+        """중단 요청이 없으면 item 을 넣고 True, 중단되면 False (끝 표시 _END 는 중단돼도 넣으려고 시도)"""
+        if item is not _END:
+            stage_queue.sample()
+        while True:
+            try:
+                stage_queue.queue.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                if self.is_stopped():
+                    return False
+
+    def __get(self, stage_queue):
+        """다음 item, 중단되면 None"""
+        while True:
+            try:
+                return stage_queue.queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if self.is_stopped():
+                    return None
+
+    def __fail(self, error):
+        if self.__error is None:
+            self.__error = error
+        self.stop()
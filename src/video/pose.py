@@ -0,0 +1,136 @@
+# video/pose.py
+"""
+mediapipe Pose 공용 함수 (clra 스크립트의 infer / render 단계)
+- PoseEstimator: BGR 프레임 -> pose_landmarks (없으면 None), mediapipe 는 처음 추론할 때 import
+- draw_skeleton: 뼈대 그리기 (스크립트마다 쓰던 DrawingSpec 그대로)
+  저장된 랜드마크(PoseFrame)는 mediapipe 없이 cv2 로 같은 모양을 그림
+- get_pixel_point: 정규화 좌표 랜드마크 -> 픽셀 좌표
+- LANDMARK: 랜드마크 이름 -> 번호 (PoseLandmark 와 같은 순서)
+- Landmark / PoseFrame: mediapipe pose_landmarks 와 같은 모양(.landmark[i].x)의 가벼운 객체 (기록 재생용)
+"""
+from typing import NamedTuple
+
+import cv2
+
+# mp.solutions.pose.PoseLandmark 순서 (mediapipe 없이 번호로 접근할 때 사용)
+LANDMARK_NAMES = (
+    'NOSE', 'LEFT_EYE_INNER', 'LEFT_EYE', 'LEFT_EYE_OUTER', 'RIGHT_EYE_INNER', 'RIGHT_EYE', 'RIGHT_EYE_OUTER',
+    'LEFT_EAR', 'RIGHT_EAR', 'MOUTH_LEFT', 'MOUTH_RIGHT', 'LEFT_SHOULDER', 'RIGHT_SHOULDER',
+    'LEFT_ELBOW', 'RIGHT_ELBOW', 'LEFT_WRIST', 'RIGHT_WRIST', 'LEFT_PINKY', 'RIGHT_PINKY',
+    'LEFT_INDEX', 'RIGHT_INDEX', 'LEFT_THUMB', 'RIGHT_THUMB', 'LEFT_HIP', 'RIGHT_HIP',
+    'LEFT_KNEE', 'RIGHT_KNEE', 'LEFT_ANKLE', 'RIGHT_ANKLE', 'LEFT_HEEL', 'RIGHT_HEEL',
+    'LEFT_FOOT_INDEX', 'RIGHT_FOOT_INDEX',
+)
+LANDMARK = {name: i for i, name in enumerate(LANDMARK_NAMES)}
+# mp.solutions.pose.POSE_CONNECTIONS
+POSE_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 7), (0, 4), (4, 5), (5, 6), (6, 8), (9, 10), (11, 12), (11, 13), (13, 15),
+    (15, 17), (15, 19), (15, 21), (17, 19), (12, 14), (14, 16), (16, 18), (16, 20), (16, 22), (18, 20),
+    (11, 23), (12, 24), (23, 24), (23, 25), (24, 26), (25, 27), (26, 28), (27, 29), (28, 30), (29, 31),
+    (30, 32), (27, 31), (28, 32),
+)
+
+# 뼈대 스타일 - clra.py / clra_hajung*.py 에서 쓰던 값
+LANDMARK_COLOR = (0, 255, 0)
+CONNECTION_COLOR = (255, 0, 0)
+# mediapipe drawing_utils 기본 스타일 (styled=False) 과 점을 그리지 않는 visibility 기준
+DEFAULT_LANDMARK_COLOR = (0, 0, 255)
+DEFAULT_CONNECTION_COLOR = (224, 224, 224)
+VISIBILITY_THRESHOLD = 0.5
+
+
+class Landmark(NamedTuple):
+    x: float
+    y: float
+    z: float
+    visibility: float
+
+
+class PoseFrame:
+    """mediapipe pose_landmarks 대신 쓰는 한 프레임의 랜드마크 (landmark[i].x / .y / .z / .visibility)"""
+    __slots__ = ('landmark',)
+
+    def __init__(self, landmark):
+        self.landmark = landmark
+
+    @classmethod
+    def from_array(cls, row):
+        """(33, 4) 배열 (x, y, z, visibility) -> PoseFrame"""
+        return cls(tuple(map(Landmark._make, row.tolist())))
+
+
+class PoseEstimator:
+    def __init__(self, **pose_kwargs):
+        """
+        param pose_kwargs: mp.solutions.pose.Pose 인자 (static_image_mode, min_detection_confidence 등)
+        Pose 는 이전 프레임 결과로 추적하므로 한 스레드(파이프라인 infer 단계)에서 순서대로 호출
+        """
+        self.__pose_kwargs = pose_kwargs
+        self.__pose = None
+
+    def __call__(self, frame):
+        """BGR 프레임의 pose_landmarks 반환, 사람이 없으면 None"""
+        if self.__pose is None:
+            self.__pose = get_mp_pose().Pose(**self.__pose_kwargs)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return self.__pose.process(rgb).pose_landmarks
+
+    def close(self):
+        if self.__pose is not None:
+            self.__pose.close()
+            self.__pose = None
+
+
+def get_mp_pose():
+    """mp.solutions.pose 모듈 (PoseLandmark, POSE_CONNECTIONS 포함)"""
+    import mediapipe as mp
+    return mp.solutions.pose
+
+
+def draw_skeleton(frame, pose_landmarks, styled: bool = True):
+    """
+    param styled: True 면 초록 점 / 파란 선, False 면 mediapipe 기본 스타일
+    """
+    if isinstance(pose_landmarks, PoseFrame):
+        if styled:
+            draw_landmarks_cv(frame, pose_landmarks, LANDMARK_COLOR, CONNECTION_COLOR)
+        else:
+            draw_landmarks_cv(frame, pose_landmarks)
+        return
+    import mediapipe as mp
+    mp_drawing = mp.solutions.drawing_utils
+    mp_pose = mp.solutions.pose
+    if not styled:
+        mp_drawing.draw_landmarks(frame, pose_landmarks, mp_pose.POSE_CONNECTIONS)
+        return
+    mp_drawing.draw_landmarks(
+        frame,
+        pose_landmarks,
+        mp_pose.POSE_CONNECTIONS,
+        landmark_drawing_spec=mp_drawing.DrawingSpec(color=LANDMARK_COLOR, thickness=2, circle_radius=2),
+        connection_drawing_spec=mp_drawing.DrawingSpec(color=CONNECTION_COLOR, thickness=2)
+    )
+
+
+def draw_landmarks_cv(frame, pose_landmarks, landmark_color=DEFAULT_LANDMARK_COLOR,
+                      connection_color=DEFAULT_CONNECTION_COLOR, thickness: int = 2, circle_radius: int = 2):
+    """mediapipe drawing_utils.draw_landmarks 를 cv2 로 옮긴 것 (보이지 않거나 화면 밖인 점은 생략)"""
+    height, width = frame.shape[:2]
+    points = {}
+    for i, lm in enumerate(pose_landmarks.landmark):
+        if lm.visibility < VISIBILITY_THRESHOLD or not (0 <= lm.x <= 1 and 0 <= lm.y <= 1):
+            continue
+        points[i] = min(int(lm.x * width), width - 1), min(int(lm.y * height), height - 1)
+    for a, b in POSE_CONNECTIONS:
+        if a in points and b in points:
+            cv2.line(frame, points[a], points[b], connection_color, thickness)
+    border_radius = max(circle_radius + 1, int(circle_radius * 1.2))
+    for point in points.values():
+        cv2.circle(frame, point, border_radius, (224, 224, 224), thickness)
+        cv2.circle(frame, point, circle_radius, landmark_color, thickness)
+
+
+def get_pixel_point(landmarks, index, frame):
+    """landmarks[index] 의 정규화 좌표를 frame 크기의 (x, y) 정수 좌표로 변환"""
+    lm = landmarks[index]
+    return int(lm.x * frame.shape[1]), int(lm.y * frame.shape[0])
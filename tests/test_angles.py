@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from src.video.angles import (
+    POSE_ANGLE_SPECS, POSE_ANGLES, angle_alert, calculate_angle, compute_alerts, compute_angles,
+    make_angle_table,
+)
+from src.video.pose import LANDMARK, LANDMARK_NAMES
+
+
+def random_frames(seed, frames=500, dims=2):
+    """정수 픽셀 좌표 프레임 - 일부 관절은 꼭짓점과 같은 위치(길이 0인 변)로 만듦"""
+    rng = np.random.default_rng(seed)
+    points = rng.integers(0, 640, size=(frames, len(LANDMARK_NAMES), dims)).astype(np.float64)
+    for name_a, name_b in (('LEFT_HIP', 'LEFT_SHOULDER'), ('RIGHT_KNEE', 'RIGHT_HIP'), ('LEFT_KNEE', 'LEFT_ANKLE')):
+        rows = rng.random(frames) < 0.1
+        points[rows, LANDMARK[name_a]] = points[rows, LANDMARK[name_b]]
+    # 직각 / 일직선 경계값이 나오도록 일부 프레임은 작은 격자 좌표로
+    points[:frames // 5] = rng.integers(0, 3, size=(frames // 5,) + points.shape[1:])
+    return points
+
+
+def reference(points, specs=POSE_ANGLE_SPECS):
+    """calculate_angle / angle_alert 를 프레임, 각도마다 한 번씩 호출한 결과"""
+    angles = np.empty((len(points), len(specs)))
+    alerts = np.empty(angles.shape, bool)
+    for f, frame in enumerate(points):
+        for k, (_, pa, pb, pc, joint, offset) in enumerate(specs):
+            b = frame[LANDMARK[pb]]
+            if pc is None:
+                # 발목: 꼭짓점 아래의 가짜 발끝
+                c = b.copy()
+                c[:2] += offset
+            else:
+                c = frame[LANDMARK[pc]]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                angles[f, k] = calculate_angle(frame[LANDMARK[pa]], b, c)
+            alerts[f, k] = angle_alert(angles[f, k], joint)
+    return angles, alerts
+
+
+@pytest.mark.parametrize('seed, dims', [(0, 2), (1, 2), (2, 3)])
+def test_matches_scalar_functions(seed, dims):
+    points = random_frames(seed, dims=dims)
+    expected_angles, expected_alerts = reference(points)
+
+    angles = compute_angles(points)
+    assert angles.shape == (len(points), len(POSE_ANGLE_SPECS))
+    np.testing.assert_array_equal(np.isnan(angles), np.isnan(expected_angles))
+    np.testing.assert_allclose(angles, expected_angles, rtol=0, atol=1e-9, equal_nan=True)
+    np.testing.assert_array_equal(compute_alerts(angles), expected_alerts)
+
+
+def test_degenerate_vectors_are_nan_without_alert():
+    points = np.zeros((1, len(LANDMARK_NAMES), 2))
+    angles = compute_angles(points)
+    # 모든 점이 한 곳에 있으면 가짜 발끝을 쓰는 발목도 무릎 쪽 변의 길이가 0
+    assert np.isnan(angles).all()
+    assert not compute_alerts(angles).any()
+
+
+def test_fake_foot_rows():
+    ankle = [i for i, spec in enumerate(POSE_ANGLE_SPECS) if spec[3] is None]
+    assert [POSE_ANGLE_SPECS[i][0] for i in ankle] == ['L Ankle', 'R Ankle']
+    assert (POSE_ANGLES.c[ankle] == POSE_ANGLES.b[ankle]).all()
+    assert POSE_ANGLES.offset[ankle].tolist() == [[0, 20], [0, 20]]
+
+    points = np.zeros((len(LANDMARK_NAMES), 2))
+    points[LANDMARK['LEFT_KNEE']] = (100, 100)
+    points[LANDMARK['LEFT_ANKLE']] = (100, 200)
+    points[LANDMARK['RIGHT_KNEE']] = (300, 200)
+    points[LANDMARK['RIGHT_ANKLE']] = (200, 200)
+    angles = compute_angles(points)
+    assert angles.shape == (len(POSE_ANGLE_SPECS),)
+    # 무릎이 바로 위면 180도, 옆이면 90도
+    assert angles[ankle].tolist() == pytest.approx([180.0, 90.0])
+    assert compute_alerts(angles)[ankle].tolist() == [True, False]
+
+
+def test_custom_table_without_range_never_alerts():
+    specs = (('Elbow', 'LEFT_SHOULDER', 'LEFT_ELBOW', 'LEFT_WRIST', 'elbow', None),)
+    table = make_angle_table(specs)
+    points = random_frames(3, frames=50)
+    angles = compute_angles(points, table)
+    expected, _ = reference(points, specs)
+    np.testing.assert_allclose(angles, expected, rtol=0, atol=1e-9, equal_nan=True)
+    assert not compute_alerts(angles, table).any()
@@ -0,0 +1,133 @@
+import os
+
+import pytest
+
+from sample.data_manager.folder_data import FolderData
+
+
+def write_image(folder, name, data=b'\x89PNG\r\n\x1a\n'):
+    path = os.path.join(folder, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def names(folder_data):
+    return [os.path.basename(p) for p in folder_data.get_files_as_string()]
+
+
+@pytest.fixture
+def folder(tmp_path):
+    for name in ('a.png', 'b.png', 'c.png', 'd.png'):
+        write_image(tmp_path, name)
+    return str(tmp_path)
+
+
+def test_initial_work_file_is_first(folder):
+    data = FolderData(folder)
+    assert names(data) == ['a.png', 'b.png', 'c.png', 'd.png']
+    assert data.get_work_index() == 0
+    assert data.get_prev_file() is None
+    assert os.path.basename(data.get_next_file().get_file_name()) == 'b.png'
+
+
+def test_navigation_follows_cursor(folder):
+    data = FolderData(folder)
+    data.set_work_file(data.get_file_by_index(2))
+    assert data.get_work_index() == 2
+    assert os.path.basename(data.get_prev_file().get_file_name()) == 'b.png'
+    assert os.path.basename(data.get_next_file().get_file_name()) == 'd.png'
+    data.set_work_file(data.get_file_by_index(3))
+    assert data.get_next_file() is None
+
+
+def test_refresh_added_file_keeps_work_file(folder):
+    data = FolderData(folder)
+    work = data.get_file_by_index(1)
+    data.set_work_file(work)
+    write_image(folder, '0.png')
+
+    changes = data.refresh()
+
+    assert [os.path.basename(p) for p in changes.added] == ['0.png']
+    assert data.get_work_file() is work
+    assert data.get_work_index() == 2
+    assert data.get_index_of(work) == 2
+    assert os.path.basename(data.get_prev_file().get_file_name()) == 'a.png'
+
+
+def test_refresh_removed_work_file_moves_to_same_position(folder):
+    data = FolderData(folder)
+    data.set_work_file(data.get_file_by_index(1))
+    os.remove(os.path.join(folder, 'b.png'))
+
+    changes = data.refresh()
+
+    assert [os.path.basename(p) for p in changes.removed] == ['b.png']
+    assert names(data) == ['a.png', 'c.png', 'd.png']
+    assert os.path.basename(data.get_work_file().get_file_name()) == 'c.png'
+    assert data.get_work_index() == 1
+
+
+def test_refresh_removed_last_file_clamps_cursor(folder):
+    data = FolderData(folder)
+    data.set_work_file(data.get_file_by_index(3))
+    os.remove(os.path.join(folder, 'd.png'))
+
+    data.refresh()
+
+    assert os.path.basename(data.get_work_file().get_file_name()) == 'c.png'
+    assert data.get_work_index() == 2
+    assert data.get_next_file() is None
+
+
+def test_refresh_all_removed_clears_work_file(folder):
+    data = FolderData(folder)
+    for name in ('a.png', 'b.png', 'c.png', 'd.png'):
+        os.remove(os.path.join(folder, name))
+
+    data.refresh()
+
+    assert data.get_files() == []
+    assert data.get_work_file() is None
+    assert data.get_work_index() == -1
+    assert data.get_next_file() is None
+    assert data.get_prev_file() is None
+
+
+def test_refresh_rename_is_remove_and_add(folder):
+    data = FolderData(folder)
+    data.set_work_file(data.get_file_by_index(0))
+    os.rename(os.path.join(folder, 'a.png'), os.path.join(folder, 'z.png'))
+
+    changes = data.refresh()
+
+    assert [os.path.basename(p) for p in changes.removed] == ['a.png']
+    assert [os.path.basename(p) for p in changes.added] == ['z.png']
+    assert names(data) == ['b.png', 'c.png', 'd.png', 'z.png']
+    # 작업 파일이 사라졌으므로 같은 위치(0)의 파일로 이동
+    assert os.path.basename(data.get_work_file().get_file_name()) == 'b.png'
+    assert data.get_work_index() == 0
+    assert data.get_index_of(data.get_file_by_index(3)) == 3
+
+
+def test_refresh_keeps_results_of_unchanged_files_and_clears_modified(folder):
+    data = FolderData(folder)
+    unchanged, modified = data.get_file_by_index(0), data.get_file_by_index(1)
+    unchanged.set_texts([([[0, 0], [1, 0], [1, 1], [0, 1]], 'keep', 0.9)])
+    modified.set_texts([([[0, 0], [1, 0], [1, 1], [0, 1]], 'drop', 0.9)])
+    write_image(folder, 'b.png', b'\x89PNG\r\n\x1a\n' + b'changed')
+
+    changes = data.refresh()
+
+    assert [os.path.basename(p) for p in changes.modified] == ['b.png']
+    assert data.get_file_by_index(0) is unchanged
+    assert unchanged.is_ocr_executed()
+    assert not data.get_file_by_index(1).is_ocr_executed()
+
+
+def test_refresh_without_changes_is_empty(folder):
+    data = FolderData(folder)
+    work = data.get_work_file()
+    assert data.refresh().is_empty()
+    assert data.get_work_file() is work
@@ -0,0 +1,140 @@
+import json
+import os
+
+import pytest
+
+from src.files import folder_index
+from src.files.folder_index import FolderIndex, MANIFEST_NAME, MANIFEST_VERSION
+
+PNG = b'\x89PNG\r\n\x1a\n'
+JPEG = b'\xff\xd8\xff\xe0'
+
+
+def write_file(folder, name, data):
+    path = os.path.join(folder, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+@pytest.fixture
+def folder(tmp_path):
+    write_file(tmp_path, 'a.png', PNG)
+    write_file(tmp_path, 'b.jpg', JPEG)
+    write_file(tmp_path, 'c.PNG', JPEG)        # 확장자와 실제 포맷이 다른 파일
+    write_file(tmp_path, 'note.txt', b'text')  # 이미지가 아닌 파일
+    return str(tmp_path)
+
+
+@pytest.fixture
+def detect_calls(monkeypatch):
+    """detect_format 을 호출한 파일명 기록"""
+    calls = []
+    detect = folder_index.detect_format
+
+    def counting(path):
+        calls.append(os.path.basename(path))
+        return detect(path)
+
+    monkeypatch.setattr(folder_index, 'detect_format', counting)
+    return calls
+
+
+def test_scan_collects_images_with_header_format(folder):
+    entries = FolderIndex(folder).scan()
+    assert [(os.path.basename(e.path), e.format) for e in entries] == [
+        ('a.png', 'png'), ('b.jpg', 'jpeg'), ('c.PNG', 'jpeg'),
+    ]
+    assert os.path.exists(os.path.join(folder, MANIFEST_NAME))
+
+
+def test_manifest_skips_unchanged_files(folder, detect_calls):
+    FolderIndex(folder).scan()
+    assert sorted(detect_calls) == ['a.png', 'b.jpg', 'c.PNG']
+
+    detect_calls.clear()
+    entries = FolderIndex(folder).scan()
+    assert detect_calls == []
+    assert [e.format for e in entries] == ['png', 'jpeg', 'jpeg']
+
+
+def test_manifest_invalidated_by_size_change(folder, detect_calls):
+    FolderIndex(folder).scan()
+    write_file(folder, 'a.png', JPEG + b'longer')
+
+    detect_calls.clear()
+    entries = FolderIndex(folder).scan()
+    assert detect_calls == ['a.png']
+    assert entries[0].format == 'jpeg'
+
+
+def test_manifest_invalidated_by_mtime_change(folder, detect_calls):
+    FolderIndex(folder).scan()
+    path = os.path.join(folder, 'b.jpg')
+    # 크기는 같고 내용/mtime 만 바뀐 경우
+    write_file(folder, 'b.jpg', b'GIF8')
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    detect_calls.clear()
+    entries = FolderIndex(folder).scan()
+    assert detect_calls == ['b.jpg']
+    # 헤더로 판별할 수 없으면 확장자로 대신함
+    assert entries[1].format == 'jpeg'
+    assert entries[1].mtime_ns == os.stat(path).st_mtime_ns
+
+
+def test_manifest_with_other_version_is_ignored(folder, detect_calls):
+    index = FolderIndex(folder)
+    index.scan()
+    with open(index.get_manifest_path(), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    manifest['version'] = MANIFEST_VERSION + 1
+    with open(index.get_manifest_path(), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+
+    detect_calls.clear()
+    FolderIndex(folder).scan()
+    assert sorted(detect_calls) == ['a.png', 'b.jpg', 'c.PNG']
+
+
+def test_corrupt_manifest_is_ignored(folder, detect_calls):
+    FolderIndex(folder).scan()
+    write_file(folder, MANIFEST_NAME, b'{not json')
+
+    detect_calls.clear()
+    entries = FolderIndex(folder).scan()
+    assert sorted(detect_calls) == ['a.png', 'b.jpg', 'c.PNG']
+    assert len(entries) == 3
+
+
+def test_manifest_drops_removed_files(folder):
+    FolderIndex(folder).scan()
+    os.remove(os.path.join(folder, 'b.jpg'))
+
+    index = FolderIndex(folder)
+    assert [os.path.basename(p) for p in [e.path for e in index.scan()]] == ['a.png', 'c.PNG']
+    with open(index.get_manifest_path(), 'r', encoding='utf-8') as f:
+        names = [entry[0] for entry in json.load(f)['entries']]
+    assert names == ['a.png', 'c.PNG']
+
+
+def test_refresh_reports_changes(folder):
+    index = FolderIndex(folder)
+    index.scan()
+    assert index.refresh().is_empty()
+
+    write_file(folder, 'd.gif', b'GIF89a')
+    os.remove(os.path.join(folder, 'a.png'))
+    write_file(folder, 'b.jpg', JPEG + b'more')
+
+    changes = index.refresh()
+    assert changes.added == [os.path.join(folder, 'd.gif')]
+    assert changes.removed == [os.path.join(folder, 'a.png')]
+    assert changes.modified == [os.path.join(folder, 'b.jpg')]
+    assert [os.path.basename(p) for p in index.get_paths()] == ['b.jpg', 'c.PNG', 'd.gif']
+    assert index.refresh().is_empty()
+
+
+def test_missing_folder_is_empty(tmp_path):
+    assert FolderIndex(str(tmp_path / 'missing')).scan() == []
@@ -0,0 +1,86 @@
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from src.cache.image_cache import ImageCache
+
+DECODE_SECONDS = 0.05
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = str(tmp_path / 'image.png')
+    cv2.imwrite(path, np.random.default_rng(0).integers(0, 256, size=(32, 48, 3), dtype=np.uint8))
+    return path
+
+
+@pytest.fixture
+def loads():
+    return []
+
+
+@pytest.fixture
+def cache(loads):
+    def slow_imread(path, flags):
+        loads.append(flags)
+        time.sleep(DECODE_SECONDS)
+        return cv2.imread(path, flags)
+
+    return ImageCache(loader=slow_imread)
+
+
+def test_get_is_memoized_and_read_only(cache, image_path, loads):
+    img = cache.get(image_path)
+    assert cache.get(image_path) is img
+    assert not img.flags.writeable
+    assert loads == [cv2.IMREAD_COLOR]
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_plane_records_decode_time_once(cache, image_path, loads):
+    rgb = cache.get_plane(image_path, 'rgb')
+    assert np.array_equal(rgb, cv2.cvtColor(cv2.imread(image_path), cv2.COLOR_BGR2RGB))
+    assert loads == [cv2.IMREAD_COLOR]
+
+    stats = cache.get_stats()
+    # 원본 디코딩 1건 + plane 변환 1건, 디코딩 시간은 한 번만 더해짐
+    assert (stats.hits, stats.misses, stats.entries) == (0, 2, 2)
+    assert DECODE_SECONDS <= stats.decode_seconds < 2 * DECODE_SECONDS
+
+    # 원본이 캐시에 있으면 다른 plane 은 변환 시간만 기록
+    cache.get_plane(image_path, 'gray')
+    stats = cache.get_stats()
+    assert loads == [cv2.IMREAD_COLOR]
+    assert (stats.hits, stats.misses) == (1, 3)
+    assert stats.decode_seconds < 2 * DECODE_SECONDS
+
+
+def test_missing_file(cache, tmp_path, loads):
+    assert cache.get(str(tmp_path / 'missing.png')) is None
+    assert cache.get_plane(str(tmp_path / 'missing.png'), 'gray') is None
+    assert loads == []
+
+
+def test_modified_file_is_decoded_again(cache, image_path, loads):
+    cache.get(image_path)
+    cv2.imwrite(image_path, np.zeros((10, 10, 3), np.uint8))
+    assert cache.get(image_path).shape == (10, 10, 3)
+    assert len(loads) == 2
+
+
+def test_evicts_least_recently_used(loads, image_path, tmp_path):
+    other = str(tmp_path / 'other.png')
+    cv2.imwrite(other, np.zeros((32, 48, 3), np.uint8))
+    cache = ImageCache(max_bytes=32 * 48 * 3 * 2)
+    a = cache.get(image_path)
+    cache.get(other)
+    cache.get(image_path)
+    cache.get_plane(image_path, 'gray')     # 한도 초과 -> 가장 오래 쓰지 않은 other 삭제
+
+    stats = cache.get_stats()
+    assert stats.evictions == 1
+    assert cache.get(image_path) is a
+    assert stats.bytes <= 32 * 48 * 3 * 2
@@ -0,0 +1,64 @@
+import cv2
+import numpy as np
+import pytest
+
+from src.cache import image_cache
+from src.cache.image_cache import ImageCache
+from src.features.modules.image_context import ImageContext
+from src.features.modules.prepare_image import PrepareImage
+from src.ocr.image_data import ImageData
+
+
+@pytest.fixture
+def decode_flags(monkeypatch):
+    """공유 이미지 캐시를 새로 만들고, 실제로 디코딩한 flags 를 기록"""
+    flags = []
+
+    def loader(path, flag):
+        flags.append(flag)
+        return cv2.imread(path, flag)
+
+    monkeypatch.setattr(image_cache, '_default_cache', ImageCache(loader=loader))
+    return flags
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    rng = np.random.default_rng(0)
+    path = str(tmp_path / 'image.jpg')
+    cv2.imwrite(path, rng.integers(0, 256, size=(400, 300, 3), dtype=np.uint8))
+    return path
+
+
+@pytest.fixture(params=[PrepareImage, ImageData])
+def image_cls(request):
+    return request.param
+
+
+def test_without_image_decodes_grayscale_only(image_cls, image_path, decode_flags):
+    assert image_cls(image_path).detect_faces(with_image=False) is None
+    assert decode_flags == [cv2.IMREAD_GRAYSCALE]
+
+
+def test_with_image_shares_colour_decode(image_cls, image_path, decode_flags):
+    img = image_cls(image_path).detect_faces()
+    assert img.shape == (400, 300, 3)
+    assert img.flags.writeable
+    assert decode_flags == [cv2.IMREAD_COLOR]
+
+
+def test_reduced_decode_without_image(image_cls, image_path, decode_flags):
+    image_cls(image_path).detect_faces(max_side=100, with_image=False)
+    assert len(decode_flags) == 1
+    assert decode_flags[0] in (cv2.IMREAD_REDUCED_GRAYSCALE_2, cv2.IMREAD_REDUCED_GRAYSCALE_4,
+                               cv2.IMREAD_REDUCED_GRAYSCALE_8)
+
+
+def test_memoized_gray_plane_is_reused(image_cls, image_path, decode_flags):
+    context = ImageContext(image_path)
+    context.get_binary()
+    assert decode_flags == [cv2.IMREAD_COLOR]
+
+    image_cls(image_path, context).detect_faces(max_side=100, with_image=False)
+    assert decode_flags == [cv2.IMREAD_COLOR]
+    assert context.get_compute_counts()['gray'] == 1
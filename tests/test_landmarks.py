@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from src.video.landmarks import DEFAULT_CAPACITY, LandmarkRecorder, LandmarkReplay, LandmarkSeries
+from src.video.pose import LANDMARK_NAMES, PoseFrame
+
+SIZE = (640, 480)
+
+
+def make_frames(count, seed=0):
+    """랜덤 PoseFrame 목록 - 7프레임마다 한 번은 사람이 없는 프레임(None)"""
+    rng = np.random.default_rng(seed)
+    rows = rng.random((count, len(LANDMARK_NAMES), 4)).astype(np.float32)
+    return [None if i % 7 == 3 else PoseFrame.from_array(row) for i, row in enumerate(rows)], rows
+
+
+@pytest.fixture
+def recorded():
+    count = DEFAULT_CAPACITY + 37
+    frames, rows = make_frames(count)
+    recorder = LandmarkRecorder(size=SIZE)
+    for i, frame in enumerate(frames):
+        recorder.add(frame, i / 30.0)
+    return recorder, frames, rows
+
+
+def test_recorder_grows_past_capacity(recorded):
+    recorder, frames, rows = recorded
+    assert len(recorder) == len(frames) > DEFAULT_CAPACITY
+
+    series = recorder.get_series(fps=30.0)
+    landmarks = series.get_landmarks()
+    detected = np.array([f is not None for f in frames])
+    assert landmarks.shape == (len(frames), len(LANDMARK_NAMES), 4)
+    np.testing.assert_array_equal(landmarks[detected], rows[detected])
+    assert np.isnan(landmarks[~detected]).all()
+    np.testing.assert_array_equal(series.get_detected(), detected)
+    np.testing.assert_allclose(series.get_timestamps(), np.arange(len(frames)) / 30.0)
+
+
+def test_save_and_load_round_trip(recorded, tmp_path):
+    recorder, frames, _ = recorded
+    path = str(tmp_path / 'pose.npz')
+    recorder.save(path, fps=29.97)
+
+    series = LandmarkSeries.load(path)
+    original = recorder.get_series(29.97)
+    assert len(series) == len(frames)
+    np.testing.assert_array_equal(series.get_landmarks(), original.get_landmarks())
+    np.testing.assert_array_equal(series.get_timestamps(), original.get_timestamps())
+    np.testing.assert_array_equal(series.get_detected(), original.get_detected())
+    assert series.get_fps() == pytest.approx(29.97)
+    assert series.get_size() == SIZE
+
+    assert series[3] is None
+    frame = series[0]
+    assert [tuple(lm) for lm in frame.landmark] == [tuple(lm) for lm in frames[0].landmark]
+
+
+def test_unknown_fps_and_size_round_trip(tmp_path):
+    recorder = LandmarkRecorder(capacity=1)
+    recorder.add(None, 0.0)
+    path = str(tmp_path / 'empty.npz')
+    recorder.save(path)
+
+    series = LandmarkSeries.load(path)
+    assert series.get_fps() is None
+    assert series.get_size() is None
+    assert series.get_detected().tolist() == [False]
+    with pytest.raises(ValueError):
+        series.get_pixel_points()
+
+
+def test_pixel_points(recorded):
+    recorder, frames, rows = recorded
+    points = recorder.get_series().get_pixel_points()
+    assert points.shape == (len(frames), len(LANDMARK_NAMES), 2)
+    np.testing.assert_array_equal(points[0], np.trunc(rows[0, :, :2] * np.array(SIZE, np.float64)))
+    assert np.isnan(points[3]).all()
+
+
+def test_replay_returns_none_past_end(recorded):
+    recorder, frames, _ = recorded
+    replay = LandmarkReplay(recorder.get_series())
+    for frame in frames:
+        got = replay(object())
+        if frame is None:
+            assert got is None
+        else:
+            assert got.landmark[5] == pytest.approx(tuple(frame.landmark[5]))
+    assert replay(object()) is None
+    assert replay(object()) is None
+
+
+def test_series_rejects_bad_shapes():
+    with pytest.raises(ValueError):
+        LandmarkSeries(np.zeros((2, 10, 4)), np.zeros(2))
+    with pytest.raises(ValueError):
+        LandmarkSeries(np.zeros((2, len(LANDMARK_NAMES), 4)), np.zeros(3))
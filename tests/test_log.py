@@ -0,0 +1,35 @@
+import contextlib
+import io
+import logging
+
+import pytest
+
+from src.metrics.log import get_logger, set_log_level
+
+
+@pytest.fixture
+def log():
+    yield get_logger('TestLog')
+    set_log_level(logging.INFO)
+
+
+def test_format_and_redirect_stdout(log):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        log.info('열기 %s', 'a.png')
+    assert out.getvalue() == '[TestLog] 열기 a.png\n'
+
+
+def test_redirect_stdout_silences_output(log, capsys):
+    with contextlib.redirect_stdout(io.StringIO()):
+        log.info('hidden')
+    assert capsys.readouterr().out == ''
+    log.info('shown')
+    assert capsys.readouterr().out == '[TestLog] shown\n'
+
+
+def test_set_log_level(log, capsys):
+    log.debug('off')
+    set_log_level('DEBUG')
+    log.debug('on %d', 1)
+    assert capsys.readouterr().out == '[TestLog] on 1\n'
@@ -0,0 +1,50 @@
+import pytest
+
+from src.cache.result_cache import ResultCache
+from src.ocr.ocr_cache import OcrCache
+
+OCR_RESULT = [([[0, 0], [10, 0], [10, 5], [0, 5]], 'hello', 0.9)]
+
+
+@pytest.fixture
+def result_cache():
+    cache = ResultCache(':memory:')
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / 'a.png'
+    path.write_bytes(b'\x89PNG\r\n\x1a\nimage')
+    return str(path)
+
+
+def test_round_trip(result_cache, image_path):
+    cache = OcrCache(result_cache, ['ch_sim', 'en'])
+    assert cache.get(image_path) is None
+    cache.put(image_path, OCR_RESULT)
+    result = cache.get(image_path)
+    assert [(list(map(list, box)), text, conf) for box, text, conf in result] == OCR_RESULT
+
+
+def test_key_depends_on_langs_order_and_readtext_kwargs(result_cache, image_path):
+    keys = {
+        OcrCache(result_cache, ['ch_sim', 'en']).make_key(image_path),
+        OcrCache(result_cache, ['en', 'ch_sim']).make_key(image_path),
+        OcrCache(result_cache, ['ch_sim', 'en'], {'paragraph': True}).make_key(image_path),
+    }
+    assert len(keys) == 3
+    assert OcrCache(result_cache, ('ch_sim', 'en')).make_key(image_path) in keys
+
+
+def test_key_follows_file_content(result_cache, image_path, tmp_path):
+    cache = OcrCache(result_cache, ['en'])
+    cache.put(image_path, OCR_RESULT)
+    copy = tmp_path / 'copy.png'
+    copy.write_bytes(open(image_path, 'rb').read())
+    assert cache.get(str(copy)) is not None
+
+    with open(image_path, 'ab') as f:
+        f.write(b'changed')
+    assert cache.get(image_path) is None
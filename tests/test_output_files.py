@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from src.files import output_files
+from src.files.output_files import (
+    OUTPUT_MODE_COPY, OUTPUT_MODE_LAZY, OUTPUT_MODE_LINK, get_output_folder, get_output_path,
+    link_or_copy, materialize_outputs, replace_output_file, resolve_output_file,
+)
+
+ORIGINAL = b'\x89PNG\r\n\x1a\noriginal'
+
+
+def write_bytes(data):
+    def write(path):
+        with open(path, 'wb') as f:
+            f.write(data)
+    return write
+
+
+def read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture
+def sources(tmp_path):
+    paths = []
+    for name in ('a.png', 'b.png'):
+        path = tmp_path / name
+        path.write_bytes(ORIGINAL + name.encode())
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def no_reflink(monkeypatch):
+    """reflink 를 지원하지 않는 파일 시스템처럼 동작"""
+    monkeypatch.setattr(output_files, '_reflink', lambda src, dst: False)
+
+
+def test_lazy_resolves_source_until_saved(tmp_path, sources):
+    materialize_outputs(str(tmp_path), sources, OUTPUT_MODE_LAZY)
+    assert os.listdir(get_output_folder(str(tmp_path))) == []
+    assert resolve_output_file(sources[0]) == sources[0]
+
+    out_file = get_output_path(sources[0])
+    replace_output_file(out_file, write_bytes(b'edited'))
+
+    assert resolve_output_file(sources[0]) == out_file
+    assert resolve_output_file(sources[1]) == sources[1]
+    assert read_bytes(out_file) == b'edited'
+    assert read_bytes(sources[0]) == ORIGINAL + b'a.png'
+
+
+def test_saving_over_hardlink_keeps_original(tmp_path, sources, no_reflink):
+    materialize_outputs(str(tmp_path), sources, OUTPUT_MODE_LINK)
+    out_file = get_output_path(sources[0])
+    assert os.path.samefile(out_file, sources[0])
+
+    replace_output_file(out_file, write_bytes(b'edited'))
+
+    assert read_bytes(sources[0]) == ORIGINAL + b'a.png'
+    assert read_bytes(out_file) == b'edited'
+    assert not os.path.samefile(out_file, sources[0])
+    assert sorted(os.listdir(get_output_folder(str(tmp_path)))) == ['a.png', 'b.png']
+
+
+def test_link_falls_back_to_copy(tmp_path, sources, no_reflink, monkeypatch):
+    def no_link(src, dst):
+        raise OSError('cross-device link')
+    monkeypatch.setattr(os, 'link', no_link)
+
+    dst = str(tmp_path / 'copy.png')
+    assert link_or_copy(sources[0], dst) == 'copy'
+    assert read_bytes(dst) == read_bytes(sources[0])
+    assert not os.path.samefile(dst, sources[0])
+
+    materialize_outputs(str(tmp_path), sources, OUTPUT_MODE_LINK)
+    for src in sources:
+        out_file = get_output_path(src)
+        assert read_bytes(out_file) == read_bytes(src)
+        assert not os.path.samefile(out_file, src)
+
+
+def test_existing_outputs_are_kept(tmp_path, sources):
+    out_file = get_output_path(sources[0])
+    replace_output_file(out_file, write_bytes(b'edited'))
+
+    materialize_outputs(str(tmp_path), sources, OUTPUT_MODE_COPY)
+
+    assert read_bytes(out_file) == b'edited'
+    assert read_bytes(get_output_path(sources[1])) == ORIGINAL + b'b.png'
+
+
+def test_failed_write_leaves_output_untouched(tmp_path, sources):
+    out_file = get_output_path(sources[0])
+    replace_output_file(out_file, write_bytes(b'edited'))
+
+    def broken(path):
+        write_bytes(b'partial')(path)
+        raise RuntimeError('encode failed')
+
+    with pytest.raises(RuntimeError):
+        replace_output_file(out_file, broken)
+    assert read_bytes(out_file) == b'edited'
+    assert os.listdir(get_output_folder(str(tmp_path))) == ['a.png']
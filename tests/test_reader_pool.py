@@ -0,0 +1,56 @@
+import threading
+
+from src.ocr.reader_pool import ReaderPool
+
+
+class FakeFactory:
+    def __init__(self, delay_event=None):
+        self.created = []
+        self.__delay_event = delay_event
+
+    def __call__(self, langs):
+        if self.__delay_event is not None:
+            self.__delay_event.wait(5)
+        self.created.append(langs)
+        return object()
+
+
+def test_reader_is_created_once_per_language_order():
+    factory = FakeFactory()
+    pool = ReaderPool(factory)
+    assert not pool.is_loaded(['ch_sim', 'en'])
+
+    reader = pool.get(['ch_sim', 'en'])
+    assert pool.get(('ch_sim', 'en')) is reader
+    assert pool.is_loaded(['ch_sim', 'en'])
+    # easyocr 는 언어 순서에 따라 문자 목록이 달라지므로 순서가 다르면 다른 reader
+    assert pool.get(['en', 'ch_sim']) is not reader
+    assert factory.created == [('ch_sim', 'en'), ('en', 'ch_sim')]
+
+
+def test_release_and_clear():
+    factory = FakeFactory()
+    pool = ReaderPool(factory)
+    first = pool.get(['en'])
+    pool.release(['en'])
+    assert not pool.is_loaded(['en'])
+    assert pool.get(['en']) is not first
+    pool.clear()
+    assert not pool.is_loaded(['en'])
+    assert len(factory.created) == 2
+
+
+def test_concurrent_get_creates_one_reader():
+    release = threading.Event()
+    factory = FakeFactory(release)
+    pool = ReaderPool(factory)
+    warm = pool.warm_up(['en'])
+    results = []
+    getter = threading.Thread(target=lambda: results.append(pool.get(['en'])))
+    getter.start()
+    release.set()
+    warm.join(5)
+    getter.join(5)
+
+    assert factory.created == [('en',)]
+    assert results == [pool.get(['en'])]
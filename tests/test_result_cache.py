@@ -0,0 +1,122 @@
+import itertools
+import os
+import types
+
+import pytest
+
+from src.cache import result_cache
+from src.cache.result_cache import ResultCache, hash_file
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """last_access 순서가 호출 순서와 같도록 1초씩 증가하는 시계"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(result_cache, 'time', types.SimpleNamespace(time=lambda: float(next(ticks))))
+
+
+@pytest.fixture
+def cache(clock):
+    cache = ResultCache(':memory:', max_bytes=100)
+    yield cache
+    cache.close()
+
+
+def test_get_put_and_stats(cache):
+    assert cache.get('ocr', 'k') is None
+    cache.put('ocr', 'k', b'value', cost=1.5)
+    assert cache.get('ocr', 'k') == b'value'
+    assert cache.get('ocr', 'k') == b'value'
+    assert cache.get('faces', 'k') is None
+
+    stats = cache.get_stats('ocr')
+    assert (stats.hits, stats.misses, stats.stores, stats.evictions) == (2, 1, 1, 0)
+    assert stats.saved_seconds == pytest.approx(3.0)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+    assert cache.get_stats().misses == 2
+
+
+def test_replace_updates_total_bytes(cache):
+    cache.put('ocr', 'k', b'x' * 30)
+    cache.put('ocr', 'k', b'x' * 10)
+    assert cache.get_total_bytes() == 10
+
+
+def test_evicts_least_recently_used_first(cache):
+    for key in 'abcd':
+        cache.put('ocr', key, b'x' * 20)
+    # a 를 다시 사용하면 가장 오래 쓰지 않은 항목은 b
+    assert cache.get('ocr', 'a') is not None
+
+    cache.put('ocr', 'e', b'x' * 30)   # 110 > 100 -> 90 이하가 될 때까지 삭제
+
+    assert cache.get('ocr', 'b') is None
+    for key in 'acde':
+        assert cache.get('ocr', key) is not None
+    assert cache.get_total_bytes() == 90
+    assert cache.get_stats('ocr').evictions == 1
+
+
+def test_eviction_shares_limit_across_namespaces(cache):
+    cache.put('faces', 'old', b'x' * 50)
+    cache.put('ocr', 'a', b'x' * 40)
+    cache.put('ocr', 'b', b'x' * 40)
+
+    assert cache.get('faces', 'old') is None
+    assert cache.get('ocr', 'a') is not None
+    assert cache.get_stats('faces').evictions == 1
+    assert cache.get_stats('ocr').evictions == 0
+    assert cache.get_total_bytes() <= 90
+
+
+def test_value_larger_than_limit_is_not_stored(cache):
+    cache.put('ocr', 'a', b'x' * 10)
+    cache.put('ocr', 'big', b'x' * 101)
+    assert cache.get('ocr', 'big') is None
+    assert cache.get('ocr', 'a') is not None
+    assert cache.get_total_bytes() == 10
+
+
+def test_clear_namespace(cache):
+    cache.put('ocr', 'a', b'x' * 10)
+    cache.put('faces', 'a', b'x' * 20)
+    cache.clear('ocr')
+    assert cache.get('ocr', 'a') is None
+    assert cache.get('faces', 'a') is not None
+    assert cache.get_total_bytes() == 20
+
+
+def test_persists_total_bytes(tmp_path, clock):
+    path = str(tmp_path / 'cache' / 'results.sqlite')
+    cache = ResultCache(path, max_bytes=100)
+    cache.put('ocr', 'a', b'x' * 40)
+    cache.close()
+
+    cache = ResultCache(path, max_bytes=100)
+    assert cache.get_total_bytes() == 40
+    assert cache.get('ocr', 'a') == b'x' * 40
+    cache.close()
+
+
+def test_hash_file_follows_content(tmp_path):
+    path = str(tmp_path / 'a.png')
+    with open(path, 'wb') as f:
+        f.write(b'first')
+    first = hash_file(path)
+    assert hash_file(path) == first
+
+    with open(path, 'wb') as f:
+        f.write(b'second!')
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert hash_file(path) != first
+
+
+def test_hash_file_memo_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, 'FILE_HASH_MEMO_SIZE', 3)
+    monkeypatch.setattr(result_cache, '_file_hash_memo', result_cache.OrderedDict())
+    for i in range(5):
+        path = tmp_path / f'{i}.png'
+        path.write_bytes(bytes([i]))
+        hash_file(str(path))
+    assert list(result_cache._file_hash_memo) == [str(tmp_path / f'{i}.png') for i in (2, 3, 4)]
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from sample.data_manager.spatial_index import MAX_ITEM_CELLS, SpatialIndex, rects_to_bounds
+
+
+def random_bounds(rng, n, extent=1000, max_size=120):
+    xy = rng.integers(-extent // 10, extent, size=(n, 2))
+    wh = rng.integers(0, max_size, size=(n, 2))
+    return np.concatenate([xy, xy + wh], axis=1)
+
+
+def brute_point(bounds, x, y):
+    b = bounds
+    return np.flatnonzero((b[:, 0] <= x) & (b[:, 1] <= y) & (b[:, 2] >= x) & (b[:, 3] >= y))
+
+
+def brute_rect(bounds, x_min, y_min, x_max, y_max, contained):
+    b = bounds
+    if contained:
+        mask = (b[:, 0] >= x_min) & (b[:, 1] >= y_min) & (b[:, 2] <= x_max) & (b[:, 3] <= y_max)
+    else:
+        mask = (b[:, 0] <= x_max) & (b[:, 1] <= y_max) & (b[:, 2] >= x_min) & (b[:, 3] >= y_min)
+    return np.flatnonzero(mask)
+
+
+def test_rects_to_bounds():
+    assert rects_to_bounds([[10, 20, 5, 7], [0, 0, 1, 1]]).tolist() == [[10, 20, 15, 27], [0, 0, 1, 1]]
+    assert rects_to_bounds([]).shape == (0, 4)
+
+
+def test_small_queries():
+    index = SpatialIndex([[0, 0, 10, 10], [5, 5, 20, 20], [100, 100, 110, 120]])
+    assert len(index) == 3
+    assert sorted(index.query_point(7, 7).tolist()) == [0, 1]
+    assert index.query_point(10, 10).tolist() == [0, 1]     # 경계 포함
+    assert index.query_point(50, 50).tolist() == []
+    assert index.query_point(-5, -5).tolist() == []
+    assert sorted(index.query_rect(0, 0, 30, 30).tolist()) == [0, 1]
+    assert index.query_rect(0, 0, 12, 12, contained=True).tolist() == [0]
+    assert index.query_rect(105, 0, 500, 500).tolist() == [2]
+    assert sorted(index.query_overlaps([[8, 8, 9, 9], [200, 200, 210, 210], [110, 120, 130, 130]])) == [
+        (0, 0), (1, 0), (2, 2),
+    ]
+
+
+def test_empty_index():
+    index = SpatialIndex(np.zeros((0, 4)))
+    assert len(index) == 0
+    assert index.query_point(0, 0).tolist() == []
+    assert index.query_rect(-10, -10, 10, 10).tolist() == []
+    assert index.query_overlaps([[0, 0, 1, 1]]) == []
+
+
+@pytest.mark.parametrize('seed, n, cell_size', [
+    (0, 1, None), (1, 50, None), (2, 300, None), (3, 300, 7), (4, 300, 500), (5, 200, 1),
+])
+def test_matches_brute_force(seed, n, cell_size):
+    rng = np.random.default_rng(seed)
+    bounds = random_bounds(rng, n)
+    index = SpatialIndex(bounds, cell_size)
+
+    # 인덱스 범위 바깥(음수, 격자보다 큰 좌표)도 포함
+    for x, y in rng.integers(-300, 1400, size=(300, 2)):
+        assert sorted(index.query_point(x, y).tolist()) == brute_point(bounds, x, y).tolist()
+
+    queries = random_bounds(rng, 200, extent=1200, max_size=400) - 100
+    for x_min, y_min, x_max, y_max in queries:
+        for contained in (False, True):
+            got = sorted(index.query_rect(x_min, y_min, x_max, y_max, contained).tolist())
+            assert got == brute_rect(bounds, x_min, y_min, x_max, y_max, contained).tolist()
+
+    expected = sorted(
+        (int(i), j) for j, q in enumerate(queries) for i in brute_rect(bounds, *q, contained=False)
+    )
+    assert sorted(index.query_overlaps(queries)) == expected
+
+
+def test_large_item_does_not_blow_up_grid():
+    rng = np.random.default_rng(8)
+    xy = rng.integers(0, 8000, size=(200, 2))
+    bounds = np.concatenate([np.concatenate([xy, xy + 2], axis=1), [[0, 0, 8000, 8000]]])
+    index = SpatialIndex(bounds)
+
+    # 큰 항목은 격자 대신 따로 검사하므로 격자 크기는 작은 항목 수에 비례
+    assert len(index._SpatialIndex__cell_ids) <= 200 * MAX_ITEM_CELLS
+    assert len(index._SpatialIndex__large) == 1
+    assert index.query_point(4000, 4000).tolist() == [200]
+    for x, y in xy[:20]:
+        assert sorted(index.query_point(x + 1, y + 1).tolist()) == brute_point(bounds, x + 1, y + 1).tolist()
+    for x_min, y_min, x_max, y_max in random_bounds(rng, 100, extent=9000, max_size=3000) - 500:
+        for contained in (False, True):
+            got = sorted(index.query_rect(x_min, y_min, x_max, y_max, contained).tolist())
+            assert got == brute_rect(bounds, x_min, y_min, x_max, y_max, contained).tolist()
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_mixed_sizes_match_brute_force(seed):
+    rng = np.random.default_rng(100 + seed)
+    bounds = np.concatenate([random_bounds(rng, 150, max_size=10), random_bounds(rng, 20, max_size=900)])
+    index = SpatialIndex(bounds)
+    for x, y in rng.integers(-100, 2000, size=(200, 2)):
+        assert sorted(index.query_point(x, y).tolist()) == brute_point(bounds, x, y).tolist()
+    queries = random_bounds(rng, 100, extent=1500, max_size=300)
+    expected = sorted(
+        (int(i), j) for j, q in enumerate(queries) for i in brute_rect(bounds, *q, contained=False)
+    )
+    assert sorted(index.query_overlaps(queries)) == expected
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from sample.data_manager.text_boxes import TextBoxes
+
+
+def box(x, y, w, h):
+    return [[x, y], [x + w, y], [x + w, y + h], [x, y + h]]
+
+
+OCR_TEXTS = [
+    (box(0, 0, 50, 10), 'hello', 0.9),
+    (box(60, 0, 30, 10), '', 0.2),
+    (box(10, 40, 80, 20), '안녕하세요', 0.75),
+    ([[100.4, 100.6], [140.6, 100], [140, 130], [100, 130]], 'skew', 0.5),
+]
+
+
+@pytest.fixture
+def boxes():
+    return TextBoxes.from_ocr(OCR_TEXTS)
+
+
+def test_from_ocr(boxes):
+    assert len(boxes) == 4
+    assert boxes.get_texts() == ['hello', '', '안녕하세요', 'skew']
+    assert boxes.get_text(2) == '안녕하세요'
+    assert boxes.get_text(-1) == 'skew'
+    assert boxes.get_position(0) == box(0, 0, 50, 10)
+    assert boxes.get_position(3)[0] == [100, 101]     # 반올림
+    assert boxes.get_confidences().dtype == np.float32
+    with pytest.raises(IndexError):
+        boxes.get_text(4)
+    with pytest.raises(IndexError):
+        boxes.get_view(-5)
+
+
+def test_empty():
+    boxes = TextBoxes.from_ocr([])
+    assert len(boxes) == 0
+    assert boxes.get_texts() == []
+    assert boxes.get_bounds().shape == (0, 4)
+    assert boxes.indices_above(0.0).tolist() == []
+    assert boxes.get_spatial_index().query_point(0, 0).tolist() == []
+
+
+def test_missing_confidence_defaults_to_one():
+    boxes = TextBoxes.from_ocr([(box(0, 0, 1, 1), 'a')])
+    assert boxes.get_confidences().tolist() == [1.0]
+
+
+def test_bounds_and_queries(boxes):
+    assert boxes.get_bounds().tolist() == [
+        [0, 0, 50, 10], [60, 0, 90, 10], [10, 40, 90, 60], [100, 100, 141, 130],
+    ]
+    assert boxes.indices_above(0.5).tolist() == [0, 2, 3]
+    assert boxes.indices_in_rect(0, 0, 95, 15).tolist() == [0, 1]
+    assert boxes.indices_in_rect(0, 0, 95, 45, contained=False).tolist() == [0, 1, 2]
+    index = boxes.get_spatial_index()
+    assert index.query_point(20, 50).tolist() == [2]
+    assert sorted(index.query_rect(0, 0, 95, 15, contained=True).tolist()) == [0, 1]
+
+
+def test_spatial_index_matches_indices_in_rect():
+    rng = np.random.default_rng(7)
+    xy = rng.integers(0, 2000, size=(500, 2))
+    wh = rng.integers(1, 200, size=(500, 2))
+    boxes = TextBoxes(
+        [box(x, y, w, h) for (x, y), (w, h) in zip(xy, wh)],
+        rng.random(500),
+        [f't{i}' for i in range(500)],
+    )
+    index = boxes.get_spatial_index()
+    for x_min, y_min in rng.integers(-100, 2000, size=(100, 2)):
+        x_max, y_max = x_min + 300, y_min + 150
+        for contained in (False, True):
+            assert sorted(index.query_rect(x_min, y_min, x_max, y_max, contained).tolist()) == \
+                boxes.indices_in_rect(x_min, y_min, x_max, y_max, contained).tolist()
+
+
+def test_set_tr_text_invalidates_bounds_and_index(boxes):
+    index = boxes.get_spatial_index()
+    assert boxes.get_spatial_index() is index
+    assert boxes.get_spatial_index().query_point(300, 300).tolist() == []
+
+    boxes.set_tr_text_with_position(0, 'translated', box(290, 290, 20, 20))
+
+    assert boxes.get_tr_text(0) == 'translated'
+    assert boxes.get_tr_text(1) is None
+    assert boxes.get_bounds()[0].tolist() == [290, 290, 310, 310]
+    assert boxes.get_spatial_index() is not index
+    assert boxes.get_spatial_index().query_point(300, 300).tolist() == [0]
+    assert boxes.get_spatial_index().query_point(5, 5).tolist() == []
+
+
+def test_views(boxes):
+    views = boxes.get_views()
+    assert [v.get_text() for v in views] == boxes.get_texts()
+    view = boxes.get_view(-2)
+    assert view.get_index() == 2
+    assert view.get_confidence() == pytest.approx(0.75)
+    assert view.get_position_info() == box(10, 40, 80, 20)
+
+    view.set_tr_text_with_position('hi', box(0, 0, 5, 5))
+    assert boxes.get_tr_text(2) == 'hi'
+    assert view.get_tr_text() == 'hi'
+    assert boxes.get_position(2) == box(0, 0, 5, 5)